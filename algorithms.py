@@ -1,353 +1,1166 @@
-def fcfs(processes):
-    """First Come First Serve scheduling algorithm"""
-    # Make a copy to avoid modifying the original list
-    processes_copy = sorted(processes, key=lambda p: p["arrival"])
+import heapq
+from collections import deque, namedtuple
+from operator import itemgetter
 
-    # Simulate FCFS scheduling
-    time = 0
-    results = []
-    for process in processes_copy:
-        if time < process["arrival"]:
-            time = process["arrival"]
-        start_time = time
-        end_time = start_time + process["burst"]
-        time = end_time
-        results.append({"id": process["id"], "start": start_time, "end": end_time, "algorithm": "fcfs"})
+# Scheduler cores work on process tuples: (index, arrival, burst, priority).
+# Streams may append extra fields (such as the process ID) after these.
+# A process that does I/O gets one tuple per CPU burst, whose arrival is
+# when it becomes ready for that burst.
+_FIELDS = {"arrival": 1, "burst": 2, "priority": 3}
 
-    return results
+# Segments between two calls of a progress callback
+PROGRESS_INTERVAL = 4096
 
-def sjf_non_preemptive(processes):
-    """Shortest Job First (Non-Preemptive) scheduling algorithm"""
-    # Make a copy to avoid modifying the original list
-    processes_copy = [p.copy() for p in processes]
-    
-    time = 0
-    results = []
-    remaining_processes = len(processes_copy)
-    
-    while remaining_processes > 0:
-        # Find available processes at current time
-        available_processes = [p for p in processes_copy if p["arrival"] <= time and p["burst"] > 0]
-        
-        if not available_processes:
-            # If no process is available, jump to the next arrival time
-            next_process = min([p for p in processes_copy if p["burst"] > 0], key=lambda p: p["arrival"])
-            time = next_process["arrival"]
-            continue
-        
-        # Select process with shortest burst time
-        selected_process = min(available_processes, key=lambda p: p["burst"])
-        
-        # Execute the selected process
-        start_time = time
-        end_time = time + selected_process["burst"]
-        time = end_time
-        
-        # Record the result
-        results.append({
-            "id": selected_process["id"], 
-            "start": start_time, 
-            "end": end_time, 
-            "algorithm": "sjf_non_preemptive"
-        })
-        
-        # Mark the process as completed
-        for p in processes_copy:
-            if p["id"] == selected_process["id"]:
-                p["burst"] = 0
-                remaining_processes -= 1
-                break
-    
+# Minimum number of scheduler events between two checkpoints; the gap also
+# grows with the ready queue so copying it stays amortized O(1) per event
+CHECKPOINT_INTERVAL = 1024
+
+# Scheduler state at an event boundary, from which a core can resume:
+# ``time``, the number of arrivals ``consumed`` from the arrival-sorted
+# stream, the number of segments ``emitted`` so far, the ``ready``
+# processes as (process, remaining) pairs in queue order, and the segment
+# still ``running`` (not yet emitted) as (process, start, end) or None; the
+# preemptive core adds the work the process had left at its start
+Checkpoint = namedtuple("Checkpoint", "time consumed emitted ready running")
+
+# Kinds of schedule segments: a process running, time the CPU spends on
+# scheduling overhead before it runs (see Overhead), or a process blocked on
+# I/O, first queued behind other requests for its device and then being
+# served (see DeviceQueues). Codes index SEGMENT_KINDS.
+RUN, CONTEXT_SWITCH, DISPATCH, CACHE_WARMUP, IO_WAIT, IO = range(6)
+SEGMENT_KINDS = ("run", "context_switch", "dispatch", "cache_warmup", "io_wait", "io")
+OVERHEAD_KINDS = (CONTEXT_SWITCH, DISPATCH, CACHE_WARMUP)
+IO_KINDS = (IO_WAIT, IO)
+
+# Scheduling overhead charged on a CPU before a process starts running:
+# ``context_switch`` when the CPU switches straight from another process,
+# ``dispatch`` latency on every dispatch, and ``cache_warmup`` when a
+# process resumes after it was preempted
+Overhead = namedtuple("Overhead", "context_switch cache_warmup dispatch", defaults=(0, 0, 0))
+
+# Multilevel feedback queue defaults: number of levels, and the priority
+# boost period in multiples of the bottom level's allotment
+MLFQ_LEVELS = 3
+MLFQ_BOOST_QUANTA = 8
+
+
+def _process_columns(processes):
+    """
+    Return the arrival, burst and priority columns of a workload as lists
+
+    Accepts either a list of process dictionaries or a columnar
+    ProcessTable.
+    """
+    if hasattr(processes, "columns"):
+        return processes.columns()
+    arrival = [p["arrival"] for p in processes]
+    burst = [p["burst"] for p in processes]
+    priority = [p.get("priority", 0) for p in processes]
+    return arrival, burst, priority
+
+def check_bursts(bursts, burst=None):
+    """
+    Validate a process's sequence of alternating CPU and I/O bursts
+
+    The sequence starts and ends with a CPU burst. When it holds any I/O,
+    CPU bursts must be positive and I/O bursts must not be negative.
+
+    Args:
+        bursts (list): CPU burst, I/O burst, CPU burst, ...
+        burst (optional): The process's burst time, which must equal the
+            total of its CPU bursts
+
+    Returns:
+        The total CPU time of the sequence
+    """
+    if len(bursts) % 2 == 0:
+        raise ValueError("Burst sequences must start and end with a CPU burst")
+    total = sum(bursts[::2])
+    if len(bursts) > 1 and (min(bursts[::2]) <= 0 or min(bursts[1::2]) < 0):
+        raise ValueError("CPU bursts must be positive and I/O bursts must not be negative")
+    if burst is not None and abs(total - burst) > 1e-9 * max(abs(burst), 1):
+        raise ValueError(f"CPU bursts add up to {total}, not to the burst time {burst}")
+    return total
+
+def _io_columns(processes):
+    """
+    Return the burst sequences of a workload as (bursts, offsets, devices)
+    lists, or None when no process does any I/O
+
+    Process ``i``'s CPU and I/O bursts are ``bursts[offsets[i]:offsets[i + 1]]``,
+    an empty range for a process that only computes, and ``devices[i]`` is
+    the device serving its I/O.
+    """
+    if hasattr(processes, "columns"):
+        return processes.io_columns()
+    bursts, offsets, devices = [], [0], []
+    for p in processes:
+        sequence = p.get("bursts")
+        if sequence is not None and len(sequence) > 1:
+            check_bursts(sequence, p["burst"])
+            bursts.extend(sequence)
+        offsets.append(len(bursts))
+        devices.append(p.get("device", 0))
+    return (bursts, offsets, devices) if bursts else None
+
+class _WorkloadArrivals:
+    """
+    The process tuples of a whole workload in arrival order, after the first ``skip``
+
+    ``io`` holds the DeviceQueues of a workload whose processes do I/O and
+    is None otherwise. Such a process arrives with its first CPU burst and
+    hands the rest of its sequence to the device queues.
+
+    ``telemetry``, a telemetry.Telemetry set by start_simulation, is told
+    about every arrival and finished CPU burst; None records nothing.
+    """
+
+    def __init__(self, processes, skip=0):
+        self.processes = processes
+        self.skip = skip
+        self._io_columns = _io_columns(processes)
+        self.io = DeviceQueues() if self._io_columns is not None else None
+        self.telemetry = None
+
+    def __iter__(self):
+        arrival, burst, priority = _process_columns(self.processes)
+        if hasattr(self.processes, "arrival_order"):
+            order = self.processes.arrival_order()
+        else:
+            order = sorted(range(len(arrival)), key=arrival.__getitem__)
+        if self.io is None:
+            for index in order[self.skip:]:
+                yield index, arrival[index], burst[index], priority[index]
+            return
+
+        bursts, offsets, devices = self._io_columns
+        for index in order[self.skip:]:
+            first, last = offsets[index], offsets[index + 1]
+            if first == last:
+                yield index, arrival[index], burst[index], priority[index]
+            else:
+                self.io.add(index, bursts[first:last], devices[index])
+                yield index, arrival[index], bursts[first], priority[index]
+
+def _workload_arrivals(processes, skip=0):
+    """Process tuples of a whole workload in arrival order, after the first ``skip``; see _WorkloadArrivals"""
+    return _WorkloadArrivals(processes, skip)
+
+def _with_progress(segments, progress, total_work):
+    """
+    Pass segments through while reporting progress every PROGRESS_INTERVAL segments
+
+    ``progress(events, fraction)`` receives the number of segments produced
+    so far and the fraction of the total burst time executed. Anything it
+    raises, such as a cancellation, propagates out of the simulation.
+    """
+    events = 0
+    done = 0
+    for segment in segments:
+        events += 1
+        # Overhead segments (see Overhead) do no work of the processes
+        if len(segment) < 5 or segment[4] == RUN:
+            done += segment[2] - segment[1]
+        if events % PROGRESS_INTERVAL == 0:
+            progress(events, done / total_work if total_work else 1.0)
+        yield segment
+    progress(events, 1.0)
+
+def _with_telemetry(segments, telemetry, processes, arrivals, cpus=1):
+    """
+    Start ``telemetry`` on a workload and have its run recorded
+
+    The arrival cursor reports arrivals and finished bursts to the
+    telemetry set on ``arrivals``; the returned generator passes the
+    segments through while it records the CPU time.
+    """
+    arrival, burst, _ = _process_columns(processes)
+    first = min(arrival, default=0)
+    # Expected span: the arrivals plus the work spread over the CPUs; I/O or idle time grows the arrays
+    telemetry.start(first, max(arrival, default=0) - first + -(-sum(burst) // cpus), cpus)
+    arrivals.telemetry = telemetry
+    return telemetry.watch(segments)
+
+def _io_rows(io):
+    """Pid indices, starts, ends and kinds of the I/O segments recorded by DeviceQueues ``io``"""
+    rows = tuple(zip(*io.segments()))
+    return rows if rows else ((), (), (), ())
+
+def _build_results(processes, segments, algorithm, progress=None, io=None):
+    """
+    Collect ``(process, start, end)`` segments into the result format
+    matching the workload: a ScheduleResult for a ProcessTable, otherwise
+    the usual list of result dictionaries
+
+    With the DeviceQueues ``io`` of a workload that does I/O, the I/O
+    segments are merged in by start time and every segment has a kind.
+    """
+    if progress is not None:
+        segments = _with_progress(segments, progress, sum(_process_columns(processes)[1]))
+    if hasattr(processes, "columns"):
+        from columnar import ScheduleResult
+        indices, starts, ends = [], [], []
+        for process, start, end in segments:
+            indices.append(process[0])
+            starts.append(start)
+            ends.append(end)
+        if io is None:
+            return ScheduleResult(indices, starts, ends, algorithm, ids=processes.ids)
+
+        import numpy as np
+        io_indices, io_starts, io_ends, io_kinds = _io_rows(io)
+        kinds = [RUN] * len(indices) + list(io_kinds)
+        starts = np.asarray(starts + list(io_starts))
+        order = np.argsort(starts, kind="stable")
+        return ScheduleResult(np.asarray(indices + list(io_indices), dtype=np.int32)[order], starts[order],
+                              np.asarray(ends + list(io_ends))[order], algorithm, ids=processes.ids,
+                              kind=np.asarray(kinds, dtype=np.int8)[order])
+
+    results = [
+        {"id": processes[process[0]]["id"], "start": start, "end": end, "algorithm": algorithm}
+        for process, start, end in segments
+    ]
+    if io is not None:
+        for result in results:
+            result["kind"] = SEGMENT_KINDS[RUN]
+        results.extend(
+            {"id": processes[index]["id"], "start": start, "end": end, "algorithm": algorithm,
+             "kind": SEGMENT_KINDS[kind]}
+            for index, start, end, kind in io.segments()
+        )
+        results.sort(key=itemgetter("start"))
     return results
 
-def sjf_preemptive(processes):
-    """Shortest Job First (Preemptive) scheduling algorithm (Shortest Remaining Time First)"""
-    # Make a copy to avoid modifying the original list
-    processes_copy = [p.copy() for p in processes]
-    
-    # Sort by arrival time for initial processing
-    processes_copy.sort(key=lambda p: p["arrival"])
-    
+class DeviceQueues:
+    """
+    First-come first-served I/O devices shared by the processes of a simulation
+
+    A process that finishes a CPU burst with I/O left releases the CPU and
+    queues on its device. Requests reach the devices in time order, so a
+    request starts once its device has served everything queued before it
+    and its completion is known right away, in O(1). The process then comes
+    back through the arrival stream (see _ArrivalCursor) as a process tuple
+    for its next CPU burst, arriving when the I/O completes.
+    """
+
+    def __init__(self):
+        self.free = {}      # Device -> time it is done with every request so far
+        self.requests = []  # (pid index, device, requested, started, completed) of every I/O burst
+        self._pending = {}  # Pid index -> [bursts, position of its next I/O burst, device]
+
+    def add(self, index, bursts, device=0):
+        """Take the CPU and I/O burst sequence of an arriving process"""
+        self._pending[index] = [bursts, 1, device]
+
+    def request(self, process, time):
+        """
+        Queue the next I/O burst of ``process``, which finished a CPU burst at ``time``
+
+        Returns:
+            The process tuple of its next CPU burst, arriving when the I/O
+            completes, or None when the process has no I/O left
+        """
+        job = self._pending.get(process[0])
+        if job is None:
+            return None
+        bursts, position, device = job
+        if position == len(bursts):
+            del self._pending[process[0]]
+            return None
+        started = max(time, self.free.get(device, time))
+        completed = started + bursts[position]
+        self.free[device] = completed
+        self.requests.append((process[0], device, time, started, completed))
+        job[1] = position + 2
+        return (process[0], completed, bursts[position + 1], process[3]) + process[4:]
+
+    def segments(self):
+        """Yield ``(pid index, start, end, kind)`` of the time every request waited for and spent on its device"""
+        for index, _, requested, started, completed in self.requests:
+            if started > requested:
+                yield index, requested, started, IO_WAIT
+            if completed > started:
+                yield index, started, completed, IO
+
+class _ArrivalCursor:
+    """
+    Lookahead over an arrival-sorted stream of process tuples
+
+    When the stream comes with DeviceQueues (``io``), the cores report
+    every finished CPU burst through ``completed`` and the processes coming
+    back from I/O are merged into the arrivals by time. A stream with a
+    ``telemetry`` recorder has the arrivals and finished bursts reported to it.
+    """
+
+    def __init__(self, stream, consumed=0):
+        self.io = getattr(stream, "io", None)
+        self.telemetry = getattr(stream, "telemetry", None)
+        self._stream = iter(stream)
+        self._returns = []  # Heap of (arrival, sequence, process) of processes coming back from I/O
+        self._head_time = float('-inf')
+        self.consumed = consumed  # Processes popped from the stream so far, counting those before a resume
+        self._advance()
+
+    def _advance(self):
+        self._head = next(self._stream, None)
+        if self._head is None:
+            self._head_time = float('inf')
+        elif self._head[1] < self._head_time:
+            raise ValueError("Processes must be ordered by arrival time")
+        else:
+            self._head_time = self._head[1]
+        self._select()
+
+    def _select(self):
+        # A process back from I/O only goes before the stream when it arrives strictly earlier
+        if self._returns and self._returns[0][0] < self._head_time:
+            self.time, _, self.pending = self._returns[0]
+        else:
+            self.pending, self.time = self._head, self._head_time
+
+    def pop(self):
+        """Return the next arriving process and move past it"""
+        process = self.pending
+        returning = process is not self._head
+        if returning:
+            heapq.heappop(self._returns)
+            self._select()
+        else:
+            self.consumed += 1
+            self._advance()
+        if self.telemetry is not None:
+            self.telemetry.arrived(process, returning)
+        return process
+
+    def completed(self, process, time):
+        """
+        Report that ``process`` finished its CPU burst at ``time``
+
+        Returns:
+            bool: True when the process goes on to do I/O and will arrive again
+        """
+        returning = None if self.io is None else self.io.request(process, time)
+        if self.telemetry is not None:
+            self.telemetry.left(process, time, returning is not None)
+        if returning is None:
+            return False
+        heapq.heappush(self._returns, (returning[1], len(self.io.requests), returning))
+        self._select()
+        return True
+
+class _Checkpointer:
+    """Decides when a core records a Checkpoint; see CHECKPOINT_INTERVAL"""
+
+    def __init__(self, checkpoints):
+        self.checkpoints = checkpoints
+        self._events = 0
+        self._next = 0
+
+    def due(self, queued):
+        """Count one event; True when a checkpoint should be taken with ``queued`` ready processes"""
+        self._events += 1
+        if self._events < self._next:
+            return False
+        self._next = self._events + max(CHECKPOINT_INTERVAL, queued)
+        return True
+
+def _preemptive_segments(arrivals, key, state=None, checkpoints=None):
+    """Discrete-event core shared by the preemptive schedulers.
+
+    Arrivals are consumed from an arrival-sorted stream and ready processes
+    wait in a min-heap ordered by ``key(process, remaining)``. The CPU is
+    only re-evaluated at arrivals and completions, so a run costs
+    O(n log n). Each ``(process, start, end)`` segment is yielded as soon
+    as it is final.
+
+    Like every core, it can resume from a Checkpoint ``state`` (the stream
+    then starts after the consumed arrivals) and append Checkpoints to the
+    list ``checkpoints`` as it runs.
+    """
+    arrivals = _ArrivalCursor(arrivals, state.consumed if state else 0)
+
     time = 0
-    results = []
-    remaining_processes = len(processes_copy)
+    ready = []
     current_process = None
     current_start = 0
-    
-    # Create a timeline of events (arrivals and completions)
-    events = []
-    for p in processes_copy:
-        events.append((p["arrival"], "arrival", p["id"]))
-    
-    while remaining_processes > 0:
-        # Find available processes at current time
-        available_processes = [p for p in processes_copy if p["arrival"] <= time and p["burst"] > 0]
-        
-        if not available_processes:
+    current_end = 0
+    current_left = 0  # Work the current process had left at current_start
+    emitted = 0
+    if state is not None:
+        time, emitted = state.time, state.emitted
+        ready = [(key(process, remaining), remaining, process) for process, remaining in state.ready]
+        heapq.heapify(ready)
+        if state.running is not None:
+            current_process, current_start, current_end, current_left = state.running
+    checkpointer = _Checkpointer(checkpoints) if checkpoints is not None else None
+
+    while arrivals.pending is not None or ready:
+        if checkpointer is not None and checkpointer.due(len(ready)):
+            running = None if current_process is None else (current_process, current_start, current_end, current_left)
+            checkpoints.append(Checkpoint(time, arrivals.consumed, emitted,
+                                          [(process, remaining) for _, remaining, process in ready], running))
+
+        # Move every process that has arrived by now into the ready heap
+        while arrivals.time <= time:
+            process = arrivals.pop()
+            if process[2] > 0:
+                heapq.heappush(ready, (key(process, process[2]), process[2], process))
+            else:
+                arrivals.completed(process, process[1])  # Nothing to run
+
+        if not ready:
+            if arrivals.pending is None:
+                break  # Only processes with nothing left to run remained
             # If no process is available, jump to the next arrival time
-            next_process = min([p for p in processes_copy if p["burst"] > 0], key=lambda p: p["arrival"])
-            time = next_process["arrival"]
+            time = arrivals.time
             continue
-        
-        # Select process with shortest remaining burst time
-        selected_process = min(available_processes, key=lambda p: p["burst"])
-        
+
+        # The top of the heap is the process that should hold the CPU
+        _, remaining, process = heapq.heappop(ready)
+
         # Check if there's a context switch
-        if current_process != selected_process["id"]:
-            # If there was a process running, record its execution
+        if current_process is not process:
+            # If there was a process running, its segment is now final
             if current_process is not None:
-                # Find the process that was running
-                for p in processes_copy:
-                    if p["id"] == current_process:
-                        results.append({
-                            "id": current_process,
-                            "start": current_start,
-                            "end": time,
-                            "algorithm": "sjf_preemptive"
-                        })
-                        break
-            
+                emitted += 1
+                yield current_process, current_start, current_end
+
             # Start the new process
-            current_process = selected_process["id"]
+            current_process = process
             current_start = time
-        
-        # Find next event time
-        next_arrival = float('inf')
-        for p in processes_copy:
-            if p["arrival"] > time and p["burst"] > 0:
-                next_arrival = min(next_arrival, p["arrival"])
-        
-        completion_time = time + selected_process["burst"]
-        next_event_time = min(next_arrival, completion_time)
-        
-        # Update the burst time of the selected process
-        time_slice = next_event_time - time
-        for p in processes_copy:
-            if p["id"] == selected_process["id"]:
-                p["burst"] -= time_slice
-                if p["burst"] <= 0:
-                    remaining_processes -= 1
-                break
-        
-        time = next_event_time
-    
+            current_left = remaining
+
+        # Run until the next arrival or until the process completes. The work left is measured
+        # from the start of the segment, as smp does, and a completion is exact, so float bursts
+        # leave no sliver behind
+        finish = current_start + current_left
+        next_event_time = min(arrivals.time, finish)
+        remaining = 0 if next_event_time >= finish else current_left - (next_event_time - current_start)
+        time = current_end = next_event_time
+
+        # Put the process back if it still has work left
+        if remaining > 0:
+            heapq.heappush(ready, (key(process, remaining), remaining, process))
+        else:
+            arrivals.completed(process, time)
+
     # Record the last process if it was running
     if current_process is not None:
-        results.append({
-            "id": current_process,
-            "start": current_start,
-            "end": time,
-            "algorithm": "sjf_preemptive"
-        })
-    
-    return results
+        yield current_process, current_start, current_end
 
-def priority_non_preemptive(processes):
-    """Priority (Non-Preemptive) scheduling algorithm"""
-    # Make a copy to avoid modifying the original list
-    processes_copy = [p.copy() for p in processes]
-    
-    time = 0
-    results = []
-    remaining_processes = len(processes_copy)
-    
-    while remaining_processes > 0:
-        # Find available processes at current time
-        available_processes = [p for p in processes_copy if p["arrival"] <= time and p["burst"] > 0]
-        
-        if not available_processes:
+class ReadyQueue:
+    """
+    Min-heap of ready processes for key-based scheduling policies
+
+    Processes are ordered by ``key(process)``, with ties broken by arrival
+    time and then by input order (the process ID order for GUI workloads).
+    Only processes currently in the queue are held in memory.
+
+    Args:
+        key (callable): Maps a process tuple to a sortable value
+    """
+
+    def __init__(self, key, processes=()):
+        self.key = key
+        self._heap = [(key(process), process[1], process[0], process) for process in processes]
+        heapq.heapify(self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def processes(self):
+        """The queued process tuples, in no particular order"""
+        return [entry[-1] for entry in self._heap]
+
+    def push(self, process):
+        """Add a process tuple to the queue"""
+        heapq.heappush(self._heap, (self.key(process), process[1], process[0], process))
+
+    def pop(self):
+        """Remove and return the process that should run next"""
+        return heapq.heappop(self._heap)[-1]
+
+def _non_preemptive_segments(arrivals, key, state=None, checkpoints=None):
+    """Run the ready process with the smallest key to completion, one at a time"""
+    arrivals = _ArrivalCursor(arrivals, state.consumed if state else 0)
+    ready = ReadyQueue(key, [process for process, _ in state.ready] if state else ())
+    time, emitted = (state.time, state.emitted) if state else (0, 0)
+    checkpointer = _Checkpointer(checkpoints) if checkpoints is not None else None
+
+    while arrivals.pending is not None or ready:
+        if checkpointer is not None and checkpointer.due(len(ready)):
+            checkpoints.append(Checkpoint(time, arrivals.consumed, emitted,
+                                          [(process, process[2]) for process in ready.processes()], None))
+
+        # Move every process that has arrived by now into the ready queue
+        while arrivals.time <= time:
+            ready.push(arrivals.pop())
+
+        if not ready:
             # If no process is available, jump to the next arrival time
-            next_process = min([p for p in processes_copy if p["burst"] > 0], key=lambda p: p["arrival"])
-            time = next_process["arrival"]
+            time = arrivals.time
             continue
-        
-        # Select process with highest priority (lower number = higher priority)
-        selected_process = min(available_processes, key=lambda p: p["priority"])
-        
-        # Execute the selected process
+
+        # Execute the selected process to completion
+        process = ready.pop()
         start_time = time
-        end_time = time + selected_process["burst"]
-        time = end_time
-        
-        # Record the result
-        results.append({
-            "id": selected_process["id"], 
-            "start": start_time, 
-            "end": end_time, 
-            "algorithm": "priority_non_preemptive"
-        })
-        
-        # Mark the process as completed
-        for p in processes_copy:
-            if p["id"] == selected_process["id"]:
-                p["burst"] = 0
-                remaining_processes -= 1
-                break
-    
-    return results
+        time += process[2]
+        arrivals.completed(process, time)
+        emitted += 1
+        yield process, start_time, time
 
-def priority_preemptive(processes):
-    """Priority (Preemptive) scheduling algorithm"""
-    # Make a copy to avoid modifying the original list
-    processes_copy = [p.copy() for p in processes]
-    
-    time = 0
-    results = []
-    remaining_processes = len(processes_copy)
-    current_process = None
-    current_start = 0
-    
-    while remaining_processes > 0:
-        # Find available processes at current time
-        available_processes = [p for p in processes_copy if p["arrival"] <= time and p["burst"] > 0]
-        
-        if not available_processes:
-            # If no process is available, jump to the next arrival time
-            next_process = min([p for p in processes_copy if p["burst"] > 0], key=lambda p: p["arrival"])
-            time = next_process["arrival"]
-            continue
-        
-        # Select process with highest priority (lower number = higher priority)
-        selected_process = min(available_processes, key=lambda p: p["priority"])
-        
-        # Check if there's a context switch
-        if current_process != selected_process["id"]:
-            # If there was a process running, record its execution
-            if current_process is not None:
-                # Find the process that was running
-                for p in processes_copy:
-                    if p["id"] == current_process:
-                        results.append({
-                            "id": current_process,
-                            "start": current_start,
-                            "end": time,
-                            "algorithm": "priority_preemptive"
-                        })
-                        break
-            
-            # Start the new process
-            current_process = selected_process["id"]
-            current_start = time
-        
-        # Find next event time
-        next_arrival = float('inf')
-        for p in processes_copy:
-            if p["arrival"] > time and p["burst"] > 0:
-                next_arrival = min(next_arrival, p["arrival"])
-        
-        completion_time = time + selected_process["burst"]
-        next_event_time = min(next_arrival, completion_time)
-        
-        # Update the burst time of the selected process
-        time_slice = next_event_time - time
-        for p in processes_copy:
-            if p["id"] == selected_process["id"]:
-                p["burst"] -= time_slice
-                if p["burst"] <= 0:
-                    remaining_processes -= 1
-                break
-        
-        time = next_event_time
-    
-    # Record the last process if it was running
-    if current_process is not None:
-        results.append({
-            "id": current_process,
-            "start": current_start,
-            "end": time,
-            "algorithm": "priority_preemptive"
-        })
-    
-    return results
+def schedule_by_key(processes, key, algorithm, progress=None):
+    """
+    Non-preemptive scheduling that always runs the ready process with the
+    smallest key to completion
+
+    New key-based policies only need to supply ``key``: a field name
+    ("arrival", "burst" or "priority") or a function mapping a process
+    dictionary to a sortable value. For a ProcessTable, a key function is
+    called on the rows from ``to_dicts()``. Runs in O(n log n).
+    ``progress`` is an optional callback, see start_simulation.
+    """
+    if isinstance(key, str):
+        key = itemgetter(_FIELDS[key])
+    else:
+        rows = processes.to_dicts() if hasattr(processes, "columns") else processes
+        keys = [key(p) for p in rows]
+        key = lambda process: keys[process[0]]
+    arrivals = _workload_arrivals(processes)
+    return _build_results(processes, _non_preemptive_segments(arrivals, key), algorithm, progress, arrivals.io)
+
+def _fcfs_segments(arrivals, state=None, checkpoints=None):
+    """Run processes to completion in arrival order"""
+    arrivals = _ArrivalCursor(arrivals, state.consumed if state else 0)
+    time, emitted = (state.time, state.emitted) if state else (0, 0)
+    checkpointer = _Checkpointer(checkpoints) if checkpoints is not None else None
+    while arrivals.pending is not None:
+        if checkpointer is not None and checkpointer.due(0):
+            checkpoints.append(Checkpoint(time, arrivals.consumed, emitted, [], None))
+        process = arrivals.pop()
+        if time < process[1]:
+            time = process[1]
+        start_time = time
+        time += process[2]
+        arrivals.completed(process, time)
+        emitted += 1
+        yield process, start_time, time
+
+def _round_robin_segments(arrivals, time_quantum, merge_slices, state=None, checkpoints=None):
+    """Round Robin core; see round_robin for the meaning of ``merge_slices``"""
+    arrivals = _ArrivalCursor(arrivals, state.consumed if state else 0)
 
-def round_robin(processes, time_quantum):
-    """Round Robin scheduling algorithm"""
-    if not time_quantum or time_quantum <= 0:
-        raise ValueError("Time quantum must be a positive integer")
-        
-    # Make a copy to avoid modifying the original list
-    processes_copy = [p.copy() for p in processes]
-    
     time = 0
-    results = []
-    ready_queue = []
-    remaining_processes = len(processes_copy)
-    
-    # Sort processes by arrival time initially
-    processes_copy.sort(key=lambda p: p["arrival"])
-    
-    while remaining_processes > 0:
+    ready_queue = deque()  # [process, remaining burst] pairs
+    merged = None  # Segment held back while it may still be extended
+    emitted = 0
+    if state is not None:
+        time, emitted = state.time, state.emitted
+        ready_queue.extend([process, remaining] for process, remaining in state.ready)
+        merged = None if state.running is None else list(state.running)
+    checkpointer = _Checkpointer(checkpoints) if checkpoints is not None else None
+
+    def admit_arrivals(time):
+        # Each process leaves the arrival stream exactly once, so no membership test is needed
+        while arrivals.time <= time:
+            process = arrivals.pop()
+            if process[2] > 0:
+                ready_queue.append([process, process[2]])
+            else:
+                arrivals.completed(process, process[1])  # Nothing to run
+
+    while arrivals.pending is not None or ready_queue:
+        if checkpointer is not None and checkpointer.due(len(ready_queue)):
+            checkpoints.append(Checkpoint(time, arrivals.consumed, emitted,
+                                          [tuple(entry) for entry in ready_queue],
+                                          None if merged is None else tuple(merged)))
+
         # Add newly arrived processes to the ready queue
-        for p in processes_copy:
-            if p["arrival"] <= time and p["burst"] > 0 and p["id"] not in [proc["id"] for proc in ready_queue]:
-                ready_queue.append(p)
-        
+        admit_arrivals(time)
+
         if not ready_queue:
-            # If the ready queue is empty, find the next process to arrive
-            upcoming = [p for p in processes_copy if p["burst"] > 0]
-            if upcoming:
-                next_arrival = min(upcoming, key=lambda p: p["arrival"])
-                time = next_arrival["arrival"]
-                continue
-            else:
+            if arrivals.pending is None:
                 break  # No more processes to execute
-        
+            # If the ready queue is empty, jump to the next arrival time
+            time = arrivals.time
+            continue
+
         # Get the next process from the ready queue
-        current_process = ready_queue.pop(0)
-        
+        entry = ready_queue.popleft()
+        process, remaining = entry
+
         # Calculate execution time for this quantum
-        execution_time = min(time_quantum, current_process["burst"])
-        
-        # Record the execution
+        execution_time = min(time_quantum, remaining)
+        if merge_slices and not ready_queue:
+            # Alone on the CPU: keep slicing until it finishes or until a
+            # slice ends at or after the next arrival
+            if arrivals.pending is not None:
+                slices = -(-(arrivals.time - time) // time_quantum)
+                execution_time = min(max(slices, 1) * time_quantum, remaining)
+            else:
+                execution_time = remaining
+
+        # Record the execution, extending the previous segment if it is contiguous
         start_time = time
         end_time = time + execution_time
-        
-        results.append({
-            "id": current_process["id"],
-            "start": start_time,
-            "end": end_time,
-            "algorithm": "round_robin"
-        })
-        
+        if not merge_slices:
+            emitted += 1
+            yield process, start_time, end_time
+        elif merged is not None and merged[0] is process and merged[2] == start_time:
+            merged[2] = end_time
+        else:
+            if merged is not None:
+                emitted += 1
+                yield tuple(merged)
+            merged = [process, start_time, end_time]
+
         # Update the process's remaining burst time
-        for p in processes_copy:
-            if p["id"] == current_process["id"]:
-                p["burst"] -= execution_time
-                if p["burst"] <= 0:
-                    remaining_processes -= 1
-                break
-        
+        entry[1] -= execution_time
         time = end_time
-        
-        # Add newly arrived processes to the ready queue
-        for p in processes_copy:
-            if p["arrival"] <= time and p["burst"] > 0 and p["id"] not in [proc["id"] for proc in ready_queue] and p["id"] != current_process["id"]:
-                ready_queue.append(p)
-        
-        # If the current process still has burst time left, add it back to the ready queue
-        for p in processes_copy:
-            if p["id"] == current_process["id"] and p["burst"] > 0:
-                ready_queue.append(p)
-                break
-    
-    return results
+        if entry[1] <= 0:
+            arrivals.completed(process, time)
 
-def start_simulation(processes, algorithm="fcfs", time_quantum=None):
-    """Start the simulation with the selected algorithm and parameters"""
-    # Make a copy of processes to avoid modifying the original list
-    processes_copy = [p.copy() for p in processes]
-    
-    if algorithm == "fcfs":
-        return fcfs(processes_copy)
-    elif algorithm == "sjf_preemptive":
-        return sjf_preemptive(processes_copy)
-    elif algorithm == "sjf_non_preemptive":
-        return sjf_non_preemptive(processes_copy)
-    elif algorithm == "priority_preemptive":
-        return priority_preemptive(processes_copy)
-    elif algorithm == "priority_non_preemptive":
-        return priority_non_preemptive(processes_copy)
-    elif algorithm == "round_robin":
-        return round_robin(processes_copy, time_quantum)
-    else:
+        # Processes that arrived during the slice queue ahead of the preempted one
+        admit_arrivals(time)
+        if entry[1] > 0:
+            ready_queue.append(entry)
+
+    if merged is not None:
+        yield tuple(merged)
+
+def _mlfq_segments(arrivals, quanta, boost_interval, merge_slices):
+    """
+    Multilevel feedback queue core
+
+    Processes enter the top level (0). The ready process on the highest
+    level runs, round robin within a level, for at most the allotment it
+    has left on that level (``quanta[level]`` when it got there). Using up
+    the allotment moves it one level down; the bottom level keeps it. A
+    process preempted by an arrival on a higher level returns to the front
+    of its level with the allotment it has left, so it cannot be gamed by
+    yielding early. Every ``boost_interval`` time units (on the absolute
+    clock) all processes move back to the top level with a fresh
+    allotment, which keeps long jobs from starving; 0 or None disables it.
+    A process that blocks on I/O keeps its level and the allotment it has
+    left, and queues behind its level when it comes back.
+
+    Boosts bump an epoch instead of touching every entry: the lower levels
+    are appended to the top one as a whole and an entry from an older epoch
+    is reset when it is next dispatched.
+    """
+    arrivals = _ArrivalCursor(arrivals)
+    levels = [deque() for _ in quanta]
+    bottom = len(quanta) - 1
+    epoch = 0
+    next_boost = boost_interval if boost_interval else float('inf')
+    blocked = {}  # Pid index -> (level, allotment left, epoch) of processes doing I/O
+
+    time = 0
+    current = None  # Segment held back while it may still be extended
+    boundary = False  # The last step ended a slice, so the next one starts a new segment
+
+    while True:
+        # New processes enter the top level: [process, remaining, level, allotment left, epoch]
+        while arrivals.time <= time:
+            process = arrivals.pop()
+            if process[2] <= 0:
+                arrivals.completed(process, process[1])  # Nothing to run
+                continue
+            level, allotment, since = blocked.pop(process[0], (0, quanta[0], epoch))
+            if since != epoch:
+                level, allotment = 0, quanta[0]  # Boosted while it did I/O
+            levels[level].append([process, process[2], level, allotment, epoch])
+
+        # Priority boost: every waiting process returns to the top level
+        if time >= next_boost:
+            for level in levels[1:]:
+                levels[0].extend(level)
+                level.clear()
+            epoch += 1
+            next_boost = (time // boost_interval + 1) * boost_interval
+            if next_boost <= time:
+                next_boost += boost_interval  # Float rounding landed on the boost just done
+
+        queue = next((level for level in levels if level), None)
+        if queue is None:
+            if arrivals.pending is None:
+                break  # No more processes to execute
+            # Nothing is ready: jump to the next arrival time
+            time = arrivals.time
+            continue
+
+        entry = queue.popleft()
+        if entry[4] != epoch:
+            entry[2:] = [0, quanta[0], epoch]  # Boosted while it waited
+        process, remaining = entry[0], entry[1]
+
+        # Run for the allotment left, or until an arrival or a boost may change the decision
+        run = remaining if merge_slices and not any(levels) else min(remaining, entry[3])
+        end = min(time + run, arrivals.time, next_boost)
+        # End times are compared rather than subtracted, so float timelines cannot leave slivers behind
+        entry[1] = 0 if end >= time + remaining else remaining - (end - time)
+
+        # Charge the allotment, moving down one level per allotment used up
+        expired = False
+        start = time
+        while end >= start + entry[3]:
+            start += entry[3]
+            expired = True
+            entry[2] = min(entry[2] + 1, bottom)
+            entry[3] = quanta[entry[2]]
+            if entry[2] == bottom:
+                # The bottom level only renews its full allotment: skip the whole ones at once
+                start += (end - start) // entry[3] * entry[3]
+        if end > start:
+            entry[3] -= end - start
+            expired = False
+
+        # Record the execution, extending the segment the process is still running
+        if end == time:
+            pass  # Only a float sliver of the allotment or burst was left
+        elif current is not None and current[0] is process and current[2] == time and (merge_slices or not boundary):
+            current[2] = end
+        else:
+            if current is not None:
+                yield tuple(current)
+            current = [process, time, end]
+        boundary = expired
+        time = end
+
+        # Expired processes queue behind their new level, interrupted ones go back in front
+        if entry[1] > 0:
+            if expired:
+                levels[entry[2]].append(entry)
+            else:
+                levels[entry[2]].appendleft(entry)
+        elif arrivals.completed(process, time):
+            blocked[process[0]] = (entry[2], entry[3], epoch)
+
+    if current is not None:
+        yield tuple(current)
+
+# Load weight of each nice value from -20 to 19, as in Linux's
+# sched_prio_to_weight: one nice step is worth about 10% of CPU time
+_NICE_WEIGHTS = (
+    88761, 71755, 56483, 46273, 36291, 29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906, 3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423, 335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45, 36, 29, 23, 18, 15,
+)
+NICE_0_WEIGHT = 1024
+
+def _nice_weight(priority):
+    """Load weight of a process; its priority is read as a nice value and clamped to [-20, 19]"""
+    return _NICE_WEIGHTS[min(max(int(priority), -20), 19) + 20]
+
+def _share(length, weight, total_weight):
+    # Integer timelines stay integral: round the share up to whole time units
+    if isinstance(length, int):
+        return -(-length * weight // total_weight)
+    return length * weight / total_weight
+
+def _cfs_segments(arrivals, latency, min_granularity, wakeup_granularity, merge_slices):
+    """
+    Completely Fair Scheduler core
+
+    Every process accumulates virtual runtime: the time it ran scaled by
+    NICE_0_WEIGHT / its weight (see _nice_weight). The ready process with
+    the least virtual runtime runs next, taken from a min-heap, for its
+    weight's share of the scheduling period ``latency`` among all runnable
+    processes, but for at least ``min_granularity``. A new process starts at
+    the queue's minimum virtual runtime and preempts the running one when it
+    is more than ``wakeup_granularity`` (scaled by its weight) behind it.
+    A process waking up from I/O keeps its virtual runtime, but no less than
+    half a period below the minimum, so sleeping earns a bounded credit.
+    Each event costs O(log n).
+    """
+    arrivals = _ArrivalCursor(arrivals)
+    ready = []  # (vruntime, index, process, remaining, weight)
+    total_weight = 0  # Of the ready and the running processes
+    min_vruntime = 0
+    sleeping = {}  # Pid index -> virtual runtime of processes doing I/O
+
+    time = 0
+    running = None  # [vruntime, index, process, remaining, weight] of the process on the CPU
+    slice_end = 0
+    current = None  # Segment held back while it may still be extended
+    boundary = False  # The last step ended a slice, so the next one starts a new segment
+
+    while True:
+        # The minimum virtual runtime only moves forward; new processes start there
+        if running is not None or ready:
+            least = min(running[0] if running is not None else float('inf'), ready[0][0] if ready else float('inf'))
+            min_vruntime = max(min_vruntime, least)
+
+        preempt = False
+        while arrivals.time <= time:
+            process = arrivals.pop()
+            if process[2] > 0:
+                weight = _nice_weight(process[3])
+                total_weight += weight
+                vruntime = min_vruntime
+                if process[0] in sleeping:
+                    vruntime = max(sleeping.pop(process[0]), min_vruntime - latency / 2)
+                heapq.heappush(ready, (vruntime, process[0], process, process[2], weight))
+                if running is not None and running[0] - vruntime > wakeup_granularity * NICE_0_WEIGHT / weight:
+                    preempt = True
+            else:
+                arrivals.completed(process, process[1])  # Nothing to run
+
+        if running is not None:
+            if running[3] <= 0:
+                total_weight -= running[4]
+                running = None
+            elif preempt or time >= slice_end:
+                boundary = time >= slice_end
+                heapq.heappush(ready, tuple(running))
+                running = None
+
+        if running is None:
+            if not ready:
+                if arrivals.pending is None:
+                    break  # No more processes to execute
+                # Nothing is ready: jump to the next arrival time
+                time = arrivals.time
+                continue
+            running = list(heapq.heappop(ready))
+            slice_end = time + max(min_granularity, _share(latency, running[4], total_weight))
+
+        # Run until the slice ends, the process completes or the next arrival
+        process, finish = running[2], time + running[3]
+        end = min(finish, arrivals.time)
+        start = time
+        if not (merge_slices and not ready):
+            end = min(end, slice_end)
+        elif end > slice_end:
+            # Alone, the process runs on through its slice ends. Charge each slice and renew it as
+            # requeueing the process would, so merging only changes how the segments are recorded
+            length = max(min_granularity, _share(latency, running[4], total_weight))
+            while end > slice_end:
+                running[0] += (slice_end - start) * NICE_0_WEIGHT / running[4]
+                running[3] -= slice_end - start
+                start, slice_end = slice_end, slice_end + length
+        running[0] += (end - start) * NICE_0_WEIGHT / running[4]
+        # End times are compared rather than subtracted, so float timelines cannot leave slivers behind
+        running[3] = 0 if end >= finish else running[3] - (end - start)
+
+        # Record the execution, extending the segment the process is still running
+        if end == time:
+            pass  # Only a float sliver of the allotment or burst was left
+        elif current is not None and current[0] is process and current[2] == time and (merge_slices or not boundary):
+            current[2] = end
+        else:
+            if current is not None:
+                yield tuple(current)
+            current = [process, time, end]
+        boundary = False
+        time = end
+        if running[3] <= 0 and arrivals.completed(process, time):
+            sleeping[process[0]] = running[0]
+
+    if current is not None:
+        yield tuple(current)
+
+def _sjf_key(process, remaining):
+    # Ties on remaining time go to the earliest arrival, then to input order
+    return remaining, process[1], process[0]
+
+def _priority_key(process, remaining):
+    # Lower number = higher priority, ties go to input order
+    return process[3], process[0]
+
+def fcfs(processes, progress=None):
+    """First Come First Serve scheduling algorithm"""
+    arrivals = _workload_arrivals(processes)
+    return _build_results(processes, _fcfs_segments(arrivals), "fcfs", progress, arrivals.io)
+
+def sjf_non_preemptive(processes, progress=None):
+    """Shortest Job First (Non-Preemptive) scheduling algorithm"""
+    return schedule_by_key(processes, "burst", "sjf_non_preemptive", progress)
+
+def sjf_preemptive(processes, progress=None):
+    """Shortest Job First (Preemptive) scheduling algorithm (Shortest Remaining Time First)"""
+    arrivals = _workload_arrivals(processes)
+    segments = _preemptive_segments(arrivals, _sjf_key)
+    return _build_results(processes, segments, "sjf_preemptive", progress, arrivals.io)
+
+def priority_non_preemptive(processes, progress=None):
+    """Priority (Non-Preemptive) scheduling algorithm"""
+    # Lower number = higher priority
+    return schedule_by_key(processes, "priority", "priority_non_preemptive", progress)
+
+def priority_preemptive(processes, progress=None):
+    """Priority (Preemptive) scheduling algorithm"""
+    arrivals = _workload_arrivals(processes)
+    segments = _preemptive_segments(arrivals, _priority_key)
+    return _build_results(processes, segments, "priority_preemptive", progress, arrivals.io)
+
+def _validate_time_quantum(time_quantum):
+    if not time_quantum or time_quantum <= 0:
+        raise ValueError("Time quantum must be a positive integer")
+
+def round_robin(processes, time_quantum, merge_slices=False, progress=None):
+    """
+    Round Robin scheduling algorithm
+
+    Args:
+        processes (list): Process dictionaries or a ProcessTable
+        time_quantum (int): Length of one time slice
+        merge_slices (bool): Record back-to-back slices of the same process
+            as one segment. This also lets a process that is alone on the
+            CPU skip ahead to the next arrival in one step, so long bursts
+            with a small quantum finish in bounded time.
+        progress (callable, optional): Progress callback, see start_simulation
+    """
+    _validate_time_quantum(time_quantum)
+    arrivals = _workload_arrivals(processes)
+    segments = _round_robin_segments(arrivals, time_quantum, merge_slices)
+    return _build_results(processes, segments, "round_robin", progress, arrivals.io)
+
+def mlfq_engine(levels=MLFQ_LEVELS, quanta=None, boost_interval=None):
+    """
+    Configure a multilevel feedback queue engine for register_algorithm
+
+    Args:
+        levels (int): Number of priority levels
+        quanta (list, optional): Allotment of each level, top level first.
+            By default the time quantum passed to start_simulation doubles
+            with every level down.
+        boost_interval (optional): Period of the priority boost. Defaults
+            to MLFQ_BOOST_QUANTA times the bottom level's allotment; 0
+            disables boosting.
+    """
+    if quanta is not None:
+        levels = len(quanta)
+        if min(quanta, default=0) <= 0:
+            raise ValueError("MLFQ quanta must be positive")
+    if levels < 1:
+        raise ValueError("MLFQ needs at least one level")
+
+    def engine(arrivals, time_quantum, merge_slices):
+        level_quanta = quanta or [time_quantum * 2 ** level for level in range(levels)]
+        boost = MLFQ_BOOST_QUANTA * level_quanta[-1] if boost_interval is None else boost_interval
+        return _mlfq_segments(arrivals, level_quanta, boost, merge_slices)
+    return engine
+
+def cfs_engine(latency=None, min_granularity=None, wakeup_granularity=None):
+    """
+    Configure a CFS-style fair scheduler engine for register_algorithm
+
+    Args:
+        latency (optional): Scheduling period shared by the runnable
+            processes; by default the time quantum passed to start_simulation
+        min_granularity (optional): Shortest slice, by default 1/8 of the
+            period (at least 1 for an integer period), as Linux's defaults
+        wakeup_granularity (optional): How far behind the running process a
+            new one must be to preempt it, by default 1/6 of the period
+    """
+    def engine(arrivals, time_quantum, merge_slices):
+        period = time_quantum if latency is None else latency
+        granularity = min_granularity
+        if granularity is None:
+            granularity = max(period // 8, 1) if isinstance(period, int) else period / 8
+        wakeup = period / 6 if wakeup_granularity is None else wakeup_granularity
+        return _cfs_segments(arrivals, period, granularity, wakeup, merge_slices)
+    return engine
+
+def mlfq(processes, time_quantum, merge_slices=False, progress=None):
+    """
+    Multilevel feedback queue scheduling with MLFQ_LEVELS levels
+
+    ``time_quantum`` is the top level's allotment; see mlfq_engine.
+    """
+    _validate_time_quantum(time_quantum)
+    arrivals = _workload_arrivals(processes)
+    segments = mlfq_engine()(arrivals, time_quantum, merge_slices)
+    return _build_results(processes, segments, "mlfq", progress, arrivals.io)
+
+def cfs(processes, time_quantum, merge_slices=False, progress=None):
+    """
+    Completely Fair Scheduler style scheduling; priorities are nice values
+
+    ``time_quantum`` is the scheduling period; see cfs_engine.
+    """
+    _validate_time_quantum(time_quantum)
+    arrivals = _workload_arrivals(processes)
+    segments = cfs_engine()(arrivals, time_quantum, merge_slices)
+    return _build_results(processes, segments, "cfs", progress, arrivals.io)
+
+# Scheduling algorithms start_simulation can run, by name; see register_algorithm
+Scheduler = namedtuple("Scheduler", "name label engine time_quantum priority checkpoints")
+SCHEDULERS = {}
+
+def register_algorithm(name, engine, label=None, time_quantum=False, priority=False, checkpoints=False):
+    """
+    Make a scheduling engine available to start_simulation under ``name``
+
+    Args:
+        name (str): Algorithm name passed to start_simulation
+        engine (callable): ``engine(arrivals, time_quantum, merge_slices)``
+            returning a generator of ``(process, start, end)`` segments,
+            each yielded once final, for an arrival-sorted iterable of
+            process tuples. The same engine serves whole workloads and
+            streams.
+        label (str, optional): Name shown in charts and tables
+        time_quantum (bool): The engine needs a positive time quantum; only
+            such engines slice, so only they are affected by merge_slices
+        priority (bool): The engine reads the process priorities
+        checkpoints (bool): The engine also accepts ``state`` and
+            ``checkpoints`` keywords, see checkpointed_segments
+    """
+    SCHEDULERS[name] = Scheduler(name, label or name, engine, time_quantum, priority, checkpoints)
+
+def algorithm_label(algorithm):
+    """Display name of an algorithm, or the name itself when it is not registered"""
+    scheduler = SCHEDULERS.get(algorithm)
+    return scheduler.label if scheduler is not None else algorithm
+
+def _scheduler(algorithm, time_quantum):
+    """Registry entry of ``algorithm``, after checking the time quantum it needs"""
+    scheduler = SCHEDULERS.get(algorithm)
+    if scheduler is None:
         raise ValueError(f"Unknown algorithm specified: {algorithm}")
+    if scheduler.time_quantum:
+        _validate_time_quantum(time_quantum)
+    return scheduler
+
+register_algorithm(
+    "fcfs", lambda arrivals, time_quantum, merge_slices, **resume: _fcfs_segments(arrivals, **resume),
+    "First Come First Serve", checkpoints=True)
+register_algorithm(
+    "sjf_preemptive",
+    lambda arrivals, time_quantum, merge_slices, **resume: _preemptive_segments(arrivals, _sjf_key, **resume),
+    "Shortest Job First (Preemptive)", checkpoints=True)
+register_algorithm(
+    "sjf_non_preemptive",
+    lambda arrivals, time_quantum, merge_slices, **resume: _non_preemptive_segments(arrivals, itemgetter(_FIELDS["burst"]), **resume),
+    "Shortest Job First (Non-Preemptive)", checkpoints=True)
+register_algorithm(
+    "priority_preemptive",
+    lambda arrivals, time_quantum, merge_slices, **resume: _preemptive_segments(arrivals, _priority_key, **resume),
+    "Priority Scheduling (Preemptive)", priority=True, checkpoints=True)
+register_algorithm(
+    "priority_non_preemptive",
+    lambda arrivals, time_quantum, merge_slices, **resume: _non_preemptive_segments(arrivals, itemgetter(_FIELDS["priority"]), **resume),
+    "Priority Scheduling (Non-Preemptive)", priority=True, checkpoints=True)
+register_algorithm("round_robin", _round_robin_segments, "Round Robin", time_quantum=True, checkpoints=True)
+register_algorithm("mlfq", mlfq_engine(), "Multilevel Feedback Queue", time_quantum=True)
+register_algorithm("cfs", cfs_engine(), "Completely Fair Scheduler", time_quantum=True, priority=True)
+
+def checkpointed_segments(processes, algorithm, time_quantum=None, merge_slices=False, state=None, checkpoints=None):
+    """
+    Segment generator of a whole workload that can resume and record checkpoints
+
+    Args:
+        processes: Process dictionaries or a ProcessTable
+        algorithm (str): Any algorithm accepted by start_simulation
+        time_quantum, merge_slices: As for start_simulation
+        state (Checkpoint, optional): Resume from this checkpoint; its
+            process tuples must carry this workload's pid indices
+        checkpoints (list, optional): Checkpoints are appended here
+
+    Returns:
+        generator: ``(process, start, end)`` segments after ``state``
+    """
+    scheduler = _scheduler(algorithm, time_quantum)
+    if not scheduler.checkpoints:
+        raise ValueError(f"{scheduler.label} cannot resume from checkpoints")
+    arrivals = _workload_arrivals(processes, state.consumed if state is not None else 0)
+    if arrivals.io is not None:
+        # Checkpoints do not capture the device queues
+        raise ValueError("Workloads with I/O bursts cannot resume from checkpoints")
+    return scheduler.engine(arrivals, time_quantum, merge_slices, state=state, checkpoints=checkpoints)
+
+def stream_simulation(arrivals, algorithm="fcfs", time_quantum=None, merge_slices=False):
+    """
+    Simulate an unbounded stream of processes and yield results lazily
+
+    Args:
+        arrivals (iterable): Process dictionaries ordered by arrival time,
+            for example parsed line by line from an arrival log
+        algorithm (str): Any algorithm accepted by start_simulation
+        time_quantum (int): Time quantum of the algorithms that take one
+        merge_slices (bool): Merge back-to-back Round Robin slices
+
+    Returns:
+        generator: Result dictionaries, each yielded as soon as the segment
+        is final. Memory is bounded by the number of ready processes rather
+        than the length of the stream. A process arriving out of order
+        raises ValueError, and so does one with I/O bursts.
+    """
+    scheduler = _scheduler(algorithm, time_quantum)
+
+    def processes():
+        # Input order numbers the processes for tie-breaking; the ID rides along at the end
+        for index, p in enumerate(arrivals):
+            if len(p.get("bursts", ())) > 1:
+                raise ValueError("Streaming simulations do not model I/O bursts")
+            yield index, p["arrival"], p["burst"], p.get("priority", 0), p["id"]
+
+    segments = scheduler.engine(processes(), time_quantum, merge_slices)
+    return (
+        {"id": process[4], "start": start, "end": end, "algorithm": algorithm}
+        for process, start, end in segments
+    )
+
+def start_simulation(processes, algorithm="fcfs", time_quantum=None, merge_slices=False, stream=False,
+                     progress=None, cpus=1, run_queues="global", affinity=None, overhead=None, telemetry=None):
+    """
+    Start the simulation with the selected algorithm and parameters
+
+    ``processes`` may be a list of process dictionaries, which returns a
+    list of result dictionaries, or a ProcessTable, which returns a
+    ScheduleResult. The input is never modified. With ``stream=True``,
+    ``processes`` may be any arrival-ordered iterable of process
+    dictionaries and a generator of results is returned instead (see
+    stream_simulation).
+
+    ``progress``, if given, is called as ``progress(events, fraction)``
+    every PROGRESS_INTERVAL segments and once at the end, with the number
+    of segments produced so far and the fraction of the total burst time
+    executed. An exception raised by the callback aborts the simulation,
+    which is how callers cancel a long run. It is ignored when streaming.
+
+    With ``cpus`` above one, or with ``affinity``, the workload runs on a
+    simulated multiprocessor (see smp.simulate_smp) and every result also
+    carries the CPU that ran it. ``run_queues`` picks a "global" ready
+    queue or "per_cpu" queues with work stealing.
+
+    ``algorithm`` is any name in SCHEDULERS; register_algorithm adds more.
+
+    ``overhead``, an Overhead, charges context switches, dispatch latency
+    and cache warmup on the simulated CPUs. The charges appear in the
+    results as segments whose "kind" names the overhead (see SEGMENT_KINDS),
+    next to the "run" segments of the processes.
+
+    A process may alternate CPU and I/O bursts: ``"bursts"`` lists them,
+    CPU first and last, and ``"device"`` (0 by default) names the device
+    that serves its I/O (see ProcessTable for the columnar form). It then
+    releases the CPU after each CPU burst, waits in its device's FCFS queue,
+    and is queued again by the scheduler like a new arrival once its I/O
+    completes. The results of such a workload add "io_wait" and "io"
+    segments, and every segment carries its "kind".
+
+    ``telemetry``, a telemetry.Telemetry, records the run as a per-window
+    time series (ready-queue depth, running process, CPU utilization,
+    arrivals and completions) while the engine runs; read it back with its
+    series method. It is not available when streaming.
+    """
+    if stream and telemetry is not None:
+        raise ValueError("Telemetry is not recorded for streaming simulations")
+    if cpus != 1 or affinity is not None or overhead is not None:
+        if stream:
+            raise ValueError("Streaming simulations run on a single CPU without overhead")
+        from smp import simulate_smp
+        return simulate_smp(processes, algorithm, cpus, time_quantum, merge_slices, run_queues, affinity, progress,
+                            overhead, telemetry)
+
+    if stream:
+        return stream_simulation(processes, algorithm, time_quantum, merge_slices)
+
+    scheduler = _scheduler(algorithm, time_quantum)
+    arrivals = _workload_arrivals(processes)
+    segments = scheduler.engine(arrivals, time_quantum, merge_slices)
+    if telemetry is not None:
+        segments = _with_telemetry(segments, telemetry, processes, arrivals)
+    return _build_results(processes, segments, algorithm, progress, arrivals.io)
@@ -0,0 +1,82 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms import SCHEDULERS, start_simulation
+from columnar import ProcessTable
+from metrics import summary_metrics
+
+ALGORITHMS = tuple(SCHEDULERS)
+
+# Workload of the current worker process, set once by _init_worker
+_workload = None
+
+
+def sweep_configs(algorithms=ALGORITHMS, quanta=()):
+    """
+    Build the (algorithm, time_quantum) grid for simulate_batch
+
+    Algorithms that take a time quantum (Round Robin, MLFQ, CFS) get one
+    entry per quantum; every other algorithm runs once with a time quantum
+    of None.
+    """
+    configs = []
+    for algorithm in algorithms:
+        if SCHEDULERS[algorithm].time_quantum:
+            configs.extend((algorithm, quantum) for quantum in quanta)
+        else:
+            configs.append((algorithm, None))
+    return configs
+
+def _init_worker(workload):
+    """Pool initializer: keep the workload for every task this worker runs"""
+    global _workload
+    _workload = workload
+
+def _run_config(config, timelines, merge_slices, overhead=None):
+    """Simulate one (algorithm, time_quantum) pair on the worker's workload"""
+    algorithm, time_quantum = config
+    results = start_simulation(_workload, algorithm, time_quantum, merge_slices, overhead=overhead)
+    summary = {"algorithm": algorithm, "time_quantum": time_quantum}
+    summary.update(summary_metrics(results, _workload))
+    if timelines:
+        summary["results"] = results
+    return summary
+
+def simulate_batch(workload, configs, workers=None, timelines=False, merge_slices=False, overhead=None):
+    """
+    Run several algorithm / time quantum configurations on one workload in parallel
+
+    The workload is handed to each worker process once through the pool
+    initializer (inherited directly where the platform forks), so tasks
+    only carry their configuration. Workers send back aggregated metrics,
+    which keeps inter-process traffic small.
+
+    Args:
+        workload: ProcessTable or list of process dictionaries
+        configs (list): (algorithm, time_quantum) pairs, see sweep_configs
+        workers (int, optional): Number of worker processes, defaults to the
+            CPU count. With 1 the configurations run in this process.
+        timelines (bool): Also return each ScheduleResult under "results"
+        merge_slices (bool): Passed on to start_simulation
+        overhead (Overhead, optional): Scheduling costs charged in every
+            configuration, e.g. to find the time quantum where context
+            switches stop paying off
+
+    Returns:
+        list: One summary dictionary per configuration, in ``configs`` order
+    """
+    if not isinstance(workload, ProcessTable):
+        workload = ProcessTable.from_dicts(workload)
+    configs = [tuple(config) for config in configs]
+    workers = min(workers or os.cpu_count() or 1, max(len(configs), 1))
+
+    if workers == 1:
+        _init_worker(workload)
+        try:
+            return [_run_config(config, timelines, merge_slices, overhead) for config in configs]
+        finally:
+            _init_worker(None)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(workload,)) as executor:
+        futures = [executor.submit(_run_config, config, timelines, merge_slices, overhead) for config in configs]
+        return [future.result() for future in futures]
@@ -0,0 +1,4 @@
+"""Scheduler benchmarks: seeded synthetic workloads and a headless timing runner.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
@@ -0,0 +1,104 @@
+import argparse
+import json
+import platform
+import sys
+import time
+
+from algorithms import SCHEDULERS, start_simulation
+from benchmarks.workloads import ARRIVALS, BURSTS, PRIORITIES, make_workload
+
+ALGORITHMS = tuple(SCHEDULERS)
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+
+
+def run_benchmarks(sizes, algorithms=ALGORITHMS, time_quantum=4, repeat=3, seed=0, **workload_options):
+    """
+    Time every algorithm on a seeded workload of every size
+
+    Returns:
+        dict: A JSON-serializable report; each entry in "results" holds the
+        best wall time of ``repeat`` runs
+    """
+    results = []
+    for n in sizes:
+        workload = make_workload(n, seed=seed, **workload_options)
+        for algorithm in algorithms:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                schedule = start_simulation(workload, algorithm, time_quantum)
+                timings.append(time.perf_counter() - started)
+            results.append({"algorithm": algorithm, "n": n, "seconds": min(timings), "segments": len(schedule)})
+            print(f"{algorithm:<24} n={n:<8} {min(timings):10.4f}s", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time_quantum": time_quantum,
+            "repeat": repeat,
+            "seed": seed,
+            "workload": workload_options,
+        },
+        "results": results,
+    }
+
+def compare_reports(report, baseline, threshold=0.25, min_seconds=0.01):
+    """
+    Compare a report with a stored baseline
+
+    Measurements where both runs took less than ``min_seconds`` are skipped,
+    since timer noise dominates at that scale.
+
+    Returns:
+        list: (algorithm, n, baseline seconds, seconds, ratio) for every
+        measurement more than ``threshold`` (a fraction) slower than the baseline
+    """
+    previous = {(r["algorithm"], r["n"]): r["seconds"] for r in baseline["results"]}
+    slowdowns = []
+    for result in report["results"]:
+        before = previous.get((result["algorithm"], result["n"]))
+        if before is None or before <= 0 or max(before, result["seconds"]) < min_seconds:
+            continue
+        ratio = result["seconds"] / before
+        if ratio > 1 + threshold:
+            slowdowns.append((result["algorithm"], result["n"], before, result["seconds"], ratio))
+    return slowdowns
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Time the schedulers on synthetic workloads")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Workload sizes to time")
+    parser.add_argument("--algorithms", nargs="+", default=ALGORITHMS, choices=ALGORITHMS)
+    parser.add_argument("--time-quantum", type=int, default=4, help="Time quantum of the algorithms that take one")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrivals", default="poisson", choices=sorted(ARRIVALS))
+    parser.add_argument("--bursts", default="pareto", choices=sorted(BURSTS))
+    parser.add_argument("--priorities", default="uniform", choices=sorted(PRIORITIES))
+    parser.add_argument("--load", type=float, default=0.9, help="Target CPU load of the workload")
+    parser.add_argument("--output", help="Write the report to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Flag slowdowns against this stored report")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown as a fraction (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.01, help="Ignore measurements faster than this")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        args.sizes, args.algorithms, args.time_quantum, args.repeat, args.seed,
+        arrivals=args.arrivals, bursts=args.bursts, priorities=args.priorities, load=args.load
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        slowdowns = compare_reports(report, baseline, args.threshold, args.min_seconds)
+        for algorithm, n, before, after, ratio in slowdowns:
+            print(f"SLOWER {algorithm} n={n}: {before:.4f}s -> {after:.4f}s ({ratio:.2f}x)")
+        if slowdowns:
+            return 1
+        print(f"No slowdowns beyond {args.threshold:.0%} against {args.compare}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
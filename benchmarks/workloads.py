@@ -0,0 +1,87 @@
+import numpy as np
+
+from columnar import ProcessTable
+
+
+def poisson_arrivals(rng, n, rate=1.0):
+    """Arrival times of a Poisson process with ``rate`` arrivals per time unit"""
+    return np.cumsum(rng.exponential(1.0 / rate, n))
+
+def diurnal_arrivals(rng, n, rate=1.0, period=1000.0, amplitude=0.8):
+    """
+    Arrival times of a Poisson process whose rate follows a daily cycle
+
+    The rate swings sinusoidally between ``rate * (1 - amplitude)`` and
+    ``rate * (1 + amplitude)`` once per ``period``. Generated by thinning a
+    Poisson process at the peak rate.
+    """
+    peak = rate * (1 + amplitude)
+    arrivals = np.empty(0)
+    while len(arrivals) < n:
+        start = arrivals[-1] if len(arrivals) else 0.0
+        candidates = start + np.cumsum(rng.exponential(1.0 / peak, 2 * (n - len(arrivals)) + 16))
+        current_rate = rate * (1 + amplitude * np.sin(2 * np.pi * candidates / period))
+        arrivals = np.concatenate([arrivals, candidates[rng.random(len(candidates)) * peak < current_rate]])
+    return arrivals[:n]
+
+def bursty_arrivals(rng, n, rate=1.0, burst_rate=20.0, mean_burst_size=50):
+    """
+    Arrival times alternating between quiet periods and dense bursts
+
+    Each burst holds a geometric number of jobs arriving at ``burst_rate``;
+    gaps between bursts are exponential with a mean chosen so that the
+    long-run average rate stays close to ``rate``.
+    """
+    gaps = np.empty(n)
+    position = 0
+    while position < n:
+        size = min(rng.geometric(1.0 / mean_burst_size), n - position)
+        gaps[position] = rng.exponential(mean_burst_size / rate)
+        gaps[position + 1:position + size] = rng.exponential(1.0 / burst_rate, size - 1)
+        position += size
+    return np.cumsum(gaps)
+
+def pareto_bursts(rng, n, shape=1.5, minimum=1.0):
+    """Heavy-tailed burst times from a Pareto distribution with the given minimum"""
+    return minimum * (1 + rng.pareto(shape, n))
+
+def exponential_bursts(rng, n, mean=5.0):
+    """Exponentially distributed burst times"""
+    return rng.exponential(mean, n)
+
+def uniform_priorities(rng, n, levels=10):
+    """Priorities drawn uniformly from 0..levels-1"""
+    return rng.integers(0, levels, n)
+
+def zipf_priorities(rng, n, levels=10, exponent=1.5):
+    """Skewed priorities: most jobs get the most urgent levels"""
+    return np.minimum(rng.zipf(exponent, n) - 1, levels - 1)
+
+ARRIVALS = {"poisson": poisson_arrivals, "diurnal": diurnal_arrivals, "bursty": bursty_arrivals}
+BURSTS = {"pareto": pareto_bursts, "exponential": exponential_bursts}
+PRIORITIES = {"uniform": uniform_priorities, "zipf": zipf_priorities}
+
+def make_workload(n, arrivals="poisson", bursts="pareto", priorities="uniform", load=0.9, seed=0):
+    """
+    Build a seeded synthetic workload
+
+    Times are rounded to whole units like the GUI's workloads, and every
+    burst is at least 1.
+
+    Args:
+        n (int): Number of processes
+        arrivals (str): Arrival pattern, one of ARRIVALS
+        bursts (str): Burst distribution, one of BURSTS
+        priorities (str): Priority distribution, one of PRIORITIES
+        load (float): Target CPU load, the mean burst time times the arrival rate
+        seed (int): Seed for the random generator
+
+    Returns:
+        ProcessTable: The generated workload
+    """
+    rng = np.random.default_rng(seed)
+    burst = np.maximum(np.rint(BURSTS[bursts](rng, n)), 1).astype(np.int64)
+    rate = load / burst.mean()
+    arrival = np.rint(ARRIVALS[arrivals](rng, n, rate=rate)).astype(np.int64)
+    priority = PRIORITIES[priorities](rng, n).astype(np.int32)
+    return ProcessTable(arrival, burst, priority)
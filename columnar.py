@@ -0,0 +1,362 @@
+import numpy as np
+
+from algorithms import IO_KINDS, RUN, SEGMENT_KINDS, check_bursts
+
+# Integers above this magnitude are rounded when converted to float64 (nanosecond timestamps are)
+MAX_EXACT_FLOAT_INTEGER = 2**53
+
+
+def _default_ids(count):
+    """Process IDs used when a table is built without explicit IDs: P1, P2, ..."""
+    return np.array([f"P{i + 1}" for i in range(count)])
+
+def _next_id(ids):
+    """A P<n> ID not in ``ids``: one past the largest P<n> there, so removals never cause a clash"""
+    numbers = [int(pid[1:]) for pid in ids.tolist() if pid[:1] == "P" and pid[1:].isdigit()]
+    return f"P{max(numbers, default=0) + 1}"
+
+def _mixed_times_error(name):
+    return ValueError(f"Fractional {name} times cannot be mixed with integer times past 2**53, such as nanosecond "
+                      f"timestamps, which float64 would round")
+
+def _time_column(values, name):
+    """
+    Array of arrival or burst times that never rounds integer times
+
+    A mix of integers and floats is float64 unless an integer is too large
+    for float64 to hold it exactly; then whole-number floats are converted
+    to integers and a fractional one is rejected.
+
+    Raises:
+        ValueError: If fractional times are mixed with integers past 2**53
+    """
+    column = np.asarray(values)
+    if column.dtype.kind != "f":
+        return column
+    if all(isinstance(value, (float, np.floating)) or abs(value) <= MAX_EXACT_FLOAT_INTEGER for value in values):
+        return column
+    if any(isinstance(value, (float, np.floating)) and not float(value).is_integer() for value in values):
+        raise _mixed_times_error(name)
+    return np.array([int(value) for value in values], dtype=np.int64)
+
+def _append_time(column, value, name):
+    """np.append for a time column; an int64 column past 2**53 stays int64 rather than being rounded to float64"""
+    if np.issubdtype(column.dtype, np.integer) and isinstance(value, (float, np.floating)) and len(column):
+        if float(value).is_integer():
+            value = int(value)
+        elif max(-column.min().item(), column.max().item()) > MAX_EXACT_FLOAT_INTEGER:
+            raise _mixed_times_error(name)
+    return np.append(column, value)
+
+def pack_bursts(sequences):
+    """
+    Pack per-process burst sequences into ProcessTable's flat columns
+
+    Args:
+        sequences (list): By process, None or its alternating CPU and I/O bursts
+
+    Returns:
+        tuple: (bursts, burst_offsets) arrays, or (None, None) when no
+        process does I/O
+    """
+    lengths = [len(sequence) if sequence is not None and len(sequence) > 1 else 0 for sequence in sequences]
+    if not any(lengths):
+        return None, None
+    bursts = np.array([burst for sequence, length in zip(sequences, lengths) if length for burst in sequence])
+    return bursts, np.r_[0, np.cumsum(lengths)]
+
+class ProcessTable:
+    """
+    Columnar process workload backed by NumPy arrays
+
+    Row ``i`` is the process with pid index ``i``. Holding one array per
+    field instead of one dictionary per process cuts memory per process by
+    roughly an order of magnitude and lets metrics code work on whole
+    columns at once.
+
+    Args:
+        arrival (array-like): Arrival time of every process
+        burst (array-like): Burst time of every process
+        priority (array-like, optional): Priority of every process, 0 if omitted
+        ids (array-like, optional): Process IDs, P1..Pn if omitted
+        bursts (array-like, optional): Alternating CPU and I/O bursts of the
+            processes that do I/O, all sequences back to back; see check_bursts
+        burst_offsets (array-like, optional): With ``bursts``: process ``i``'s
+            sequence is ``bursts[burst_offsets[i]:burst_offsets[i + 1]]``, an
+            empty range for a process without I/O
+        device (array-like, optional): Device serving each process's I/O, 0
+            if omitted
+    """
+
+    def __init__(self, arrival, burst, priority=None, ids=None, bursts=None, burst_offsets=None, device=None):
+        self.arrival = np.asarray(arrival)
+        self.burst = np.asarray(burst)
+        if priority is None:
+            self.priority = np.zeros(len(self.arrival), dtype=np.int32)
+        else:
+            self.priority = np.asarray(priority)
+        self._ids = None if ids is None else np.asarray(ids)
+        self._generated_ids = None  # Cache of the default IDs; _ids stays None so edits renumber them
+
+        if not len(self.arrival) == len(self.burst) == len(self.priority):
+            raise ValueError("Arrival, burst and priority columns must have the same length")
+
+        # Processes alternating CPU and I/O bursts; most workloads have none
+        self.bursts = self.burst_offsets = self.device = None
+        if bursts is not None and len(bursts):
+            self.bursts = np.asarray(bursts)
+            self.burst_offsets = np.asarray(burst_offsets, dtype=np.int64)
+            if len(self.burst_offsets) != len(self) + 1:
+                raise ValueError("Burst offsets must have one entry per process plus one")
+            self.device = np.zeros(len(self), dtype=np.int32) if device is None else np.asarray(device)
+            self._check_bursts()
+
+    def _check_bursts(self):
+        # check_bursts on every sequence at once
+        lengths = np.diff(self.burst_offsets)
+        io = np.flatnonzero(lengths)
+        if (lengths < 0).any() or self.burst_offsets[-1] != len(self.bursts) or (lengths[io] % 2 == 0).any():
+            raise ValueError("Burst sequences must start and end with a CPU burst")
+        position = np.arange(len(self.bursts)) - np.repeat(self.burst_offsets[:-1], lengths)
+        cpu = position % 2 == 0
+        if (self.bursts[cpu] <= 0).any() or (self.bursts[~cpu] < 0).any():
+            raise ValueError("CPU bursts must be positive and I/O bursts must not be negative")
+        total = np.add.reduceat(np.where(cpu, self.bursts, 0), self.burst_offsets[io]) if len(io) else np.zeros(0)
+        mismatch = np.abs(total - self.burst[io]) > 1e-9 * np.maximum(np.abs(self.burst[io]), 1)
+        if mismatch.any():
+            index = io[mismatch.argmax()]
+            raise ValueError(f"CPU bursts of {self.ids[index]} add up to {total[mismatch.argmax()]}, "
+                             f"not to the burst time {self.burst[index]}")
+
+    @classmethod
+    def empty(cls):
+        """A table without processes, with integer columns"""
+        return cls(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+    @classmethod
+    def from_dicts(cls, processes):
+        """
+        Build a table from a list of process dictionaries
+
+        A process with a ``"bursts"`` sequence may leave out ``"burst"``,
+        which is then the total of its CPU bursts. Integer and float times
+        may be mixed unless that would round integers (see _time_column).
+        """
+        sequences = [p.get("bursts") if len(p.get("bursts", ())) > 1 else None for p in processes]
+        return cls(
+            _time_column([p["arrival"] for p in processes], "arrival"),
+            _time_column([p["burst"] if "burst" in p or sequence is None else check_bursts(sequence)
+                          for p, sequence in zip(processes, sequences)], "burst"),
+            [p.get("priority", 0) for p in processes],
+            [p["id"] for p in processes],
+            *pack_bursts(sequences),
+            [p.get("device", 0) for p in processes]
+        )
+
+    def __len__(self):
+        return len(self.arrival)
+
+    @property
+    def ids(self):
+        """Process IDs by pid index, generated on first use when not given"""
+        if self._ids is not None:
+            return self._ids
+        if self._generated_ids is None:
+            self._generated_ids = _default_ids(len(self))
+        return self._generated_ids
+
+    @property
+    def nbytes(self):
+        """Memory held by the table's arrays"""
+        optional_bytes = sum(column.nbytes for column in (self._ids, self.bursts, self.burst_offsets, self.device)
+                             if column is not None)
+        return self.arrival.nbytes + self.burst.nbytes + self.priority.nbytes + optional_bytes
+
+    @property
+    def has_io(self):
+        """True when some process alternates CPU and I/O bursts"""
+        return self.bursts is not None
+
+    def bursts_of(self, index):
+        """The CPU and I/O bursts of process ``index`` as a list; just its burst time without I/O"""
+        if self.bursts is None or self.burst_offsets[index] == self.burst_offsets[index + 1]:
+            return [self.burst[index].item()]
+        return self.bursts[self.burst_offsets[index]:self.burst_offsets[index + 1]].tolist()
+
+    def io_columns(self):
+        """The burst sequences as (bursts, offsets, devices) lists for the schedulers, None without I/O"""
+        if self.bursts is None:
+            return None
+        return self.bursts.tolist(), self.burst_offsets.tolist(), self.device.tolist()
+
+    def next_id(self):
+        """ID that append gives the next process"""
+        return _next_id(self._ids) if self._ids is not None else f"P{len(self) + 1}"
+
+    def append(self, arrival, burst, priority=0):
+        """
+        Return a new table with one more process at the end
+
+        Tables are never modified in place, so a table handed to a running
+        simulation stays valid while the GUI keeps editing. Appending copies
+        the columns, which is fine for interactive edits.
+
+        Raises:
+            ValueError: If a fractional time is appended to integer times
+                past 2**53, which float64 would round
+        """
+        ids = None if self._ids is None else np.append(self._ids, self.next_id())
+        io = {}
+        if self.bursts is not None:
+            # The new process does no I/O
+            io = dict(bursts=self.bursts, burst_offsets=np.append(self.burst_offsets, self.burst_offsets[-1]),
+                      device=np.append(self.device, 0))
+        return ProcessTable(_append_time(self.arrival, arrival, "arrival"), _append_time(self.burst, burst, "burst"),
+                            np.append(self.priority, priority), ids, **io)
+
+    def remove(self, index):
+        """Return a new table without row ``index``; default IDs are renumbered P1..Pn"""
+        ids = None if self._ids is None else np.delete(self._ids, index)
+        io = {}
+        if self.bursts is not None:
+            first, last = self.burst_offsets[index], self.burst_offsets[index + 1]
+            offsets = np.delete(self.burst_offsets, index + 1)
+            offsets[index + 1:] -= last - first
+            io = dict(bursts=np.delete(self.bursts, np.s_[first:last]), burst_offsets=offsets,
+                      device=np.delete(self.device, index))
+        return ProcessTable(np.delete(self.arrival, index), np.delete(self.burst, index),
+                            np.delete(self.priority, index), ids, **io)
+
+    def columns(self):
+        """Return the arrival, burst and priority columns as Python lists for the schedulers"""
+        return self.arrival.tolist(), self.burst.tolist(), self.priority.tolist()
+
+    def arrival_order(self):
+        """Row indices as a list in arrival order; ties keep their row order"""
+        return np.argsort(self.arrival, kind="stable").tolist()
+
+    def to_dicts(self):
+        """Convert to the list of process dictionaries used by the GUI"""
+        processes = [
+            {"id": pid, "arrival": arrival, "burst": burst, "priority": priority}
+            for pid, arrival, burst, priority in zip(
+                self.ids.tolist(), self.arrival.tolist(), self.burst.tolist(), self.priority.tolist()
+            )
+        ]
+        if self.bursts is not None:
+            for index in np.flatnonzero(np.diff(self.burst_offsets)).tolist():
+                processes[index]["bursts"] = self.bursts_of(index)
+                processes[index]["device"] = self.device[index].item()
+        return processes
+
+class ScheduleResult:
+    """
+    Columnar simulation result: one row per execution segment
+
+    Args:
+        pid (array-like): Pid index of the process run in each segment
+        start (array-like): Segment start times
+        end (array-like): Segment end times
+        algorithm (str): Name of the algorithm that produced the schedule
+        ids (array-like, optional): Process IDs by pid index, P1..Pn if omitted
+        cpu (array-like, optional): CPU that ran each segment, -1 for I/O,
+            for multi-CPU schedules; None for a single CPU
+        cpus (int, optional): Number of simulated CPUs, including any that
+            stayed idle; defaults to the highest CPU number plus one
+        kind (array-like, optional): SEGMENT_KINDS code of each segment when
+            scheduling overhead or I/O was simulated; None when every segment
+            is a run
+    """
+
+    def __init__(self, pid, start, end, algorithm, ids=None, cpu=None, cpus=None, kind=None):
+        self.pid = np.asarray(pid, dtype=np.int32)
+        self.start = np.asarray(start)
+        self.end = np.asarray(end)
+        self.algorithm = algorithm
+        self._ids = None if ids is None else np.asarray(ids)
+        self.cpu = None if cpu is None else np.asarray(cpu, dtype=np.int16)
+        if cpus is None:
+            cpus = int(self.cpu.max()) + 1 if self.cpu is not None and len(self.cpu) else 1
+        self.cpus = cpus
+        self.kind = None if kind is None else np.asarray(kind, dtype=np.int8)
+
+    @classmethod
+    def from_dicts(cls, results, ids=None, cpus=None):
+        """
+        Build a result from a list of result dictionaries
+
+        Args:
+            results (list): Result dictionaries as returned by start_simulation
+            ids (array-like, optional): Process IDs by pid index. When omitted,
+                pid indices are assigned in order of first appearance.
+            cpus (int, optional): Number of simulated CPUs. The dictionaries
+                only name the CPUs that ran something, so pass the ``cpus``
+                given to start_simulation when some may have stayed idle.
+        """
+        if ids is None:
+            ids = list(dict.fromkeys(r["id"] for r in results))
+        index_of = {pid: i for i, pid in enumerate(np.asarray(ids).tolist())}
+        algorithm = results[0]["algorithm"] if results else "fcfs"
+        # Multi-CPU results carry the CPU of every segment but I/O, overhead and I/O simulations their kind
+        cpu = [r.get("cpu", -1) for r in results] if any("cpu" in r for r in results) else None
+        kind = [SEGMENT_KINDS.index(r["kind"]) for r in results] if results and "kind" in results[0] else None
+        return cls(
+            [index_of[r["id"]] for r in results],
+            [r["start"] for r in results],
+            [r["end"] for r in results],
+            algorithm,
+            ids,
+            cpu,
+            cpus,
+            kind
+        )
+
+    def __len__(self):
+        return len(self.pid)
+
+    @property
+    def ids(self):
+        """Process IDs by pid index, generated on first use when not given"""
+        if self._ids is None:
+            self._ids = _default_ids(int(self.pid.max()) + 1 if len(self.pid) else 0)
+        return self._ids
+
+    @property
+    def nbytes(self):
+        """Memory held by the segment arrays"""
+        optional_bytes = sum(column.nbytes for column in (self.cpu, self.kind) if column is not None)
+        return self.pid.nbytes + self.start.nbytes + self.end.nbytes + optional_bytes
+
+    def runs(self):
+        """The schedule without its overhead and I/O segments (``self`` when there are none)"""
+        if self.kind is None:
+            return self
+        keep = self.kind == RUN
+        return ScheduleResult(self.pid[keep], self.start[keep], self.end[keep], self.algorithm, self.ids,
+                              None if self.cpu is None else self.cpu[keep], self.cpus)
+
+    def on_cpu(self):
+        """The segments spent on CPUs, runs and overhead, without the I/O ones (``self`` when there are none)"""
+        if self.kind is None:
+            return self
+        keep = ~np.isin(self.kind, IO_KINDS)
+        if keep.all():
+            return self
+        return ScheduleResult(self.pid[keep], self.start[keep], self.end[keep], self.algorithm, self.ids,
+                              None if self.cpu is None else self.cpu[keep], self.cpus, self.kind[keep])
+
+    def to_dicts(self):
+        """Convert to the list of result dictionaries used by the GUI"""
+        ids = self.ids[self.pid].tolist()
+        results = [
+            {"id": pid, "start": start, "end": end, "algorithm": self.algorithm}
+            for pid, start, end in zip(ids, self.start.tolist(), self.end.tolist())
+        ]
+        if self.cpu is not None:
+            for result, cpu in zip(results, self.cpu.tolist()):
+                if cpu >= 0:
+                    result["cpu"] = cpu
+        if self.kind is not None:
+            for result, kind in zip(results, self.kind.tolist()):
+                result["kind"] = SEGMENT_KINDS[kind]
+        return results
@@ -0,0 +1,455 @@
+import csv
+import json
+import os
+import warnings
+from itertools import islice
+
+import numpy as np
+from numpy.lib.format import descr_to_dtype, dtype_to_descr
+
+from algorithms import RUN
+from columnar import ProcessTable, ScheduleResult, _default_ids, pack_bursts
+
+WORKLOAD_MAGIC = b"SCHEDWL1"
+WORKLOAD_EXTENSION = ".wkl"
+SCHEDULE_MAGIC = b"SCHEDRS1"
+SCHEDULE_EXTENSION = ".sched"
+
+# Rows parsed per batch by the text readers; bounds the temporary Python objects
+CHUNK_ROWS = 65536
+# Column data in binary files starts on multiples of this many bytes
+ALIGNMENT = 64
+
+
+def write_columns(path, magic, columns, meta=None):
+    """
+    Write NumPy columns to a binary file that map_columns can memory-map
+
+    Layout: the 8-byte ``magic``, the length of a JSON header as a
+    little-endian uint64, the header (``meta`` plus each column's dtype,
+    shape and offset; dtypes use the .npy description so structured records
+    survive), then every column's raw bytes aligned to ALIGNMENT.
+    """
+    arrays = {name: np.ascontiguousarray(values) for name, values in columns.items()}
+    header = {"meta": meta or {}, "columns": {}}
+
+    # Offsets depend on the header length, so grow the reserved space until it fits
+    reserved = ALIGNMENT
+    while True:
+        offset = reserved
+        for name, values in arrays.items():
+            header["columns"][name] = {"dtype": dtype_to_descr(values.dtype), "shape": list(values.shape), "offset": offset}
+            offset += -(-values.nbytes // ALIGNMENT) * ALIGNMENT
+        encoded = json.dumps(header).encode()
+        if 16 + len(encoded) <= reserved:
+            break
+        reserved = -(-(16 + len(encoded)) // ALIGNMENT) * ALIGNMENT
+
+    with open(path, "wb") as stream:
+        stream.write(magic)
+        stream.write(len(encoded).to_bytes(8, "little"))
+        stream.write(encoded)
+        for name, values in arrays.items():
+            stream.seek(header["columns"][name]["offset"])
+            values.tofile(stream)  # Written straight from the array, without a bytes copy
+        stream.truncate(offset)
+
+def _tuples(descr):
+    """Undo JSON's conversion of a structured dtype description's tuples into lists"""
+    if isinstance(descr, list):
+        return [tuple(_tuples(part) for part in field) for field in descr]
+    return descr
+
+def map_columns(path, magic):
+    """
+    Memory-map the columns of a file written by write_columns
+
+    Nothing is read beyond the header until a column is accessed.
+
+    Returns:
+        tuple: (meta dictionary, dict of read-only arrays by column name)
+    """
+    with open(path, "rb") as stream:
+        if stream.read(len(magic)) != magic:
+            raise ValueError(f"{path} is not a {magic.decode(errors='replace')} file")
+        length = int.from_bytes(stream.read(8), "little")
+        header = json.loads(stream.read(length))
+
+    columns = {}
+    for name, column in header["columns"].items():
+        shape = tuple(column["shape"])
+        dtype = descr_to_dtype(_tuples(column["dtype"]))
+        if 0 in shape:
+            # mmap cannot map zero bytes
+            columns[name] = np.zeros(shape, dtype=dtype)
+        else:
+            columns[name] = np.memmap(path, dtype=dtype, mode="r", offset=column["offset"], shape=shape)
+    return header["meta"], columns
+
+def _numeric(values, name, default=None):
+    """
+    Convert a list of numbers or numeric strings to an int64 array, or
+    float64 if any value is not an integer
+    """
+    array = np.array(values)
+    if array.dtype.kind in "iuf":
+        return array
+    # Strings or missing values: go through text so blanks can be detected
+    values = np.array(["" if value is None else str(value) for value in values]) if array.dtype.kind == "O" else array
+    if default is not None:
+        values[values == ""] = default
+    elif len(values) and (values == "").any():
+        raise KeyError(f"workload record is missing {name!r}")
+    try:
+        return values.astype(np.int64)
+    except ValueError:
+        return values.astype(np.float64)
+
+def _burst_sequence(value):
+    """A record's burst sequence: a list, or numbers separated by spaces in a text field; None when blank"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return _numeric(value.split(), "bursts").tolist()
+    return list(value)
+
+def _build_table(chunks):
+    """
+    Concatenate (arrival, burst, priority, ids, bursts, device) chunks into
+    a ProcessTable; ``bursts`` (burst sequences by row) and ``device`` may
+    be None for a chunk without I/O
+    """
+    arrival, burst, priority, ids, sequences, device = [], [], [], [], [], []
+    for chunk in chunks:
+        for column, values in zip((arrival, burst, priority, ids, sequences, device), chunk):
+            column.append(values)
+    if not arrival:
+        return ProcessTable(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+    io = {}
+    if any(values is not None for values in sequences):
+        bursts, offsets = pack_bursts([
+            sequence for values, rows in zip(sequences, arrival)
+            for sequence in (values if values is not None else [None] * len(rows))
+        ])
+        if bursts is not None:
+            io = dict(bursts=bursts, burst_offsets=offsets, device=np.concatenate([
+                np.zeros(len(rows), dtype=np.int32) if values is None else values
+                for values, rows in zip(device, arrival)
+            ]))
+
+    ids = None if all(values is None for values in ids) else np.concatenate([
+        _default_ids(len(values)) if values is None else values for values in ids
+    ])
+    if ids is not None:
+        # Blank IDs get the default name of their row
+        blank = np.flatnonzero(ids == "")
+        if len(blank):
+            ids = ids.astype(object)
+            ids[blank] = [f"P{index + 1}" for index in blank.tolist()]
+            ids = ids.astype(str)
+    return ProcessTable(np.concatenate(arrival), np.concatenate(burst), np.concatenate(priority), ids, **io)
+
+def _csv_chunks(stream):
+    reader = csv.reader(stream)
+    header = [name.strip() for name in next(reader, [])]
+    position = {name: index for index, name in enumerate(header)}
+    for name in ("arrival", "burst"):
+        if name not in position:
+            raise KeyError(f"workload record is missing {name!r}")
+
+    while True:
+        rows = list(islice(reader, CHUNK_ROWS))
+        if not rows:
+            return
+        # Transpose the chunk into columns; short rows are padded with blanks
+        columns = list(zip(*(row + [""] * (len(header) - len(row)) for row in rows)))
+        sequences = [_burst_sequence(value) for value in columns[position["bursts"]]] if "bursts" in position else None
+        yield (
+            _numeric(columns[position["arrival"]], "arrival"),
+            _burst_column(columns[position["burst"]], sequences),
+            _numeric(columns[position["priority"]], "priority", "0") if "priority" in position
+            else np.zeros(len(rows), dtype=np.int64),
+            np.array(columns[position["id"]]) if "id" in position else None,
+            sequences,
+            _numeric(columns[position["device"]], "device", "0") if "device" in position and sequences else None,
+        )
+
+def _burst_column(values, sequences):
+    """Burst times of a chunk; a blank burst of a process with a burst sequence is its CPU total"""
+    if sequences is not None:
+        values = [
+            sum(sequence[::2]) if (value is None or value == "") and sequence is not None else value
+            for value, sequence in zip(values, sequences)
+        ]
+    return _numeric(values, "burst")
+
+def _record_chunks(batches):
+    for batch in batches:
+        if not batch:
+            continue
+        ids = [record.get("id") for record in batch]
+        sequences = [_burst_sequence(record.get("bursts")) for record in batch]
+        if not any(sequences):
+            sequences = None
+        yield (
+            _numeric([record.get("arrival") for record in batch], "arrival"),
+            _burst_column([record.get("burst") for record in batch], sequences),
+            _numeric([record.get("priority", 0) for record in batch], "priority", "0"),
+            np.array(["" if pid is None else str(pid) for pid in ids]) if any(ids) else None,
+            sequences,
+            _numeric([record.get("device", 0) for record in batch], "device", "0") if sequences else None,
+        )
+
+def _jsonl_batches(stream):
+    # Decoding a chunk of lines as one JSON array is much cheaper than one json.loads per line
+    while True:
+        lines = list(islice(stream, CHUNK_ROWS))
+        if not lines:
+            return
+        lines = [line for line in lines if line.strip()]
+        if lines:
+            yield json.loads("[" + ",".join(lines) + "]")
+
+def _integral(column):
+    """Return a float column as int64 when every value is a whole number that fits exactly"""
+    if len(column) and np.all(column == np.floor(column)) and np.abs(column).max() < 2**53:
+        return column.astype(np.int64)
+    return column
+
+def _read_csv_fast(path, position):
+    """Parse a well-formed CSV with numpy's C reader; raises ValueError on anything irregular"""
+    names = [name for name in ("arrival", "burst", "priority") if name in position]
+    with warnings.catch_warnings():
+        # An empty body is fine, it just yields empty columns
+        warnings.simplefilter("ignore")
+        options = dict(delimiter=",", skiprows=1, comments=None, ndmin=2, encoding="utf-8")
+        usecols = [position[name] for name in names]
+        try:
+            values = np.loadtxt(path, usecols=usecols, dtype=np.int64, **options)
+        except ValueError:
+            values = np.loadtxt(path, usecols=usecols, dtype=np.float64, **options)
+            values = [_integral(values[:, column]) for column in range(len(names))]
+        else:
+            values = [values[:, column] for column in range(len(names))]
+        columns = dict(zip(names, values))
+        ids = np.loadtxt(path, usecols=[position["id"]], dtype=str, **options)[:, 0] if "id" in position else None
+    return _build_table([(
+        columns["arrival"], columns["burst"],
+        columns.get("priority", np.zeros(len(columns["arrival"]), dtype=np.int64)),
+        ids if ids is None or (ids != "").any() else None,
+        None,
+        None,
+    )])
+
+def read_csv(path):
+    """
+    Parse a CSV workload (``arrival``, ``burst``, optional ``id`` / ``priority``
+    and ``bursts`` / ``device`` for processes doing I/O) into a ProcessTable
+    """
+    with open(path, newline="") as stream:
+        header = [name.strip() for name in next(csv.reader(stream), [])]
+    position = {name: index for index, name in enumerate(header)}
+    if "arrival" in position and "burst" in position and "bursts" not in position:
+        try:
+            return _read_csv_fast(path, position)
+        except ValueError:
+            pass  # Blank fields, quoting or ragged rows: use the csv module below
+
+    with open(path, newline="") as stream:
+        return _build_table(_csv_chunks(stream))
+
+def read_jsonl(path):
+    """Parse a JSON lines workload, one process object per line, into a ProcessTable"""
+    with open(path) as stream:
+        return _build_table(_record_chunks(_jsonl_batches(stream)))
+
+def read_json(path):
+    """Parse a JSON array of process objects into a ProcessTable"""
+    with open(path) as stream:
+        records = json.load(stream)
+    return _build_table(_record_chunks(records[i:i + CHUNK_ROWS] for i in range(0, len(records), CHUNK_ROWS)))
+
+def read_parquet(path):
+    """Read a Parquet workload; needs the optional pyarrow package"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading Parquet workloads requires pyarrow (pip install pyarrow)") from None
+    table = pq.read_table(path)
+    names = set(table.column_names)
+    column = lambda name: table.column(name).to_numpy()
+    bursts, offsets = pack_bursts(table.column("bursts").to_pylist()) if "bursts" in names else (None, None)
+    return ProcessTable(
+        column("arrival"),
+        column("burst"),
+        column("priority") if "priority" in names else None,
+        column("id").astype(str) if "id" in names else None,
+        bursts,
+        offsets,
+        column("device") if "device" in names and bursts is not None else None,
+    )
+
+def save_workload(table, path):
+    """
+    Save a ProcessTable in the binary workload format
+
+    The columns are stored raw, so load_workload can memory-map them
+    instead of parsing. Default IDs (P1..Pn) are not stored.
+    """
+    columns = {"arrival": table.arrival, "burst": table.burst, "priority": table.priority}
+    if table._ids is not None:
+        columns["ids"] = table._ids.astype(str)
+    columns.update(_io_columns(table))
+    write_columns(path, WORKLOAD_MAGIC, columns, {"count": len(table)})
+
+def _io_columns(table):
+    """The burst sequence columns of a table that does I/O, for write_columns"""
+    if not table.has_io:
+        return {}
+    return {"bursts": table.bursts, "burst_offsets": table.burst_offsets, "device": table.device}
+
+def _table(columns, ids=None):
+    """Rebuild a ProcessTable from mapped columns"""
+    return ProcessTable(columns["arrival"], columns["burst"], columns["priority"],
+                        columns.get("ids") if ids is None else ids,
+                        columns.get("bursts"), columns.get("burst_offsets"), columns.get("device"))
+
+def load_workload(path):
+    """
+    Load a workload file into a ProcessTable, choosing the format by extension
+
+    Supported: ``.wkl`` (binary, memory-mapped, see save_workload), ``.csv``,
+    ``.jsonl`` / ``.ndjson``, ``.json`` and ``.parquet`` (with pyarrow).
+    Text formats are parsed CHUNK_ROWS records at a time into columns. CSV
+    needs no per-process objects; JSON records are decoded to dictionaries,
+    but only one chunk of them exists at a time.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == WORKLOAD_EXTENSION:
+        _, columns = map_columns(path, WORKLOAD_MAGIC)
+        return _table(columns)
+    if extension in (".jsonl", ".ndjson"):
+        return read_jsonl(path)
+    if extension == ".json":
+        return read_json(path)
+    if extension == ".parquet":
+        return read_parquet(path)
+    return read_csv(path)
+
+def save_schedule(results, path, processes=None):
+    """
+    Save a schedule as fixed-width segment records with a pid dictionary and index
+
+    The file holds one ``(pid, start, end)`` record per segment in schedule
+    order, the process IDs by pid index, and a per-pid index (segment
+    positions grouped by pid plus offsets into them) so one process's slices
+    can be read without scanning the file. Multi-CPU schedules add a column
+    with the CPU of every segment and schedules with scheduling overhead a
+    column with its kind, as do schedules with I/O; the index only covers
+    run segments. See ScheduleFile.
+
+    Args:
+        results: Result dictionaries or a ScheduleResult
+        path (str): File to write, conventionally ending in SCHEDULE_EXTENSION
+        processes (optional): The simulated workload. Its arrival, burst and
+            priority columns, and any burst sequences and devices, are stored
+            next to the pid dictionary so that metrics can be computed from
+            the file alone.
+    """
+    if not isinstance(results, ScheduleResult):
+        ids = processes.ids if isinstance(processes, ProcessTable) else (
+            [p["id"] for p in processes] if processes is not None else None)
+        results = ScheduleResult.from_dicts(results, ids)
+    if processes is not None and not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_dicts(processes)
+    ids = processes.ids if processes is not None else results.ids
+    count = len(ids)
+
+    time_type = np.result_type(results.start, results.end)
+    records = np.empty(len(results), dtype=[("pid", "<i4"), ("start", time_type), ("end", time_type)])
+    records["pid"] = results.pid
+    records["start"] = results.start
+    records["end"] = results.end
+
+    # Per-pid index: run segment positions grouped by pid (in time order within a pid)
+    position_type = np.uint32 if len(results) < 2**32 else np.int64
+    if results.kind is None:
+        by_pid = np.argsort(results.pid, kind="stable")
+        indexed = results.pid
+    else:
+        runs = np.flatnonzero(results.kind == RUN)
+        by_pid = runs[np.argsort(results.pid[runs], kind="stable")]
+        indexed = results.pid[runs]
+    by_pid = by_pid.astype(position_type)
+    offsets = np.r_[0, np.cumsum(np.bincount(indexed, minlength=count))].astype(np.int64)
+
+    columns = {"segments": records, "ids": np.asarray(ids).astype(str), "by_pid": by_pid, "offsets": offsets}
+    if results.cpu is not None:
+        columns["cpu"] = results.cpu
+    if results.kind is not None:
+        columns["kind"] = results.kind
+    if processes is not None:
+        columns.update(arrival=processes.arrival, burst=processes.burst, priority=processes.priority)
+        columns.update(_io_columns(processes))
+    write_columns(path, SCHEDULE_MAGIC, columns,
+                  {"algorithm": results.algorithm, "segments": len(results), "cpus": results.cpus})
+
+class ScheduleFile:
+    """
+    Read-only, memory-mapped view of a file written by save_schedule
+
+    Opening the file only reads its header. ``result`` is a ScheduleResult
+    whose arrays point into the mapped records, so metrics and the Gantt
+    view work on it without copying the segments, and ``segments`` reads
+    one process's slices through the per-pid index.
+
+    Args:
+        path (str): Schedule file to open
+    """
+
+    def __init__(self, path):
+        meta, columns = map_columns(path, SCHEDULE_MAGIC)
+        self.path = path
+        self.algorithm = meta["algorithm"]
+        self.records = columns["segments"]
+        self.ids = columns["ids"]
+        self._by_pid = columns["by_pid"]
+        self._offsets = columns["offsets"]
+        self._index_of = None
+        # Multi-CPU schedules keep the CPU of each segment in a column of its own, overhead its kind
+        self.result = ScheduleResult(self.records["pid"], self.records["start"], self.records["end"],
+                                     self.algorithm, self.ids, columns.get("cpu"), meta.get("cpus"),
+                                     columns.get("kind"))
+        # The workload is only present when it was saved with the schedule
+        self.workload = None
+        if "arrival" in columns:
+            self.workload = _table(columns, self.ids)
+
+    def __len__(self):
+        return len(self.records)
+
+    def pid_of(self, process_id):
+        """Pid index of a process ID"""
+        if self._index_of is None:
+            self._index_of = {pid: index for index, pid in enumerate(self.ids.tolist())}
+        return self._index_of[process_id]
+
+    def segments(self, process):
+        """
+        Run slices of one process, in time order
+
+        Args:
+            process: Pid index (int) or process ID (str)
+
+        Returns:
+            tuple: (start, end) arrays
+        """
+        pid = self.pid_of(process) if isinstance(process, str) else process
+        positions = self._by_pid[self._offsets[pid]:self._offsets[pid + 1]]
+        records = self.records[positions]
+        return records["start"], records["end"]
+
+def load_schedule(path):
+    """Open a schedule written by save_schedule; see ScheduleFile"""
+    return ScheduleFile(path)
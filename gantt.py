@@ -0,0 +1,362 @@
+import numpy as np
+import tkinter as tk
+from tkinter import ttk
+
+from algorithms import OVERHEAD_KINDS, RUN
+from metrics import to_columnar
+
+# Drawing budgets that keep Gantt rendering time independent of the schedule size
+GANTT_MAX_TICKS = 20          # Upper bound on x ticks and gridlines
+GANTT_MIN_LABEL_PIXELS = 24   # Slices narrower than this get no process label
+GANTT_MAX_LABELS = 200        # Upper bound on process labels, widest slices first
+GANTT_OVERHEAD_COLOR = "0.35"  # Gray for context-switch, dispatch and cache-warmup segments
+
+
+def time_origin(*columns):
+    """
+    Origin the views measure times from: the earliest time for integer timestamps, 0 for floats
+
+    Plotting converts times to float64, whose spacing near a nanosecond
+    epoch timestamp (about 1.8e18) is 256 ns. Integer times are drawn as
+    int64 offsets from this origin instead, which stay exact and small.
+    """
+    columns = [np.asarray(column) for column in columns if len(column)]
+    if not columns or not all(np.issubdtype(column.dtype, np.integer) for column in columns):
+        return 0
+    return min(column.min().item() for column in columns)
+
+def time_label(origin):
+    """Time axis title for offsets from ``origin``"""
+    return f"Time (+{origin})" if origin else "Time"
+
+def dominant_runs(pid, start, end, t0, t1, columns):
+    """
+    Level-of-detail aggregate of one Gantt lane
+
+    Splits ``[t0, t1)`` into ``columns`` equal pixel columns, picks the pid
+    that occupies each column for the most time and merges neighbouring
+    columns with the same pid into runs. Idle columns stay empty. Segments
+    must not overlap (one lane). Runs in O(segments + columns) array work.
+
+    Returns:
+        tuple: (pid, start, end) arrays of the aggregated runs
+    """
+    width = (t1 - t0) / columns
+    first = np.clip((start - t0) // width, 0, columns - 1).astype(np.int64)
+    last = np.clip((end - t0) // width, 0, columns - 1).astype(np.int64)
+
+    # Expand every segment into the columns it touches; a lane crosses each
+    # column boundary at most once, so this is at most segments + columns pairs
+    counts = last - first + 1
+    segment = np.repeat(np.arange(len(pid)), counts)
+    column = np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    column_start = t0 + column * width
+    overlap = np.minimum(end[segment], column_start + width) - np.maximum(start[segment], column_start)
+    keep = overlap > 0
+    column, owner, overlap = column[keep], pid[segment][keep], overlap[keep]
+    if not len(column):
+        return pid[:0], start[:0], end[:0]
+
+    # Total time per (column, pid) pair, then the largest total per column
+    pid_count = int(pid.max()) + 1
+    pairs, inverse = np.unique(column * pid_count + owner, return_inverse=True)
+    totals = np.bincount(inverse, weights=overlap)
+    order = np.lexsort((totals, pairs // pid_count))
+    pair_column, pair_pid = pairs[order] // pid_count, pairs[order] % pid_count
+    dominant = np.r_[pair_column[1:] != pair_column[:-1], True]
+    column, owner = pair_column[dominant], pair_pid[dominant]
+
+    # Merge neighbouring columns owned by the same pid
+    run_start = np.r_[True, (np.diff(column) != 1) | (owner[1:] != owner[:-1])]
+    starts = np.flatnonzero(run_start)
+    run_last = column[np.r_[starts[1:] - 1, len(column) - 1]]
+    return owner[starts], t0 + column[starts] * width, t0 + (run_last + 1) * width
+
+def split_lanes(results, overhead=False, origin=0):
+    """
+    Segments of each Gantt lane: one lane per CPU for a multi-CPU schedule
+
+    Args:
+        results: ScheduleResult
+        overhead (bool): Split the scheduling overhead segments instead of
+            the run segments
+        origin (optional): Time subtracted from the starts and ends, see time_origin
+
+    Returns:
+        list: (pid, start, end) arrays per lane, indexed by CPU number;
+        empty for ``overhead`` when the schedule has no overhead
+    """
+    pid, start, end, cpu = results.pid, results.start, results.end, results.cpu
+    if results.kind is None:
+        if overhead:
+            return []
+    else:
+        # I/O segments belong to no lane
+        keep = np.isin(results.kind, OVERHEAD_KINDS) if overhead else results.kind == RUN
+        if overhead and not keep.any():
+            return []
+        pid, start, end = pid[keep], start[keep], end[keep]
+        cpu = None if cpu is None else cpu[keep]
+    if origin:
+        start, end = start - origin, end - origin
+    if cpu is None:
+        return [(pid, start, end)]
+    order = np.argsort(cpu, kind="stable")
+    bounds = np.r_[0, np.cumsum(np.bincount(cpu, minlength=results.cpus))]
+    pid, start, end = pid[order], start[order], end[order]
+    return [(pid[low:high], start[low:high], end[low:high]) for low, high in zip(bounds[:-1], bounds[1:])]
+
+def lane_position(lane, lanes):
+    """y coordinate of a lane; CPU 0 is drawn at the top"""
+    return lanes - 1 - lane
+
+def draw_segments(ax, ids, pid, start, end, t0, t1, columns, colormap, y_pos=0, height=0.8,
+                  max_labels=GANTT_MAX_LABELS, facecolor=None):
+    """
+    Draw one Gantt lane for the time window ``[t0, t1]``
+
+    All blocks go into one ``broken_barh`` collection and only slices wide
+    enough to read get a label. When there are more segments than pixel
+    columns, the per-column aggregate from dominant_runs is drawn instead,
+    so the number of artists is bounded by the axes width.
+
+    Args:
+        ax: Matplotlib axes to draw on
+        ids: Process IDs by pid index, also used to spread the colors
+        pid, start, end: Segment arrays, already limited to the window if desired
+        t0, t1: Visible time window
+        columns (int): Width of the axes in pixels
+        colormap: Matplotlib colormap for the process colors
+        y_pos, height: Center and height of the lane
+        max_labels (int): Upper bound on process labels in this lane
+        facecolor (optional): One color for every block instead of the
+            process colors; such blocks get no labels (used for overhead)
+
+    Returns:
+        list: The artists that were added
+    """
+    if not len(pid):
+        return []
+
+    # Zoomed out: replace the segments by their per-pixel-column aggregate
+    aggregated = len(pid) > columns
+    if aggregated:
+        pid, start, end = dominant_runs(pid, start, end, t0, t1, columns)
+
+    # Draw every block in one collection, colored by process index
+    colors = colormap(0.3 + 0.7 * (pid / max(1, len(ids) - 1))) if facecolor is None else facecolor
+    artists = [ax.broken_barh(np.column_stack([start, end - start]), (y_pos - height/2, height),
+                              facecolors=colors, edgecolor='black', linewidth=0 if aggregated else 1, alpha=0.7)]
+    if facecolor is not None:
+        return artists
+
+    # Label only the slices wide enough to read, widest first
+    pixels_per_unit = columns / (t1 - t0) if t1 > t0 else 0
+    visible = np.minimum(end, t1) - np.maximum(start, t0)
+    wide = np.flatnonzero(visible * pixels_per_unit >= GANTT_MIN_LABEL_PIXELS)
+    wide = wide[np.argsort(-visible[wide], kind="stable")[:max_labels]]
+    centers = (np.maximum(start[wide], t0) + np.minimum(end[wide], t1)) / 2
+    for label, center in zip(ids[pid[wide]].tolist(), centers.tolist()):
+        artists.append(ax.text(center, y_pos, label,
+                               ha='center', va='center', fontsize=9,
+                               fontweight='bold', color='black'))
+    return artists
+
+def style_gantt_axes(ax, lanes=1, integer=True, origin=0):
+    """
+    Shared axis styling: a capped number of x ticks and gridlines, CPU names on the y axis for several lanes
+
+    Ticks fall on whole time units for integer timestamps; pass
+    ``integer=False`` for float times, which may span less than one unit.
+    ``origin`` is the time the x axis counts from, named in its title.
+    """
+    from matplotlib.ticker import MaxNLocator
+
+    if lanes == 1:
+        ax.set_ylim(-1, 1)
+        ax.set_yticks([])
+    else:
+        ax.set_ylim(-0.6, lanes - 0.4)
+        ax.set_yticks([lane_position(lane, lanes) for lane in range(lanes)])
+        ax.set_yticklabels([f"CPU {lane}" for lane in range(lanes)], fontsize=8 if lanes <= 16 else 6)
+    ax.set_ylabel('')
+    ax.xaxis.set_major_locator(MaxNLocator(nbins=GANTT_MAX_TICKS, integer=integer))
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+    ax.set_xlabel(time_label(origin))
+
+class SegmentIndex:
+    """
+    Viewport index over schedule segments
+
+    Segments are kept sorted by start time next to a running maximum of
+    their end times, so the segments intersecting a time window are found
+    with two binary searches: O(log n + k) per query for k hits.
+    """
+
+    def __init__(self, pid, start, end):
+        order = np.argsort(start, kind="stable")
+        self.pid = pid[order]
+        self.start = start[order]
+        self.end = end[order]
+        self._max_end = np.maximum.accumulate(self.end) if len(order) else self.end
+
+    def __len__(self):
+        return len(self.pid)
+
+    def query(self, t0, t1):
+        """Return the (pid, start, end) arrays of the segments intersecting ``(t0, t1)``"""
+        first = np.searchsorted(self._max_end, t0, side="right")
+        last = max(first, np.searchsorted(self.start, t1, side="left"))
+        pid, start, end = self.pid[first:last], self.start[first:last], self.end[first:last]
+        # Only overlapping lanes can leave segments that ended before t0 in the slice
+        inside = end > t0
+        if not inside.all():
+            pid, start, end = pid[inside], start[inside], end[inside]
+        return pid, start, end
+
+class GanttViewer:
+    """
+    Zoomable, pannable Gantt chart embedded in a Tk frame
+
+    The mouse wheel zooms around the pointer, dragging pans and a double
+    click resets the view. Each redraw only draws the segments that
+    intersect the visible window, found through a SegmentIndex and
+    aggregated per pixel column when needed, so navigation stays smooth on
+    schedules with millions of segments. A multi-CPU schedule gets one lane
+    (and one SegmentIndex) per CPU. Views, zoom and the index work on
+    offsets from ``origin`` (see time_origin), so nanosecond timestamps
+    zoom down to single nanoseconds.
+
+    Args:
+        frame: Tk container to pack the chart into
+        results: Result dictionaries or a ScheduleResult
+        colormap: Matplotlib colormap for the process colors
+        title (str, optional): Chart title
+    """
+
+    ZOOM_STEP = 1.25
+
+    def __init__(self, frame, results, colormap, title=None):
+        # matplotlib is only loaded once a chart is actually drawn
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.results, _ = to_columnar(results)
+        self.ids = self.results.ids
+        self.colormap = colormap
+        self.origin = time_origin(self.results.start)
+        self.lanes = [SegmentIndex(*lane) for lane in split_lanes(self.results, origin=self.origin)]
+        self.overhead = [SegmentIndex(*lane) for lane in split_lanes(self.results, overhead=True, origin=self.origin)]
+        if len(self.results):
+            self.bounds = ((self.results.start.min() - self.origin).item(),
+                           (self.results.end.max() - self.origin).item())
+        else:
+            self.bounds = (0, 1)
+        self.view = self.bounds
+        self._artists = []
+        self._redraw_pending = False
+        self._drag = None
+
+        # Toolbar with explicit navigation buttons next to the mouse controls
+        toolbar = ttk.Frame(frame)
+        toolbar.pack(fill=tk.X)
+        ttk.Button(toolbar, text="Zoom In", command=lambda: self.zoom(1 / self.ZOOM_STEP)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(toolbar, text="Zoom Out", command=lambda: self.zoom(self.ZOOM_STEP)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(toolbar, text="Reset View", command=self.reset).pack(side=tk.LEFT, padx=2)
+        ttk.Label(toolbar, text="Scroll to zoom, drag to pan").pack(side=tk.RIGHT, padx=5)
+
+        self.figure = Figure(figsize=(10, 4 if len(self.lanes) <= 4 else min(2 + 0.4 * len(self.lanes), 12)), dpi=100)
+        self.ax = self.figure.add_subplot(111)
+        style_gantt_axes(self.ax, len(self.lanes), integer=np.issubdtype(self.results.start.dtype, np.integer),
+                         origin=self.origin)
+        if title:
+            self.ax.set_title(title, pad=20)
+
+        self.canvas = FigureCanvasTkAgg(self.figure, frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect("scroll_event", self._on_scroll)
+        self.canvas.mpl_connect("button_press_event", self._on_press)
+        self.canvas.mpl_connect("motion_notify_event", self._on_motion)
+        self.canvas.mpl_connect("button_release_event", self._on_release)
+        self.canvas.mpl_connect("resize_event", lambda event: self._schedule_redraw())
+
+        self._redraw()
+
+    def set_view(self, t0, t1):
+        """Show the time window ``[t0, t1]`` (offsets from ``origin``), kept inside the schedule's bounds"""
+        low, high = self.bounds
+        span = high - low or 1
+        # Never zoom in past a tiny fraction of the schedule or out past all of it
+        width = min(max(t1 - t0, span * 1e-9), span)
+        t0 = min(max(t0, low), high - width) if width < span else low
+        self.view = (t0, t0 + width)
+        self._schedule_redraw()
+
+    def zoom(self, factor, center=None):
+        """Scale the visible window by ``factor`` around ``center`` (default: the middle)"""
+        t0, t1 = self.view
+        if center is None:
+            center = (t0 + t1) / 2
+        self.set_view(center - (center - t0) * factor, center + (t1 - center) * factor)
+
+    def pan(self, delta):
+        """Move the visible window by ``delta`` time units"""
+        t0, t1 = self.view
+        self.set_view(t0 + delta, t1 + delta)
+
+    def reset(self):
+        """Show the whole schedule"""
+        self.set_view(*self.bounds)
+
+    def _schedule_redraw(self):
+        # Coalesce bursts of wheel and drag events into one redraw
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.canvas.get_tk_widget().after_idle(self._redraw)
+
+    def _redraw(self):
+        self._redraw_pending = False
+        for artist in self._artists:
+            artist.remove()
+
+        t0, t1 = self.view
+        columns = max(1, int(self.ax.bbox.width))
+        lanes = len(self.lanes)
+        self._artists = []
+        for lane, index in enumerate(self.lanes):
+            pid, start, end = index.query(t0, t1)
+            self._artists.extend(draw_segments(self.ax, self.ids, pid, start, end, t0, t1, columns, self.colormap,
+                                               y_pos=lane_position(lane, lanes),
+                                               max_labels=max(1, GANTT_MAX_LABELS // lanes)))
+        # Scheduling overhead: thinner gray blocks without labels in the same lanes
+        for lane, index in enumerate(self.overhead):
+            pid, start, end = index.query(t0, t1)
+            self._artists.extend(draw_segments(self.ax, self.ids, pid, start, end, t0, t1, columns, self.colormap,
+                                               y_pos=lane_position(lane, lanes), height=0.4,
+                                               facecolor=GANTT_OVERHEAD_COLOR))
+
+        margin = (t1 - t0) * 0.01
+        self.ax.set_xlim(t0 - margin, t1 + margin)
+        self.canvas.draw_idle()
+
+    def _on_scroll(self, event):
+        if event.inaxes is self.ax:
+            self.zoom(1 / self.ZOOM_STEP if event.button == "up" else self.ZOOM_STEP, event.xdata)
+
+    def _on_press(self, event):
+        if event.inaxes is not self.ax:
+            return
+        if event.dblclick:
+            self.reset()
+        else:
+            self._drag = (event.x, self.view)
+
+    def _on_motion(self, event):
+        if self._drag is None or event.x is None:
+            return
+        press_x, (t0, t1) = self._drag
+        delta = (press_x - event.x) * (t1 - t0) / max(1.0, self.ax.bbox.width)
+        self.set_view(t0 + delta, t1 + delta)
+
+    def _on_release(self, event):
+        self._drag = None
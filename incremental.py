@@ -0,0 +1,176 @@
+from bisect import bisect_left
+from collections import OrderedDict
+
+import numpy as np
+
+from algorithms import SCHEDULERS, _with_progress, checkpointed_segments, start_simulation
+from columnar import ProcessTable, ScheduleResult
+
+
+def workload_edit(old, new):
+    """
+    Describe how ProcessTable ``new`` differs from ``old``
+
+    Returns:
+        tuple: ("same",), ("append", arrival) when one process was added at
+        the end, ("remove", row, arrival) when row ``row`` of ``old`` was
+        removed, or None for any other change. IDs are not compared: they
+        only label the results.
+    """
+    old_columns = (old.arrival, old.burst, old.priority)
+    new_columns = (new.arrival, new.burst, new.priority)
+    if len(new) == len(old):
+        if all(np.array_equal(a, b) for a, b in zip(old_columns, new_columns)):
+            return ("same",)
+        return None
+    if len(new) == len(old) + 1:
+        if all(np.array_equal(a, b[:-1]) for a, b in zip(old_columns, new_columns)):
+            return ("append", new.arrival[-1].item())
+        return None
+    if len(new) == len(old) - 1:
+        # The removed row is the first one where the columns disagree
+        differs = np.zeros(len(new), dtype=bool)
+        for a, b in zip(old_columns, new_columns):
+            differs |= a[:-1] != b
+        row = int(np.argmax(differs)) if differs.any() else len(new)
+        if all(np.array_equal(a[row + 1:], b[row:]) for a, b in zip(old_columns, new_columns)):
+            return ("remove", row, old.arrival[row].item())
+    return None
+
+def _remap(checkpoint, removed):
+    """Rewrite a checkpoint's pid indices after the rows in ``removed`` were deleted, in order"""
+    if not removed:
+        return checkpoint
+    tuples = {}
+
+    def process_after(process):
+        # One new tuple per process, so identity checks in the cores keep working
+        if process[0] not in tuples:
+            index = process[0]
+            for row in removed:
+                index -= index > row
+            tuples[process[0]] = (index,) + process[1:]
+        return tuples[process[0]]
+
+    running = checkpoint.running
+    if running is not None:
+        running = (process_after(running[0]),) + tuple(running[1:])
+    ready = [(process_after(process), remaining) for process, remaining in checkpoint.ready]
+    return checkpoint._replace(ready=ready, running=running)
+
+class _Run:
+    """Last schedule of one configuration with the checkpoints recorded while producing it"""
+
+    def __init__(self, table, result, checkpoints, epochs, removed):
+        self.table = table
+        self.result = result
+        self.checkpoints = checkpoints  # In time order
+        self.epochs = epochs            # Per checkpoint: len(removed) when it was recorded
+        self.removed = removed          # Rows deleted since the oldest checkpoint, in order
+
+class IncrementalSimulator:
+    """
+    Re-simulates only the part of a schedule an edit can affect
+
+    The last run of each (algorithm, time_quantum, merge_slices)
+    configuration is kept together with Checkpoints of the scheduler state
+    at event boundaries. When the next workload differs by one appended or
+    removed process arriving at time ``a``, the simulation resumes from the
+    last checkpoint taken before ``a`` and the new tail is spliced onto the
+    unchanged prefix of the previous schedule, so the cost is proportional
+    to the affected suffix. Any other change runs the whole simulation, as
+    does every multi-CPU run, every run with scheduling overhead and every
+    algorithm whose engine does not record checkpoints.
+
+    ``simulate`` has the signature of start_simulation (without streaming)
+    and can be given to ResultCache as its runner.
+
+    Args:
+        max_runs (int): Number of configurations remembered
+    """
+
+    def __init__(self, max_runs=8):
+        self.max_runs = max_runs
+        self.resumed_from = None  # Time of the checkpoint used by the last simulate call, None if it ran in full
+        self._runs = OrderedDict()
+
+    def simulate(self, processes, algorithm="fcfs", time_quantum=None, merge_slices=False, progress=None,
+                 cpus=1, run_queues="global", overhead=None):
+        """Simulate ``processes``, reusing the previous schedule of this configuration where possible"""
+        scheduler = SCHEDULERS.get(algorithm)
+        as_dicts = not isinstance(processes, ProcessTable)
+        table = ProcessTable.from_dicts(processes) if as_dicts else processes
+        # Checkpoints hold no device queues, so workloads doing I/O run in full
+        if cpus != 1 or overhead is not None or scheduler is None or not scheduler.checkpoints or table.has_io:
+            self.resumed_from = None
+            return start_simulation(processes, algorithm, time_quantum, merge_slices, progress=progress,
+                                    cpus=cpus, run_queues=run_queues, overhead=overhead)
+        config = (algorithm, time_quantum, bool(merge_slices))
+        previous = self._runs.pop(config, None)
+        self.resumed_from = None
+
+        edit = workload_edit(previous.table, table) if previous is not None else None
+        if edit is not None and edit[0] == "same":
+            run = _Run(table, previous.result, previous.checkpoints, previous.epochs, previous.removed)
+            result = ScheduleResult(previous.result.pid, previous.result.start, previous.result.end,
+                                    algorithm, table.ids)
+            if progress is not None:
+                progress(len(result), 1.0)
+        else:
+            run, result = self._run(table, algorithm, time_quantum, merge_slices, progress, previous, edit)
+
+        self._runs[config] = run
+        while len(self._runs) > self.max_runs:
+            self._runs.popitem(last=False)
+        return result.to_dicts() if as_dicts else result
+
+    def _run(self, table, algorithm, time_quantum, merge_slices, progress, previous, edit):
+        # Find the last checkpoint strictly before the edited arrival; every
+        # decision before it is unaffected by the edit
+        kept, state, removed = 0, None, []
+        if edit is not None:
+            arrival = edit[-1]
+            times = [checkpoint.time for checkpoint in previous.checkpoints]
+            kept = bisect_left(times, arrival)
+            removed = previous.removed + ([edit[1]] if edit[0] == "remove" else [])
+            if kept:
+                epoch = previous.epochs[kept - 1]
+                state = _remap(previous.checkpoints[kept - 1], removed[epoch:])
+                kept -= 1  # The resumed run records this checkpoint again
+
+        if state is None:
+            checkpoints, epochs, removed, prefix = [], [], [], 0
+        else:
+            checkpoints = previous.checkpoints[:kept]
+            epochs = previous.epochs[:kept]
+            prefix = state.emitted
+            self.resumed_from = state.time
+
+        # Segments of the previous schedule before the checkpoint carry over,
+        # with pid indices shifted past any removed row
+        old = previous.result if prefix else None
+        prefix_pid = old.pid[:prefix].astype(np.int64) if old is not None else np.zeros(0, dtype=np.int64)
+        if old is not None and edit[0] == "remove":
+            prefix_pid -= prefix_pid > edit[1]
+
+        recorded = []
+        segments = checkpointed_segments(table, algorithm, time_quantum, merge_slices, state, recorded)
+        if progress is not None:
+            done = (old.end[:prefix] - old.start[:prefix]).sum() if old is not None else 0
+            segments = _with_progress(segments, progress, table.burst.sum() - done)
+        indices, starts, ends = [], [], []
+        for process, start, end in segments:
+            indices.append(process[0])
+            starts.append(start)
+            ends.append(end)
+
+        tail_start, tail_end = np.asarray(starts), np.asarray(ends)
+        if old is not None:
+            tail_start = np.concatenate([old.start[:prefix], tail_start]) if len(starts) else old.start[:prefix]
+            tail_end = np.concatenate([old.end[:prefix], tail_end]) if len(ends) else old.end[:prefix]
+        result = ScheduleResult(np.concatenate([prefix_pid, np.asarray(indices, dtype=np.int64)]),
+                                tail_start, tail_end, algorithm, table.ids)
+
+        epochs.extend([len(removed)] * len(recorded))
+        checkpoints.extend(recorded)
+        return _Run(table, result, checkpoints, epochs, removed), result
@@ -0,0 +1,325 @@
+import numpy as np
+
+from algorithms import IO, IO_WAIT, OVERHEAD_KINDS
+from columnar import ProcessTable, ScheduleResult
+from quantiles import QuantileSketch, percentile_summary
+from stream_metrics import THROUGHPUT_WINDOWS, initial_window, jain_index, overhead_fraction
+
+
+def to_columnar(results, processes=None, cpus=None):
+    """
+    Convert results and an optional workload to a ScheduleResult and a
+    ProcessTable whose pid indices agree
+
+    ``cpus``, the number of simulated CPUs, is passed on to
+    ScheduleResult.from_dicts for result dictionaries.
+    """
+    if processes is not None and not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_dicts(processes)
+    if not isinstance(results, ScheduleResult):
+        results = ScheduleResult.from_dicts(results, None if processes is None else processes.ids, cpus)
+    return results, processes
+
+def context_switches(results):
+    """
+    Number of times each process was switched in, by pid index
+
+    A segment starts with a context switch when the previous segment on
+    its CPU belongs to another process and the CPU did not go idle in
+    between. With simulated overhead the switch is counted at the first
+    overhead segment of the incoming process, so a process preempted before
+    it ran still counts the switch the CPU paid for. Without overhead this
+    is the number of times another process's slice was directly followed
+    by one of this process.
+    """
+    results = results.on_cpu()
+    lane = results.cpu if results.cpu is not None else np.zeros(len(results), dtype=np.int16)
+    order = np.lexsort((results.end, results.start, lane))
+    lane, start, end, pid = lane[order], results.start[order], results.end[order], results.pid[order]
+
+    # Back-to-back segments on one CPU that change process
+    if not len(pid):
+        return np.zeros(len(results.ids), dtype=np.int64)
+    switched = np.r_[False, (lane[1:] == lane[:-1]) & (start[1:] <= end[:-1]) & (pid[1:] != pid[:-1])]
+    return np.bincount(pid[switched], minlength=len(results.ids))
+
+def overhead_time(results):
+    """Time spent on scheduling overhead on behalf of each process, by pid index"""
+    return _time_of(results, OVERHEAD_KINDS)
+
+def io_time(results):
+    """Time each process spent blocked on I/O, queued for its device or being served, by pid index"""
+    return _time_of(results, (IO_WAIT, IO))
+
+def io_wait_time(results):
+    """Time each process's I/O requests spent queued behind other requests for the device, by pid index"""
+    return _time_of(results, (IO_WAIT,))
+
+def _sum_by(index, values, length):
+    """Sum ``values`` into ``length`` bins by ``index``, in the dtype of ``values``"""
+    if not np.issubdtype(values.dtype, np.integer):
+        return np.bincount(index, weights=values, minlength=length)
+    # bincount sums in float64, which is inexact past 2**53 (nanosecond timestamps get there)
+    totals = np.zeros(max(length, index.max() + 1 if len(index) else 0), dtype=values.dtype)
+    np.add.at(totals, index, values)
+    return totals
+
+def _time_of(results, kinds):
+    # Total length of each process's segments of the given kinds
+    durations = results.end - results.start
+    if results.kind is None:
+        return np.zeros(len(results.ids), dtype=durations.dtype)
+    keep = np.isin(results.kind, kinds)
+    return _sum_by(results.pid[keep], durations[keep], len(results.ids))
+
+def device_busy_time(results, processes=None):
+    """
+    Time each I/O device spent serving requests, as an array indexed by device number
+
+    The device of a request is its process's device in ``processes``
+    (a ProcessTable); without a workload every request counts for device 0.
+    """
+    if results.kind is None:
+        return np.zeros(0)
+    served = results.kind == IO
+    device = np.zeros(served.sum(), dtype=np.int64)
+    if processes is not None and processes.device is not None:
+        device = processes.device[results.pid[served]]
+    return _sum_by(device, (results.end - results.start)[served], 0)
+
+def device_utilization(results, processes=None):
+    """
+    Fraction of the makespan each I/O device was busy
+
+    Args:
+        results: ScheduleResult or list of result dictionaries
+        processes: Optional workload supplying the real arrival times and
+            the device of every process
+
+    Returns:
+        numpy.ndarray: Utilization by device number; empty without I/O
+    """
+    results, processes = to_columnar(results, processes)
+    busy_time = device_busy_time(results, processes)
+    if not len(busy_time):
+        return busy_time
+    runs = results.runs()
+    first_arrival = processes.arrival[np.unique(runs.pid)].min() if processes is not None else runs.start.min()
+    makespan = runs.end.max() - first_arrival
+    return busy_time / makespan if makespan > 0 else np.ones(len(busy_time))
+
+def process_metrics(results, processes=None):
+    """
+    Per-process scheduling metrics computed with grouped NumPy reductions
+
+    Segments are grouped by pid index with one stable sort followed by
+    ``reduceat``, so the cost is a handful of array passes no matter how
+    many slices a process was split into.
+
+    Args:
+        results: ScheduleResult or list of result dictionaries
+        processes: ProcessTable or list of process dictionaries supplying the
+            real arrival times. When omitted, each process is assumed to
+            arrive at its first start, as older versions of the tool did.
+
+    Returns:
+        dict: Arrays with one entry per scheduled process, ordered by pid
+        index: "pid", "id", "arrival_time", "burst_time", "completion_time",
+        "turnaround_time", "waiting_time", "response_time",
+        "context_switches", "overhead_time", "io_time" and "io_wait_time".
+        Overhead counts as waiting; time blocked on I/O does not.
+    """
+    results, processes = to_columnar(results, processes)
+    switches = context_switches(results)
+    overhead = overhead_time(results)
+    blocked = io_time(results)
+    queued = io_wait_time(results)
+    results = results.runs()
+
+    # Group segments by pid index; a stable sort keeps them in schedule order
+    order = np.argsort(results.pid, kind="stable")
+    pid = results.pid[order]
+    start = results.start[order]
+    end = results.end[order]
+    if len(pid):
+        group_starts = np.flatnonzero(np.r_[True, pid[1:] != pid[:-1]])
+    else:
+        group_starts = np.zeros(0, dtype=np.intp)
+    present = pid[group_starts]
+
+    if len(present):
+        burst_time = np.add.reduceat(end - start, group_starts)
+        completion_time = np.maximum.reduceat(end, group_starts)
+        first_start = np.minimum.reduceat(start, group_starts)
+    else:
+        burst_time = completion_time = first_start = np.zeros(0)
+
+    if processes is None:
+        arrival_time = first_start
+    else:
+        arrival_time = processes.arrival[present]
+
+    turnaround_time = completion_time - arrival_time
+    return {
+        "pid": present,
+        "id": results.ids[present],
+        "arrival_time": arrival_time,
+        "burst_time": burst_time,
+        "completion_time": completion_time,
+        "turnaround_time": turnaround_time,
+        "waiting_time": turnaround_time - burst_time - blocked[present],
+        "response_time": first_start - arrival_time,
+        "context_switches": switches[present],
+        "overhead_time": overhead[present],
+        "io_time": blocked[present],
+        "io_wait_time": queued[present],
+    }
+
+def cpu_busy_time(results):
+    """Time each CPU spent running processes (overhead excluded), as an array indexed by CPU number"""
+    results = results.runs()
+    durations = results.end - results.start
+    if results.cpu is None:
+        return np.array([durations.sum()])
+    return _sum_by(results.cpu, durations, results.cpus)
+
+def per_cpu_utilization(results, processes=None):
+    """
+    Fraction of the makespan each CPU was busy
+
+    Args:
+        results: ScheduleResult or list of result dictionaries
+        processes: Optional workload supplying the real arrival times
+
+    Returns:
+        numpy.ndarray: Utilization by CPU number; one entry for a
+        single-CPU schedule
+    """
+    results, processes = to_columnar(results, processes)
+    busy_time = cpu_busy_time(results)
+    if not len(results):
+        return np.zeros(len(busy_time))
+    first_arrival = processes.arrival[np.unique(results.pid)].min() if processes is not None else results.start.min()
+    makespan = results.end.max() - first_arrival
+    return busy_time / makespan if makespan > 0 else np.ones(len(busy_time))
+
+def windowed_throughput(completion_time, window=None, max_windows=THROUGHPUT_WINDOWS):
+    """
+    Completions per time unit in windows aligned on multiples of the window width
+
+    Args:
+        completion_time: Completion time of every process
+        window (optional): Window width; by default the smallest power of
+            two of the time unit that leaves at most ``max_windows`` windows,
+            as stream_metrics.WindowedCounter picks it
+
+    Returns:
+        tuple: (window width, array of throughputs from the first
+        completion's window to the last one's)
+    """
+    completion_time = np.asarray(completion_time)
+    if not len(completion_time):
+        return window or 1, np.zeros(0)
+    low, high = completion_time.min().item(), completion_time.max().item()
+    if window is None:
+        if low == high:
+            return 1, np.array([float(len(completion_time))])
+        window = initial_window(high - low, max_windows)
+        while high // window - low // window >= max_windows:
+            window *= 2
+    index = completion_time // window
+    counts = np.bincount((index - index.min()).astype(np.int64))
+    return window, counts / window
+
+def fairness_index(burst_time, waiting_time):
+    """
+    Jain's fairness index over the processes' shares of their ready and running time spent running
+
+    1.0 when every process waited in proportion to its burst, falling
+    towards 1/n as a few processes get all the CPU time.
+    """
+    burst_time, waiting_time = np.asarray(burst_time, dtype=np.float64), np.asarray(waiting_time, dtype=np.float64)
+    if not len(burst_time):
+        return 1.0
+    total = burst_time + waiting_time
+    share = np.divide(burst_time, total, out=np.ones(len(total)), where=total > 0)
+    return jain_index(share.sum(), (share * share).sum(), len(share))
+
+def latency_percentiles(metrics):
+    """
+    Waiting and response time percentiles of process_metrics output
+
+    The values are read from QuantileSketches, the same ones the streaming
+    MetricsTracker fills, so batch and streaming runs report the same
+    estimates.
+
+    Returns:
+        dict: "waiting_time_p50" ... "waiting_time_p99.9" and the same for
+        "response_time"
+    """
+    percentiles = {}
+    for name in ("waiting_time", "response_time"):
+        sketch = QuantileSketch()
+        sketch.update(metrics[name])
+        percentiles.update(percentile_summary(name, sketch))
+    return percentiles
+
+def summary_metrics(results, processes=None, window=None, cpus=None):
+    """
+    Aggregate metrics for a whole schedule
+
+    Args:
+        results: ScheduleResult or list of result dictionaries
+        processes: Optional workload supplying the real arrival times
+        window (optional): Width of the throughput windows, see windowed_throughput
+        cpus (int, optional): Number of simulated CPUs for result
+            dictionaries, which only name the CPUs that ran something
+
+    Returns:
+        dict: Process and segment counts, makespan, number of CPUs, CPU
+        utilization (averaged over the CPUs) and its value per CPU,
+        throughput, the average turnaround, waiting and response times, the
+        number of context switches, the total overhead time and the
+        fraction of busy CPU time it took, the average time blocked on I/O
+        and queued for a device, each device's utilization, the p50 / p95 /
+        p99 / p99.9 waiting and response times, throughput per window (with
+        the window width and the peak) and Jain's fairness index
+    """
+    results, processes = to_columnar(results, processes, cpus)
+    metrics = process_metrics(results, processes)
+    count = len(metrics["pid"])
+    window, windowed = windowed_throughput(metrics["completion_time"], window)
+    tails = {**latency_percentiles(metrics), "throughput_window": window, "windowed_throughput": windowed.tolist(),
+             "peak_throughput": windowed.max().item() if len(windowed) else 0.0,
+             "jain_fairness_index": fairness_index(metrics["burst_time"], metrics["waiting_time"])}
+    if count == 0:
+        return {"processes": 0, "segments": 0, "makespan": 0, "cpus": results.cpus, "cpu_utilization": 0.0,
+                "per_cpu_utilization": [0.0] * results.cpus,
+                "throughput": 0.0, "average_turnaround_time": 0.0,
+                "average_waiting_time": 0.0, "average_response_time": 0.0,
+                "context_switches": 0, "overhead_time": 0, "overhead_fraction": 0.0,
+                "average_io_time": 0.0, "average_io_wait_time": 0.0, "device_utilization": [], **tails}
+
+    first_arrival = metrics["arrival_time"].min()
+    makespan = metrics["completion_time"].max() - first_arrival
+    busy_time = cpu_busy_time(results)
+    device_busy = device_busy_time(results, processes)
+    return {
+        "processes": count,
+        "segments": len(results.runs()),
+        "makespan": makespan.item(),
+        "cpus": results.cpus,
+        "cpu_utilization": float(busy_time.sum() / (makespan * results.cpus)) if makespan > 0 else 1.0,
+        "per_cpu_utilization": (busy_time / makespan).tolist() if makespan > 0 else [1.0] * results.cpus,
+        "throughput": float(count / makespan) if makespan > 0 else float(count),
+        "average_turnaround_time": float(metrics["turnaround_time"].mean()),
+        "average_waiting_time": float(metrics["waiting_time"].mean()),
+        "average_response_time": float(metrics["response_time"].mean()),
+        "context_switches": int(metrics["context_switches"].sum()),
+        "overhead_time": metrics["overhead_time"].sum().item(),
+        "overhead_fraction": overhead_fraction(metrics["overhead_time"].sum(), busy_time.sum()),
+        "average_io_time": float(metrics["io_time"].mean()),
+        "average_io_wait_time": float(metrics["io_wait_time"].mean()),
+        "device_utilization": (device_busy / makespan).tolist() if makespan > 0 else [1.0] * len(device_busy),
+        **tails,
+    }
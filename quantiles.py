@@ -0,0 +1,167 @@
+import math
+
+# Latency percentiles reported by the metrics summaries
+PERCENTILES = (50, 95, 99, 99.9)
+
+# Default relative accuracy and bucket budget of a QuantileSketch
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+
+class QuantileSketch:
+    """
+    Streaming quantile sketch with a bounded relative error
+
+    Values are counted in logarithmic buckets, HDR-histogram style: bucket
+    ``k`` holds the values in ``(gamma ** (k - 1), gamma ** k]`` with
+    ``gamma = (1 + a) / (1 - a)``, so any quantile is answered within a
+    relative error of ``a`` of a value in the data. Memory is bounded by
+    ``max_buckets`` whatever the number of values; at 1% accuracy that
+    covers over 17 orders of magnitude before the lowest buckets are
+    collapsed together. Adding a value is O(1) and needs only the standard
+    library, so the streaming metrics can use it on the command line.
+    Negative values and zero are supported.
+
+    Args:
+        relative_accuracy (float): The relative error ``a``, in (0, 1)
+        max_buckets (int): Upper bound on the number of buckets kept
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY, max_buckets=DEFAULT_MAX_BUCKETS):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = {}  # Bucket key -> count of values
+        self._negative = {}  # The same for the magnitudes of negative values
+        self._zero = 0
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def __len__(self):
+        return self.count
+
+    def _key(self, magnitude):
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key):
+        # Midpoint of the bucket in relative terms, which is what bounds the error
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def add(self, value, count=1):
+        """Add ``value`` to the sketch, ``count`` times"""
+        if value > 0:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + count
+        elif value < 0:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + count
+        else:
+            self._zero += count
+        self.count += count
+        self.sum += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if len(self._positive) + len(self._negative) > self.max_buckets:
+            self._collapse()
+
+    def update(self, values):
+        """
+        Add every value of an iterable or array
+
+        A NumPy array is bucketed with array operations, which is how the
+        batch metrics fill a sketch from a whole schedule at once.
+        """
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return
+        for buckets, magnitudes in ((self._positive, values[values > 0]), (self._negative, -values[values < 0])):
+            if len(magnitudes):
+                keys, counts = np.unique(np.ceil(np.log(magnitudes) / self._log_gamma), return_counts=True)
+                for key, count in zip(keys.astype(np.int64).tolist(), counts.tolist()):
+                    buckets[key] = buckets.get(key, 0) + count
+        self._zero += int((values == 0).sum())
+        self.count += len(values)
+        self.sum += values.sum().item()
+        low, high = values.min().item(), values.max().item()
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        if len(self._positive) + len(self._negative) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other):
+        """Add the values counted by another sketch of the same accuracy"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy can be merged")
+        for buckets, others in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in others.items():
+                buckets[key] = buckets.get(key, 0) + count
+        self._zero += other._zero
+        self.count += other.count
+        self.sum += other.sum
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        if len(self._positive) + len(self._negative) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        # Fold the buckets nearest zero into one, giving up accuracy only there;
+        # the tail percentiles, which live in the largest buckets, stay exact to ``a``
+        excess = len(self._positive) + len(self._negative) - self.max_buckets
+        for buckets in (self._negative, self._positive):
+            if excess <= 0:
+                break
+            keys = sorted(buckets)
+            folded = keys[:min(excess + 1, len(keys))]
+            if len(folded) < 2:
+                continue
+            total = sum(buckets.pop(key) for key in folded)
+            buckets[folded[-1]] = total
+            excess -= len(folded) - 1
+
+    def quantile(self, q):
+        """
+        Estimate the ``q`` quantile, for ``q`` in [0, 1]
+
+        Returns:
+            float: A value within the relative accuracy of the data's
+            ``q`` quantile, clamped to the exact minimum and maximum; None
+            for an empty sketch
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+        if q in (0, 1):
+            return self.min if q == 0 else self.max
+        rank = q * (self.count - 1)
+        seen = 0
+        value = self.max
+        # Negative values from the most negative up, then zero, then the positive ones
+        buckets = [(-self._value(key), self._negative[key]) for key in sorted(self._negative, reverse=True)]
+        buckets.append((0.0, self._zero))
+        buckets.extend((self._value(key), self._positive[key]) for key in sorted(self._positive))
+        for value, count in buckets:
+            seen += count
+            if seen > rank:
+                break
+        return min(max(value, self.min), self.max)
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """The quantiles for a sequence of percentiles (0 to 100), as a list"""
+        return [self.quantile(p / 100) for p in percentiles]
+
+def percentile_summary(name, sketch, percentiles=PERCENTILES):
+    """Summary entries ``<name>_p50``, ``<name>_p99.9`` and so on for a sketch, 0.0 when it is empty"""
+    values = sketch.percentiles(percentiles) if sketch.count else [0.0] * len(percentiles)
+    return {f"{name}_p{percentile:g}": value for percentile, value in zip(percentiles, values)}
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from algorithms import SCHEDULERS, start_simulation
+from columnar import ProcessTable
+from columnar_io import SCHEDULE_EXTENSION, load_schedule, save_schedule
+
+# Default memory budget of a ResultCache
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def workload_hash(processes):
+    """
+    Content hash of a workload: arrival, burst, priority and process IDs,
+    plus the burst sequences and devices of a workload that does I/O
+
+    The digest of a ProcessTable is remembered on the table. Tables are
+    replaced rather than modified when the workload is edited, so an edited
+    workload always gets a fresh hash.
+    """
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_dicts(processes)
+    digest = getattr(processes, "_content_hash", None)
+    if digest is None:
+        hasher = hashlib.blake2b(digest_size=20)
+        columns = (processes.arrival, processes.burst, processes.priority)
+        if processes.has_io:
+            columns += (processes.bursts, processes.burst_offsets, processes.device)
+        for column in columns:
+            column = np.ascontiguousarray(column)
+            hasher.update(column.dtype.str.encode())
+            hasher.update(column.data)
+        # Default IDs follow from the length, which the columns already cover
+        if processes._ids is not None:
+            hasher.update("\0".join(processes._ids.tolist()).encode())
+        digest = hasher.hexdigest()
+        processes._content_hash = digest
+    return digest
+
+class ResultCache:
+    """
+    Memoized simulations keyed on the workload's content and the run's settings
+
+    Schedules are kept in an in-memory LRU bounded by ``max_bytes`` of
+    segment arrays and, with ``directory``, also written to memory-mappable
+    schedule files so they survive restarts; a disk hit is mapped, not read.
+    Because the key is a content hash, any change to the workload (adding
+    or removing a process, editing a value) simply misses the cache. Cached
+    arrays are read-only since they are shared between callers.
+    Safe to use from several threads.
+
+    Args:
+        max_bytes (int): Memory budget for cached schedules
+        directory (str, optional): Directory for the on-disk tier
+        runner (callable): Simulates on a miss, with the signature of
+            start_simulation; e.g. IncrementalSimulator().simulate
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None, runner=start_simulation):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.runner = runner
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> ScheduleResult, least recently used first
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(processes, algorithm, time_quantum=None, merge_slices=False, cpus=1, run_queues="global",
+            overhead=None):
+        """Cache key of one simulation; settings that do not affect the algorithm are ignored"""
+        # Only algorithms that take a time quantum depend on it and on merge_slices
+        if algorithm not in SCHEDULERS or not SCHEDULERS[algorithm].time_quantum:
+            time_quantum, merge_slices = None, False
+        settings = f"{algorithm}|{time_quantum!r}|{bool(merge_slices)}"
+        if cpus != 1:
+            # Single-CPU keys stay as they were so existing disk entries keep matching
+            settings += f"|{cpus}|{run_queues}"
+        if overhead is not None:
+            settings += "|overhead" + "".join(f"|{cost!r}" for cost in overhead)
+        return hashlib.blake2b(f"{workload_hash(processes)}|{settings}".encode(), digest_size=20).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SCHEDULE_EXTENSION)
+
+    def get(self, key):
+        """Return the cached ScheduleResult for ``key``, or None"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+        if self.directory and os.path.exists(self._path(key)):
+            try:
+                result = load_schedule(self._path(key)).result
+            except (OSError, KeyError, ValueError):
+                result = None  # Unreadable entry: treat it as a miss and overwrite it later
+            if result is not None:
+                self._remember(key, result)
+                with self._lock:
+                    self.hits += 1
+                return result
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, result):
+        """Store a ScheduleResult under ``key`` (and on disk with a directory)"""
+        for column in (result.pid, result.start, result.end, result.cpu, result.kind):
+            if column is not None:
+                column.flags.writeable = False
+        self._remember(key, result)
+        if self.directory:
+            # Write under a temporary name so readers never see a partial file
+            temporary = self._path(key) + ".tmp"
+            save_schedule(result, temporary)
+            os.replace(temporary, self._path(key))
+
+    def _remember(self, key, result):
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key).nbytes
+            if result.nbytes > self.max_bytes:
+                return  # Larger than the whole budget: only the disk tier keeps it
+            self._entries[key] = result
+            self.nbytes += result.nbytes
+            # Evict least recently used schedules until the budget holds
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        """Drop the in-memory entries (the disk tier is left alone)"""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def simulate(self, processes, algorithm="fcfs", time_quantum=None, merge_slices=False, progress=None,
+                 cpus=1, run_queues="global", overhead=None):
+        """
+        start_simulation with memoization
+
+        Returns the same type as start_simulation: a ScheduleResult for a
+        ProcessTable and result dictionaries for a list of process
+        dictionaries. A cache hit reports completion to ``progress`` at once.
+        """
+        as_dicts = not isinstance(processes, ProcessTable)
+        table = ProcessTable.from_dicts(processes) if as_dicts else processes
+        key = self.key(table, algorithm, time_quantum, merge_slices, cpus, run_queues, overhead)
+
+        result = self.get(key)
+        if result is None:
+            result = self.runner(table, algorithm, time_quantum, merge_slices, progress=progress,
+                                 cpus=cpus, run_queues=run_queues, overhead=overhead)
+            self.put(key, result)
+        elif progress is not None:
+            progress(len(result), 1.0)
+        return result.to_dicts() if as_dicts else result
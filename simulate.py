@@ -0,0 +1,182 @@
+import argparse
+import csv
+import json
+import os
+import sys
+
+from algorithms import SCHEDULERS, Overhead, check_bursts, start_simulation
+from smp import RUN_QUEUES
+from stream_metrics import MetricsTracker
+
+ALGORITHMS = tuple(SCHEDULERS)
+METRIC_COLUMNS = (
+    "id", "arrival_time", "burst_time", "completion_time",
+    "turnaround_time", "waiting_time", "response_time"
+)
+
+
+def _number(value):
+    """Parse a CSV field as an int when possible, otherwise as a float"""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+def _field(record, name, default=None):
+    """Read a numeric field from a CSV row or JSON object"""
+    value = record.get(name) if record.get(name) not in (None, "") else default
+    if value is None:
+        raise KeyError(f"workload record is missing {name!r}")
+    return _number(value) if isinstance(value, str) else value
+
+def _bursts(value):
+    """Parse a burst sequence: a JSON list, or numbers separated by spaces in a CSV field"""
+    if isinstance(value, str):
+        return [_number(part) for part in value.split()]
+    return list(value)
+
+def _process(record, index):
+    """Normalize one workload record into a process dictionary"""
+    process = {
+        "id": str(record.get("id") or f"P{index + 1}"),
+        "arrival": _field(record, "arrival"),
+        "priority": _field(record, "priority", 0),
+    }
+    bursts = _bursts(record.get("bursts") or ())
+    if len(bursts) > 1:
+        # Alternating CPU and I/O bursts; the burst time is their CPU total
+        burst = _field(record, "burst") if record.get("burst") not in (None, "") else None
+        process["burst"] = check_bursts(bursts, burst)
+        process["bursts"] = bursts
+        process["device"] = _field(record, "device", 0)
+    else:
+        process["burst"] = _field(record, "burst")
+    return process
+
+def read_workload(path):
+    """
+    Yield the processes of a workload file one at a time
+
+    Supported formats, chosen by extension: CSV with an ``arrival``,
+    ``burst`` and optional ``id`` / ``priority`` header, a JSON array of
+    process objects, and JSON lines (``.jsonl`` / ``.ndjson``). Use ``-``
+    to read CSV from standard input. Processes that do I/O have ``bursts``,
+    alternating CPU and I/O bursts (space separated in CSV), and optionally
+    the ``device`` serving their I/O.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    stream = sys.stdin if path == "-" else open(path, newline="")
+    try:
+        if extension == ".json":
+            records = json.load(stream)
+        elif extension in (".jsonl", ".ndjson"):
+            records = (json.loads(line) for line in stream if line.strip())
+        else:
+            records = csv.DictReader(stream)
+        for index, record in enumerate(records):
+            yield _process(record, index)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def run(path, algorithm="fcfs", time_quantum=None, merge_slices=False, stream=False, cpus=1,
+        run_queues="global", overhead=None, window=None):
+    """
+    Simulate a workload file and return its per-process rows and summary
+
+    With ``stream=True`` the file is consumed lazily (it must be ordered by
+    arrival time) and rows are produced as processes complete. Streaming
+    is limited to one CPU without overhead; ``cpus``, ``run_queues`` and
+    ``overhead`` are passed on to start_simulation otherwise. ``window`` is
+    the width of the summary's throughput windows.
+
+    Returns:
+        tuple: (iterator of metrics rows, MetricsTracker holding the summary
+        once the iterator is exhausted)
+    """
+    tracker = MetricsTracker(cpus, window)
+    if stream:
+        if cpus != 1 or overhead is not None:
+            raise ValueError("Streaming simulations run on a single CPU without overhead")
+        results = start_simulation(tracker.track(read_workload(path)), algorithm, time_quantum, merge_slices, stream=True)
+        return _completed_rows(tracker, results), tracker
+
+    processes = list(tracker.track(read_workload(path)))
+    results = start_simulation(processes, algorithm, time_quantum, merge_slices, cpus=cpus, run_queues=run_queues,
+                               overhead=overhead)
+    rows = list(_completed_rows(tracker, results))
+    rows.sort(key=lambda row: row["index"])
+    return iter(rows), tracker
+
+def _completed_rows(tracker, results):
+    """Feed results to the tracker and yield each process's row once it finishes"""
+    for result in results:
+        row = tracker.add_segment(result)
+        if row is not None:
+            yield row
+    yield from tracker.finish()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m simulate",
+        description="Run a scheduling simulation on a workload file without the GUI"
+    )
+    parser.add_argument("workload", help="CSV, JSON or JSON lines workload file ('-' for CSV on stdin)")
+    parser.add_argument("-a", "--algorithm", default="fcfs", choices=ALGORITHMS)
+    parser.add_argument("-q", "--time-quantum", type=_number,
+                        help="Time quantum for Round Robin, top-level allotment for mlfq, scheduling period for cfs")
+    parser.add_argument("--merge-slices", action="store_true", help="Merge back-to-back slices of the same process")
+    parser.add_argument("-c", "--cpus", type=int, default=1, help="Number of simulated CPUs")
+    parser.add_argument("--run-queues", default="global", choices=RUN_QUEUES,
+                        help="One ready queue shared by all CPUs, or one per CPU with work stealing")
+    parser.add_argument("--context-switch", type=_number, help="Time to switch a CPU from one process to another")
+    parser.add_argument("--dispatch-latency", type=_number, help="Time to dispatch a process onto a CPU")
+    parser.add_argument("--cache-warmup", type=_number,
+                        help="Time a preempted process spends refilling the cache when it runs again")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read the workload lazily (must be ordered by arrival) and print rows as processes finish")
+    parser.add_argument("-w", "--window", type=_number,
+                        help="Width of the summary's throughput windows (default: at most 100 power-of-two windows)")
+    parser.add_argument("-f", "--format", default="csv", choices=("csv", "json"))
+    parser.add_argument("--summary", action="store_true", help="Print only the summary metrics")
+    parser.add_argument("-o", "--output", help="Write to this file instead of standard output")
+    args = parser.parse_args(argv)
+    overhead = None
+    if (args.context_switch, args.cache_warmup, args.dispatch_latency) != (None, None, None):
+        overhead = Overhead(args.context_switch or 0, args.cache_warmup or 0, args.dispatch_latency or 0)
+
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        rows, tracker = run(args.workload, args.algorithm, args.time_quantum, args.merge_slices, args.stream,
+                            args.cpus, args.run_queues, overhead, args.window)
+        if args.format == "csv":
+            writer = csv.writer(output)
+            if args.summary:
+                # Drain the rows so the tracker has seen every segment
+                for _ in rows:
+                    pass
+                writer.writerows(tracker.summary().items())
+            else:
+                writer.writerow(METRIC_COLUMNS)
+                for row in rows:
+                    writer.writerow([row[column] for column in METRIC_COLUMNS])
+        else:
+            report = {"algorithm": args.algorithm, "time_quantum": args.time_quantum, "cpus": args.cpus}
+            if overhead is not None:
+                report["overhead"] = overhead._asdict()
+            processes = [{column: row[column] for column in METRIC_COLUMNS} for row in rows]
+            if not args.summary:
+                report["processes"] = processes
+            report["summary"] = tracker.summary()
+            json.dump(report, output, indent=2)
+            output.write("\n")
+    except (OSError, KeyError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
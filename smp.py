@@ -0,0 +1,459 @@
+import heapq
+
+from algorithms import (
+    CACHE_WARMUP, CONTEXT_SWITCH, DISPATCH, RUN, SCHEDULERS, SEGMENT_KINDS,
+    _io_rows, _priority_key, _sjf_key, _validate_time_quantum, _with_progress, _with_telemetry,
+    _workload_arrivals, _ArrivalCursor
+)
+
+# Ready queue layouts: one queue shared by all CPUs, or one per CPU with work stealing
+RUN_QUEUES = ("global", "per_cpu")
+
+
+def _arrival_key(process, remaining):
+    # First come first serve, ties go to input order
+    return process[1], process[0]
+
+def _burst_key(process, remaining):
+    # Shortest original burst, as the single-CPU ReadyQueue orders it
+    return process[2], process[1], process[0]
+
+def _static_priority_key(process, remaining):
+    return process[3], process[1], process[0]
+
+# algorithm -> (key(process, remaining) ordering the ready queues, preemptive).
+# A key of None means FIFO order, which Round Robin uses between its slices.
+# Preemptive keys must order running processes the same way at every point
+# in time when given their completion time in place of the remaining time,
+# which holds for both of them: remaining = completion - now on every CPU.
+_POLICIES = {
+    "fcfs": (_arrival_key, False),
+    "sjf_non_preemptive": (_burst_key, False),
+    "priority_non_preemptive": (_static_priority_key, False),
+    "sjf_preemptive": (_sjf_key, True),
+    "priority_preemptive": (_priority_key, True),
+    "round_robin": (None, False),
+}
+
+def _negate(key):
+    # Max-heap order for the running processes' keys (all numeric tuples)
+    return tuple(-value for value in key)
+
+def _cpus_of(mask):
+    """CPU numbers set in an affinity bitmask, lowest first"""
+    cpus = []
+    while mask:
+        lowest = mask & -mask
+        cpus.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return cpus
+
+def affinity_masks(affinity, cpus):
+    """
+    Convert per-process CPU sets into bitmasks
+
+    Args:
+        affinity (list): By pid index, None (any CPU) or an iterable of CPU numbers
+        cpus (int): Number of simulated CPUs
+
+    Returns:
+        list: One integer bitmask per process
+    """
+    everywhere = (1 << cpus) - 1
+    masks = []
+    for index, allowed in enumerate(affinity):
+        if allowed is None:
+            masks.append(everywhere)
+            continue
+        mask = 0
+        for cpu in allowed:
+            if not 0 <= cpu < cpus:
+                raise ValueError(f"Process {index} has affinity to CPU {cpu}, but only {cpus} CPUs are simulated")
+            mask |= 1 << cpu
+        if not mask:
+            raise ValueError(f"Process {index} has an empty CPU affinity")
+        masks.append(mask)
+    return masks
+
+def _smp_segments(arrivals, cpus, key, preemptive, time_quantum=None, merge_slices=False, per_cpu=False,
+                  masks=None, overhead=None):
+    """
+    Discrete-event core for ``cpus`` CPUs
+
+    Every policy runs on the same loop: the next event is the earlier of the
+    next arrival and the first CPU event (a completion or the end of a
+    Round Robin slice) from a heap with one live entry per busy CPU. At each
+    event time, finished CPUs are released, arrivals are queued, expired
+    slices are requeued behind them and idle CPUs take the best process
+    they may run. Preemptive policies then compare the best waiting process
+    with the worst running one, kept in a max-heap of running keys, so every
+    event costs O(log n).
+
+    Ready queues are heaps of ``(rank, sequence, process, remaining, mask)``.
+    With a global layout there is one queue per distinct affinity mask
+    (just one without affinity) and a CPU picks the best head it is allowed
+    to run. With ``per_cpu`` queues, arrivals go to an idle allowed CPU if
+    there is one and are otherwise spread over the allowed CPUs by pid
+    index; preempted and expired processes stay on their CPU's queue, and a
+    CPU whose queue runs dry steals the head of the longest queue it may
+    run.
+
+    With an Overhead, every dispatch first occupies the CPU for the context
+    switch (when it comes straight from another process), the dispatch
+    latency and the cache warmup (when the process resumes after a
+    preemption). Overhead is not preemptible; preemptive policies look
+    again when it ends. Segments are yielded as ``(process, start, end,
+    cpu, kind)`` when final, the overhead ones with the incoming process.
+
+    A process that completes a CPU burst with I/O left leaves its CPU; it
+    is queued again like an arrival when the I/O is done (see DeviceQueues).
+    """
+    arrivals = _ArrivalCursor(arrivals)
+    everywhere = (1 << cpus) - 1
+
+    queues = [[] for _ in range(cpus)] if per_cpu else []
+    queue_masks = []         # Global layout: affinity mask served by each queue
+    queue_of_mask = {}
+    nonempty = 0             # Per-CPU layout: bitmask of CPUs with queued processes
+    queued = 0
+    sequence = 0
+
+    idle = everywhere        # Bitmask of idle CPUs
+    process_on = [None] * cpus
+    start_on = [0] * cpus    # Start of the CPU's current segment
+    since_on = [0] * cpus    # Start of the current slice (the run after overhead without Round Robin)
+    left_on = [0] * cpus     # Work the running process had left at since_on
+    slice_on = [0] * cpus    # Length of the current slice
+    finish_on = [0] * cpus   # When the current slice ends
+    mask_on = [0] * cpus
+    last_on = [None] * cpus  # Process that last left the CPU, and when
+    last_end = [None] * cpus
+    token = [0] * cpus       # Invalidates heap entries of a CPU's previous dispatch
+    events = []              # (time, cpu, token)
+    running = []             # (negated key at completion, cpu, token), global preemptive layout only
+
+    def enqueue(process, remaining, mask, cpu=None):
+        nonlocal queued, sequence, nonempty
+        sequence += 1
+        entry = (sequence if key is None else key(process, remaining), sequence, process, remaining, mask)
+        if per_cpu:
+            if cpu is None:
+                # New arrival: an idle allowed CPU with an empty queue, else spread by pid index
+                free = idle & ~nonempty & mask
+                if free:
+                    cpu = (free & -free).bit_length() - 1
+                elif mask == everywhere:
+                    cpu = process[0] % cpus
+                else:
+                    allowed = _cpus_of(mask)
+                    cpu = allowed[process[0] % len(allowed)]
+            heapq.heappush(queues[cpu], entry)
+            nonempty |= 1 << cpu
+        else:
+            if mask not in queue_of_mask:
+                queue_of_mask[mask] = len(queues)
+                queues.append([])
+                queue_masks.append(mask)
+            heapq.heappush(queues[queue_of_mask[mask]], entry)
+        queued += 1
+        return cpu
+
+    def pop(queue, cpu):
+        nonlocal queued, nonempty
+        entry = heapq.heappop(queue)
+        queued -= 1
+        if per_cpu and not queue:
+            nonempty &= ~(1 << cpu)
+        return entry
+
+    def best_queue(cpu):
+        """The queue holding the best process ``cpu`` may run, with the queue's CPU, or (None, None)"""
+        if per_cpu:
+            if queues[cpu]:
+                return queues[cpu], cpu
+            # Steal the head of the longest queue whose head may run here
+            victim, longest = None, 0
+            for other in _cpus_of(nonempty):
+                queue = queues[other]
+                if len(queue) > longest and queue[0][4] >> cpu & 1:
+                    victim, longest = other, len(queue)
+            return (queues[victim], victim) if victim is not None else (None, None)
+        best = None
+        for queue, mask in zip(queues, queue_masks):
+            if queue and mask >> cpu & 1 and (best is None or queue[0] < best[0]):
+                best = queue
+        return best, None
+
+    def run(cpu, entry, time):
+        nonlocal idle
+        _, _, process, remaining, mask = entry
+        idle &= ~(1 << cpu)
+        token[cpu] += 1
+        dispatched = time
+        if overhead is not None:
+            # Pay the overhead up front, one segment per kind
+            switching = last_end[cpu] == time and last_on[cpu][0] != process[0]
+            for kind, cost in ((CONTEXT_SWITCH, overhead.context_switch if switching else 0),
+                               (DISPATCH, overhead.dispatch),
+                               (CACHE_WARMUP, overhead.cache_warmup if remaining < process[2] else 0)):
+                if cost > 0:
+                    segments.append((process, time, time + cost, cpu, kind))
+                    time += cost
+        process_on[cpu], start_on[cpu], left_on[cpu], mask_on[cpu] = process, time, remaining, mask
+        schedule_event(cpu, time)
+        if preemptive:
+            if time > dispatched:
+                # Wake up when the overhead ends to look for preemptions again
+                heapq.heappush(events, (time, cpu, token[cpu]))
+            if not per_cpu:
+                heapq.heappush(running, (_negate(key(process, finish_on[cpu])), cpu, token[cpu]))
+
+    def schedule_event(cpu, time):
+        # Slices are measured and subtracted the way the single-CPU cores do it, so with one CPU
+        # the schedules are identical even with float times
+        remaining = left_on[cpu]
+        if time_quantum is None:
+            length = remaining
+        elif merge_slices and not queued:
+            # Alone: slice on until the first slice boundary at or after the next arrival
+            slices = -(-(arrivals.time - time) // time_quantum) if arrivals.pending is not None else None
+            length = remaining if slices is None else min(max(slices, 1) * time_quantum, remaining)
+        else:
+            length = min(time_quantum, remaining)
+        since_on[cpu], slice_on[cpu], finish_on[cpu] = time, length, time + length
+        heapq.heappush(events, (finish_on[cpu], cpu, token[cpu]))
+
+    def left_at(cpu, time):
+        """Work the process on ``cpu`` has left at ``time``, before its slice ends"""
+        return left_on[cpu] - (time - since_on[cpu])
+
+    def release(cpu, time):
+        nonlocal idle
+        last_on[cpu], last_end[cpu] = process_on[cpu], time
+        process_on[cpu] = None
+        token[cpu] += 1
+        idle |= 1 << cpu
+
+    def current_key(cpu, time):
+        """Key of the process on ``cpu`` at ``time``, None while it is still paying overhead"""
+        if start_on[cpu] > time:
+            return None
+        return key(process_on[cpu], left_at(cpu, time))
+
+    def worst_running(mask, time):
+        """Busy, preemptible CPU in ``mask`` whose running process has the largest key, or None"""
+        if not per_cpu and mask == everywhere:
+            while running and running[0][2] != token[running[0][1]]:
+                heapq.heappop(running)  # Entry of a process that has since stopped
+            # The worst process may be paying overhead; it is looked at again when that ends
+            return running[0][1] if running and start_on[running[0][1]] <= time else None
+        worst, worst_key = None, None
+        for cpu in _cpus_of(mask & ~idle):
+            current = current_key(cpu, time)
+            if current is not None and (worst_key is None or current > worst_key):
+                worst, worst_key = cpu, current
+        return worst
+
+    def preempt(cpu, queue, queue_cpu, time):
+        # The running process goes back to the ready queues with what it has left
+        process = process_on[cpu]
+        if time > start_on[cpu]:
+            segments.append((process, start_on[cpu], time, cpu, RUN))
+        remaining = left_at(cpu, time)
+        release(cpu, time)
+        enqueue(process, remaining, mask_on[cpu], cpu if per_cpu else None)
+        run(cpu, pop(queue, queue_cpu), time)
+
+    segments = []  # Final segments of the current event, flushed after it
+    while arrivals.pending is not None or events:
+        time = min(arrivals.time, events[0][0]) if events else arrivals.time
+
+        # Release the CPUs whose process completed, note expired slices and ended overhead
+        expired = []
+        woken = 0
+        while events and events[0][0] <= time:
+            _, cpu, event_token = heapq.heappop(events)
+            if event_token != token[cpu]:
+                continue  # The process was preempted after this event was scheduled
+            if finish_on[cpu] > time:
+                woken |= 1 << cpu  # Overhead ended
+                continue
+            left_on[cpu] -= slice_on[cpu]
+            if left_on[cpu] <= 0:
+                segments.append((process_on[cpu], start_on[cpu], time, cpu, RUN))
+                arrivals.completed(process_on[cpu], time)
+                release(cpu, time)
+            else:
+                expired.append(cpu)
+
+        # Queue the arrivals; zero-length bursts only produce a segment without slicing or preemption
+        arrived = woken
+        while arrivals.time <= time:
+            process = arrivals.pop()
+            if process[2] > 0 or (key is not None and not preemptive):
+                touched = enqueue(process, process[2], masks[process[0]] if masks else everywhere)
+                arrived |= everywhere if touched is None else 1 << touched
+            else:
+                arrivals.completed(process, process[1])  # Nothing to run
+
+        # Round Robin: an expired process yields its CPU only if another process may take it
+        for cpu in expired:
+            process = process_on[cpu]
+            queue, _ = best_queue(cpu)
+            if queue is not None:
+                segments.append((process, start_on[cpu], time, cpu, RUN))
+                release(cpu, time)
+                enqueue(process, left_on[cpu], mask_on[cpu], cpu if per_cpu else None)
+            else:
+                if not merge_slices:
+                    segments.append((process, start_on[cpu], time, cpu, RUN))
+                    start_on[cpu] = time
+                token[cpu] += 1
+                schedule_event(cpu, time)
+
+        # Idle CPUs take the best process they may run
+        free = idle
+        while free and queued:
+            cpu = (free & -free).bit_length() - 1
+            free &= free - 1
+            queue, queue_cpu = best_queue(cpu)
+            if queue is not None:
+                run(cpu, pop(queue, queue_cpu), time)
+
+        # Preemption: a new arrival better than a running process takes its CPU
+        if preemptive and arrived and queued:
+            if per_cpu:
+                for cpu in _cpus_of(arrived & ~idle):
+                    queue = queues[cpu]
+                    if queue:
+                        current = current_key(cpu, time)
+                        if current is not None and queue[0][0] < current:
+                            preempt(cpu, queue, cpu, time)
+            else:
+                for queue, mask in zip(queues, queue_masks):
+                    while queue:
+                        cpu = worst_running(mask, time)
+                        if cpu is None or not queue[0][0] < current_key(cpu, time):
+                            break
+                        preempt(cpu, queue, None, time)
+
+        yield from segments
+        segments.clear()
+
+def smp_segments(processes, algorithm, cpus, time_quantum=None, merge_slices=False, run_queues="global",
+                 affinity=None, overhead=None, arrivals=None):
+    """
+    Segment generator of a whole workload on ``cpus`` CPUs
+
+    ``arrivals``, by default ``_workload_arrivals(processes)``, is the
+    workload's arrival stream; its DeviceQueues record the I/O.
+
+    Returns:
+        generator: ``(process, start, end, cpu, kind)`` segments, each
+        yielded once final; they come out roughly but not strictly in
+        start order
+    """
+    if algorithm not in _POLICIES:
+        if algorithm in SCHEDULERS:
+            # Registered engines without a policy here (MLFQ, CFS, ...) keep per-process state of their own
+            raise ValueError(f"{SCHEDULERS[algorithm].label} only runs on a single CPU without overhead")
+        raise ValueError(f"Unknown algorithm specified: {algorithm}")
+    if algorithm == "round_robin":
+        _validate_time_quantum(time_quantum)
+    else:
+        time_quantum, merge_slices = None, False
+    if not isinstance(cpus, int) or cpus < 1:
+        raise ValueError("Number of CPUs must be a positive integer")
+    if run_queues not in RUN_QUEUES:
+        raise ValueError(f"Unknown run queue layout: {run_queues}")
+    if overhead is not None and min(overhead) < 0:
+        raise ValueError("Overhead costs must not be negative")
+
+    key, preemptive = _POLICIES[algorithm]
+    masks = affinity_masks(affinity, cpus) if affinity is not None else None
+    if masks is not None and len(masks) != len(processes):
+        raise ValueError("Affinity must have one entry per process")
+    if arrivals is None:
+        arrivals = _workload_arrivals(processes)
+    return _smp_segments(arrivals, cpus, key, preemptive, time_quantum, merge_slices,
+                         run_queues == "per_cpu", masks, overhead)
+
+def simulate_smp(processes, algorithm="fcfs", cpus=2, time_quantum=None, merge_slices=False, run_queues="global",
+                 affinity=None, progress=None, overhead=None, telemetry=None):
+    """
+    Simulate a workload on a symmetric multiprocessor
+
+    Every algorithm keeps its single-CPU policy and applies it across
+    ``cpus`` CPUs; with one CPU and no overhead the schedule equals
+    start_simulation's.
+
+    Args:
+        processes: Process dictionaries or a ProcessTable
+        algorithm (str): Any algorithm accepted by start_simulation
+        cpus (int): Number of simulated CPUs
+        time_quantum (int): Time quantum for Round Robin
+        merge_slices (bool): Merge back-to-back Round Robin slices on a CPU
+        run_queues (str): "global" for one shared ready queue, "per_cpu" for
+            a queue per CPU with work stealing
+        affinity (list, optional): By pid index, None or the CPU numbers the
+            process may run on
+        progress (callable, optional): Progress callback, see start_simulation
+        overhead (Overhead, optional): Scheduling costs to charge; they are
+            recorded as segments of their own kind
+        telemetry (Telemetry, optional): Records the run as a per-window
+            time series, see start_simulation
+
+    Returns:
+        A ScheduleResult for a ProcessTable, otherwise result dictionaries,
+        sorted by start time and CPU. With several CPUs each segment also
+        has its CPU (-1 for I/O) and with an overhead or I/O its kind (see
+        SEGMENT_KINDS).
+    """
+    arrivals = _workload_arrivals(processes)
+    segments = smp_segments(processes, algorithm, cpus, time_quantum, merge_slices, run_queues, affinity, overhead,
+                            arrivals)
+    if telemetry is not None:
+        segments = _with_telemetry(segments, telemetry, processes, arrivals, cpus)
+    if progress is not None:
+        total_work = processes.burst.sum() if hasattr(processes, "burst") else sum(p["burst"] for p in processes)
+        segments = _with_progress(segments, progress, total_work)
+
+    indices, starts, ends, cpu_numbers, kinds = [], [], [], [], []
+    for process, start, end, cpu, kind in segments:
+        indices.append(process[0])
+        starts.append(start)
+        ends.append(end)
+        cpu_numbers.append(cpu)
+        kinds.append(kind)
+    if arrivals.io is not None:
+        # I/O segments run on no CPU
+        io_indices, io_starts, io_ends, io_kinds = _io_rows(arrivals.io)
+        indices.extend(io_indices)
+        starts.extend(io_starts)
+        ends.extend(io_ends)
+        cpu_numbers.extend([-1] * len(io_kinds))
+        kinds.extend(io_kinds)
+    with_kind = overhead is not None or arrivals.io is not None
+
+    if hasattr(processes, "columns"):
+        import numpy as np
+        from columnar import ScheduleResult
+
+        starts, cpu_numbers = np.asarray(starts), np.asarray(cpu_numbers, dtype=np.int16)
+        order = np.lexsort((cpu_numbers, starts))
+        return ScheduleResult(np.asarray(indices, dtype=np.int32)[order], starts[order], np.asarray(ends)[order],
+                              algorithm, processes.ids,
+                              cpu=cpu_numbers[order] if cpus > 1 else None, cpus=cpus,
+                              kind=np.asarray(kinds, dtype=np.int8)[order] if with_kind else None)
+
+    order = sorted(range(len(indices)), key=lambda i: (starts[i], cpu_numbers[i]))
+    results = [
+        {"id": processes[indices[i]]["id"], "start": starts[i], "end": ends[i], "algorithm": algorithm}
+        for i in order
+    ]
+    for result, i in zip(results, order):
+        if cpus > 1 and cpu_numbers[i] >= 0:
+            result["cpu"] = cpu_numbers[i]
+        if with_kind:
+            result["kind"] = SEGMENT_KINDS[kinds[i]]
+    return results
@@ -0,0 +1,294 @@
+import math
+
+import numpy as np
+import tkinter as tk
+from tkinter import ttk
+
+from algorithms import IO_KINDS, RUN
+from columnar import ScheduleResult
+from gantt import dominant_runs, time_label, time_origin
+from metrics import to_columnar
+
+# State codes used in the interval arrays, indexing STATES
+READY, RUNNING, WAITING, TERMINATED = range(4)
+STATES = ("Ready", "Running", "Waiting", "Terminated")
+STATE_COLORS = {
+    "New": "#add8e6",      # Light blue
+    "Ready": "#90ee90",    # Light green
+    "Running": "#ffcc66",  # Light orange
+    "Waiting": "#ffb6c1",  # Light pink
+    "Terminated": "#d3d3d3"  # Light gray
+}
+
+
+def state_intervals(pid, start, end, arrival, state=None):
+    """
+    Per-process state intervals of a schedule, computed once with array operations
+
+    Every process is Ready from its arrival until it first runs and between
+    its segments, Running (or Waiting, for I/O) during its segments and
+    Terminated from its completion to a short tail after the last completion.
+    Times keep their type, so integer timestamps stay exact; pass offsets
+    from the trace origin (see gantt.time_origin) to display them.
+
+    Args:
+        pid, start, end: Segment arrays; pid indexes ``arrival`` and is the row
+        arrival: Arrival time of every row
+        state (array-like, optional): RUNNING or WAITING for every segment,
+            all RUNNING if omitted; a row completes with its last segment
+
+    Returns:
+        tuple: (offsets, state, start, end) where the intervals of row ``r``
+        are ``offsets[r]:offsets[r + 1]``, sorted by time
+    """
+    rows = len(arrival)
+    time_type = np.result_type(np.asarray(arrival), start, end)
+    arrival = np.asarray(arrival, dtype=time_type)
+    order = np.lexsort((start, pid))
+    pid, start, end = pid[order], start[order].astype(time_type), end[order].astype(time_type)
+    segment_state = np.full(len(pid), RUNNING) if state is None else np.asarray(state)[order]
+
+    # Ready gaps: from the arrival or the previous segment's end to the next start
+    first = np.r_[True, pid[1:] != pid[:-1]] if len(pid) else np.zeros(0, dtype=bool)
+    previous_end = np.zeros_like(end)
+    previous_end[1:] = end[:-1]
+    previous_end[first] = arrival[pid[first]]
+    gap = start > previous_end
+
+    # Completion is the end of each row's last segment (its arrival if it never ran)
+    completion = arrival.copy()
+    last = np.r_[first[1:], True] if len(pid) else first
+    completion[pid[last]] = end[last]
+    finish = completion.max() if rows else time_type.type(0)
+    # A tail of 5% of the timeline, whatever its time unit
+    span = finish - (arrival.min() if rows else 0)
+    horizon = finish + ((span // 20 if np.issubdtype(time_type, np.integer) else span * 0.05) or 1)
+
+    row = np.r_[pid[gap], pid, np.arange(rows)]
+    state = np.r_[np.full(gap.sum(), READY), segment_state, np.full(rows, TERMINATED)]
+    interval_start = np.r_[previous_end[gap], start, completion]
+    interval_end = np.r_[start[gap], end, np.full(rows, horizon, dtype=time_type)]
+
+    order = np.lexsort((interval_start, row))
+    offsets = np.searchsorted(row[order], np.arange(rows + 1))
+    return offsets, state[order].astype(np.int8), interval_start[order], interval_end[order]
+
+def _nice_step(raw):
+    """Smallest 1, 2 or 5 times a power of ten that is at least ``raw``"""
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for multiple in (1, 2, 5, 10):
+        if multiple * magnitude >= raw:
+            return multiple * magnitude
+
+class ProcessStateView:
+    """
+    Virtualized timeline of every process's Ready / Running / Waiting / Terminated states
+
+    The state intervals are computed once up front. Scrolling is virtual:
+    the canvas is only as large as the window and each redraw places the
+    rows and time range currently in view, reusing a pool of canvas items
+    instead of creating new ones, so the number of items is bounded by the
+    window size no matter how many processes or transitions there are.
+    Integer times are shown as offsets from the trace origin (see
+    gantt.time_origin), which keep nanosecond gaps visible.
+
+    Args:
+        frame: Tk container to pack the view into
+        results: Result dictionaries or a ScheduleResult
+        process_data (dict): Per-process metrics keyed by process ID, in row order
+    """
+
+    LABEL_WIDTH = 80       # Pixels reserved for the process IDs on the left
+    HEADER_HEIGHT = 30     # Pixels reserved for the time scale at the top
+    ROW_HEIGHT = 40
+    BAR_HEIGHT = 28
+    MIN_TICK_PIXELS = 80   # Minimum spacing between time scale ticks
+    MIN_LABEL_PIXELS = 70  # Intervals narrower than this get no state name
+    ZOOM_STEP = 1.25
+
+    def __init__(self, frame, results, process_data):
+        results, _ = to_columnar(results)
+        # Overhead segments count as Ready; I/O segments are the Waiting state
+        state = None
+        if results.kind is not None:
+            keep = np.flatnonzero((results.kind == RUN) | np.isin(results.kind, IO_KINDS))
+            state = np.where(results.kind[keep] == RUN, RUNNING, WAITING)
+            results = ScheduleResult(results.pid[keep], results.start[keep], results.end[keep], results.algorithm,
+                                     results.ids)
+        self.ids = list(process_data)
+
+        # Rows follow process_data, so map the result's pid indices onto them
+        row_of = {pid: row for row, pid in enumerate(self.ids)}
+        remap = np.array([row_of[pid] for pid in results.ids.tolist()], dtype=np.int64)
+        arrival = np.array([process_data[pid]["arrival_time"] for pid in self.ids])
+        self.origin = time_origin(arrival, results.start)
+        self.offsets, self.state, self.start, self.end = state_intervals(
+            remap[results.pid], results.start - self.origin, results.end - self.origin, arrival - self.origin, state)
+
+        self.bounds = ((arrival.min() - self.origin).item() if len(arrival) else 0.0,
+                       self.end.max().item() if len(self.end) else 1.0)
+        self.scale = 100.0  # Pixels per time unit
+        self.left = self.bounds[0]  # Time at the left edge of the plot
+        self.top_row = 0
+        self._pools = {"rectangle": [], "text": [], "line": []}
+        self._used = dict.fromkeys(self._pools, 0)
+        self._render_pending = False
+
+        # Toolbar with zoom controls and the state legend
+        toolbar = ttk.Frame(frame)
+        toolbar.pack(fill=tk.X)
+        ttk.Button(toolbar, text="Zoom In", command=lambda: self.zoom(self.ZOOM_STEP)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(toolbar, text="Zoom Out", command=lambda: self.zoom(1 / self.ZOOM_STEP)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(toolbar, text="Fit", command=self.fit).pack(side=tk.LEFT, padx=2)
+        if self.origin:
+            ttk.Label(toolbar, text=time_label(self.origin)).pack(side=tk.LEFT, padx=5)
+        for name in reversed(STATES):
+            tk.Label(toolbar, text=name, bg=STATE_COLORS[name], relief=tk.SOLID, borderwidth=1,
+                     padx=4).pack(side=tk.RIGHT, padx=2)
+
+        # Scrollbars drive the virtual offsets rather than a canvas scroll region
+        canvas_frame = ttk.Frame(frame)
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        self.h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.xview)
+        self.v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.yview)
+        self.h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas = tk.Canvas(canvas_frame, bg="white", highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<Configure>", lambda event: self._schedule_render())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Shift-MouseWheel>", lambda event: self._on_wheel(event, horizontal=True))
+        self.canvas.bind("<Control-MouseWheel>",
+                         lambda event: self.zoom(self.ZOOM_STEP if event.delta > 0 else 1 / self.ZOOM_STEP))
+        # X11 reports the wheel as buttons 4 and 5
+        self.canvas.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+        self.canvas.bind("<Shift-Button-4>", lambda event: self.xview("scroll", -1, "units"))
+        self.canvas.bind("<Shift-Button-5>", lambda event: self.xview("scroll", 1, "units"))
+
+    def _plot_size(self):
+        width = max(1, self.canvas.winfo_width() - self.LABEL_WIDTH)
+        rows = max(1, (self.canvas.winfo_height() - self.HEADER_HEIGHT) // self.ROW_HEIGHT)
+        return width, rows
+
+    def _clamp(self):
+        width, rows = self._plot_size()
+        low, high = self.bounds
+        span = high - low or 1.0
+        # Never zoom out past the whole timeline or in past a tiny fraction of it
+        self.scale = min(max(self.scale, width / span), width / (span * 1e-9))
+        self.left = min(max(self.left, low), max(low, high - width / self.scale))
+        self.top_row = int(min(max(self.top_row, 0), max(0, len(self.ids) - rows)))
+
+    def zoom(self, factor):
+        """Scale the time axis by ``factor`` around the middle of the view"""
+        width, _ = self._plot_size()
+        center = self.left + width / self.scale / 2
+        self.scale *= factor
+        self.left = center - width / self.scale / 2
+        self._schedule_render()
+
+    def fit(self):
+        """Fit the whole timeline into the window"""
+        self.scale = 0.0
+        self.left = self.bounds[0]
+        self._schedule_render()
+
+    def xview(self, *args):
+        """Scrollbar command for the time axis ('moveto' or 'scroll')"""
+        width, _ = self._plot_size()
+        visible = width / self.scale
+        if args[0] == "moveto":
+            self.left = self.bounds[0] + float(args[1]) * (self.bounds[1] - self.bounds[0])
+        elif args[0] == "scroll":
+            self.left += int(args[1]) * visible * (0.9 if args[2] == "pages" else 0.1)
+        self._schedule_render()
+
+    def yview(self, *args):
+        """Scrollbar command for the process rows ('moveto' or 'scroll')"""
+        _, rows = self._plot_size()
+        if args[0] == "moveto":
+            self.top_row = round(float(args[1]) * len(self.ids))
+        elif args[0] == "scroll":
+            self.top_row += int(args[1]) * (max(1, rows - 1) if args[2] == "pages" else 1)
+        self._schedule_render()
+
+    def _on_wheel(self, event, horizontal=False):
+        step = -1 if event.delta > 0 else 1
+        (self.xview if horizontal else self.yview)("scroll", step, "units")
+
+    def _schedule_render(self):
+        # Coalesce bursts of scroll and resize events into one redraw
+        if not self._render_pending:
+            self._render_pending = True
+            self.canvas.after_idle(self._render)
+
+    def _item(self, kind, coords, **options):
+        """Reuse the next pooled canvas item of ``kind``, creating one only when the pool is exhausted"""
+        pool, used = self._pools[kind], self._used[kind]
+        if used < len(pool):
+            item = pool[used]
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, state=tk.NORMAL, **options)
+        else:
+            item = getattr(self.canvas, "create_" + kind)(*coords, **options)
+            pool.append(item)
+        self._used[kind] = used + 1
+        return item
+
+    def _render(self):
+        self._render_pending = False
+        self._clamp()
+        self._used = dict.fromkeys(self._pools, 0)
+        width, rows = self._plot_size()
+        height = self.canvas.winfo_height()
+        t0 = self.left
+        t1 = t0 + width / self.scale
+
+        # Time scale with a bounded number of ticks
+        step = _nice_step(self.MIN_TICK_PIXELS / self.scale)
+        for tick in (np.arange(math.ceil(t0 / step), math.floor(t1 / step) + 1) * step).tolist():
+            x = self.LABEL_WIDTH + (tick - t0) * self.scale
+            self._item("line", (x, self.HEADER_HEIGHT - 5, x, height), dash=(4, 4), fill="gray", tags=("grid",))
+            self._item("text", (x, 5), text=f"t={tick:.12g}", anchor="n", font=("Arial", 8), fill="black",
+                       tags=("label",))
+
+        # Only the rows in view, and within each row only the intervals in view
+        last_row = min(len(self.ids), self.top_row + rows + 1)
+        for row in range(self.top_row, last_row):
+            y = self.HEADER_HEIGHT + (row - self.top_row) * self.ROW_HEIGHT
+            middle = y + self.ROW_HEIGHT / 2
+            self._item("text", (10, middle), text=self.ids[row], anchor="w",
+                       font=("Arial", 12, "bold"), fill="black", tags=("label",))
+
+            first, last = self.offsets[row], self.offsets[row + 1]
+            low = first + np.searchsorted(self.end[first:last], t0, side="right")
+            high = max(low, first + np.searchsorted(self.start[first:last], t1, side="left"))
+            state, start, end = self.state[low:high], self.start[low:high], self.end[low:high]
+            # More intervals than pixels: show the dominant state per pixel column
+            if len(state) > width:
+                state, start, end = dominant_runs(state, start, end, t0, t1, width)
+
+            for code, begin, finish in zip(state.tolist(), start.tolist(), end.tolist()):
+                x0 = self.LABEL_WIDTH + (max(begin, t0) - t0) * self.scale
+                x1 = self.LABEL_WIDTH + (min(finish, t1) - t0) * self.scale
+                name = STATES[code]
+                self._item("rectangle", (x0, middle - self.BAR_HEIGHT / 2, x1, middle + self.BAR_HEIGHT / 2),
+                           fill=STATE_COLORS[name], outline="black")
+                if x1 - x0 >= self.MIN_LABEL_PIXELS:
+                    self._item("text", ((x0 + x1) / 2, middle), text=name, anchor="center",
+                               font=("Arial", 10), fill="black", tags=("label",))
+
+        # Hide whatever the pools hold beyond this frame's needs
+        for kind, pool in self._pools.items():
+            for item in pool[self._used[kind]:]:
+                self.canvas.itemconfigure(item, state=tk.HIDDEN)
+        self.canvas.tag_lower("grid")
+        self.canvas.tag_raise("label")
+
+        low, high = self.bounds
+        span = high - low or 1.0
+        self.h_scrollbar.set((t0 - low) / span, (t1 - low) / span)
+        count = max(1, len(self.ids))
+        self.v_scrollbar.set(self.top_row / count, min(1.0, (self.top_row + rows) / count))
@@ -0,0 +1,291 @@
+import math
+
+from quantiles import QuantileSketch, percentile_summary
+
+# Most windows the automatic throughput window width leaves in a summary
+THROUGHPUT_WINDOWS = 100
+
+
+def overhead_fraction(overhead, busy_time):
+    """Share of the CPUs' busy time (running plus overhead) lost to overhead"""
+    total = overhead + busy_time
+    return float(overhead / total) if total > 0 else 0.0
+
+def jain_index(total, total_squares, count):
+    """Jain's fairness index from the sum and sum of squares of ``count`` allocations: 1 when all are equal"""
+    return float(total * total / (count * total_squares)) if total_squares > 0 else 1.0
+
+def fair_share(burst_time, waiting_time):
+    """Share of its time ready or running that a process spent running, the allocation the fairness index compares"""
+    return burst_time / (burst_time + waiting_time) if burst_time + waiting_time > 0 else 1.0
+
+def initial_window(span, max_windows=THROUGHPUT_WINDOWS):
+    """
+    Smallest power of two (of the time unit) that splits ``span`` into at most ``max_windows`` windows
+
+    Integer timelines never get windows shorter than one time unit.
+    """
+    mantissa, exponent = math.frexp(span / max_windows)
+    exponent -= mantissa == 0.5  # An exact power of two is already big enough
+    return 2 ** max(exponent, 0) if isinstance(span, int) else 2 ** exponent
+
+class WindowedCounter:
+    """
+    Event counts in time windows aligned on multiples of the window width
+
+    With a fixed ``width`` every window is kept. Without one the width is a
+    power of two of the time unit, chosen from the first two distinct event
+    times and doubled (merging neighbouring windows) whenever the events
+    span more than ``max_windows`` windows, so memory stays bounded on a
+    stream of any length. It ends as the smallest power of two that fits,
+    the same width metrics.windowed_throughput picks for the whole schedule.
+
+    Args:
+        width (optional): Fixed window width
+        max_windows (int): Window budget of the automatic width
+    """
+
+    def __init__(self, width=None, max_windows=THROUGHPUT_WINDOWS):
+        self.width = width
+        self.max_windows = max_windows
+        self._fixed = width is not None
+        self._counts = {}  # Window index -> events
+        self._low = self._high = None
+        self._first = None  # Time of the events seen while the width is still unknown
+        self._pending = 0
+
+    def add(self, time):
+        """Count one event at ``time``"""
+        if self.width is None:
+            if self._first is None or time == self._first:
+                self._first = time
+                self._pending += 1
+                return
+            self.width = initial_window(abs(time - self._first), self.max_windows)
+            self._count(self._first, self._pending)
+        self._count(time, 1)
+
+    def _count(self, time, events):
+        index = int(time // self.width)
+        self._counts[index] = self._counts.get(index, 0) + events
+        self._low = index if self._low is None else min(self._low, index)
+        self._high = index if self._high is None else max(self._high, index)
+        while not self._fixed and self._high - self._low >= self.max_windows:
+            # Double the width: windows 2k and 2k + 1 become window k
+            merged = {}
+            for index, count in self._counts.items():
+                merged[index // 2] = merged.get(index // 2, 0) + count
+            self._counts, self.width = merged, self.width * 2
+            self._low, self._high = self._low // 2, self._high // 2
+
+    def rates(self):
+        """
+        Events per time unit in every window from the first event's to the last one's
+
+        Returns:
+            tuple: (window width, list of rates); the width is 1 when every
+            event happened at the same time
+        """
+        if self.width is None:
+            return 1, [self._pending] if self._pending else []
+        if not self._counts:
+            return self.width, []
+        return self.width, [self._counts.get(index, 0) / self.width for index in range(self._low, self._high + 1)]
+
+class MetricsTracker:
+    """
+    Per-process and summary metrics accumulated one segment at a time
+
+    Needs nothing beyond the standard library, which keeps the command line
+    entry point fast to start, and works on streamed results where the
+    vectorized functions in ``metrics`` would need the whole schedule.
+    Processes are registered as they arrive and dropped as soon as they have
+    executed their whole burst, so memory is bounded by the number of
+    processes that have arrived but not finished.
+
+    Args:
+        cpus (int): Number of simulated CPUs; multi-CPU results carry a "cpu" key
+        window (optional): Width of the throughput windows; by default a
+            power of two that leaves at most THROUGHPUT_WINDOWS windows
+
+    Results with scheduling overhead or I/O carry a "kind" key; overhead
+    segments count towards the overhead time and as waiting, never as
+    execution, and "io_wait" / "io" segments as time blocked on I/O on the
+    process's "device". Segments must arrive in start order on each CPU,
+    as the simulators produce them.
+
+    Waiting and response time percentiles come from QuantileSketches and
+    throughput per window from a WindowedCounter, so the summary's memory
+    stays bounded too.
+    """
+
+    def __init__(self, cpus=1, window=None):
+        # id -> [input index, arrival, burst, executed, first start, switches, overhead, io time, io wait, device]
+        self._live = {}
+        self._count = 0
+        self._finished = 0
+        self.segments = 0
+        self._first_arrival = None
+        self._last_completion = None
+        self._busy_time = [0] * cpus  # By CPU number
+        self._last_on = [None] * cpus  # Process of the last segment on each CPU, None after idle time
+        self._lane_end = [None] * cpus  # End of the last segment on each CPU
+        self._switches = 0
+        self._overhead_time = 0
+        self._device_busy = {}  # Device -> time spent serving I/O
+        self._total_turnaround = 0
+        self._total_waiting = 0
+        self._total_response = 0
+        self._total_io = 0
+        self._total_io_wait = 0
+        self._waiting = QuantileSketch()
+        self._response = QuantileSketch()
+        self._completions = WindowedCounter(window)
+        self._shares = 0.0  # Sum and sum of squares of the fair shares, for Jain's index
+        self._share_squares = 0.0
+
+    def add_process(self, process):
+        """Register a process dictionary before any of its segments are added"""
+        self._live[process["id"]] = [self._count, process["arrival"], process["burst"], 0, None, 0, 0, 0, 0,
+                                     process.get("device", 0)]
+        self._count += 1
+        if self._first_arrival is None or process["arrival"] < self._first_arrival:
+            self._first_arrival = process["arrival"]
+
+    def track(self, processes):
+        """Register every process of an iterable while passing it through unchanged"""
+        for process in processes:
+            self.add_process(process)
+            yield process
+
+    def add_segment(self, result):
+        """
+        Account for one result segment
+
+        Returns:
+            dict: The finished process's metrics row if this segment completed
+            it, otherwise None
+        """
+        state = self._live[result["id"]]
+        duration = result["end"] - result["start"]
+        kind = result.get("kind", "run")
+        if kind in ("io_wait", "io"):
+            # Blocked on I/O, on no CPU
+            state[7] += duration
+            if kind == "io_wait":
+                state[8] += duration
+            else:
+                self._device_busy[state[9]] = self._device_busy.get(state[9], 0) + duration
+            return None
+
+        cpu = result.get("cpu", 0)
+        if self._lane_end[cpu] is None or result["start"] > self._lane_end[cpu]:
+            self._last_on[cpu] = None  # The CPU went idle, so the next process starts fresh
+        if self._last_on[cpu] is not None and self._last_on[cpu] != result["id"]:
+            state[5] += 1
+            self._switches += 1
+        self._last_on[cpu] = result["id"]
+        self._lane_end[cpu] = result["end"]
+        if kind != "run":
+            state[6] += duration
+            self._overhead_time += duration
+            return None
+
+        if state[4] is None:
+            state[4] = result["start"]
+        state[3] += duration
+        self.segments += 1
+        self._busy_time[cpu] += duration
+        # Float bursts split over several segments may sum a hair short
+        if state[3] >= state[2] * (1 - 1e-9):
+            return self._finish(result["id"], result["end"])
+        return None
+
+    def finish(self):
+        """
+        Close out processes that never completed a segment, such as zero-length bursts
+
+        Returns:
+            list: Their metrics rows
+        """
+        return [
+            self._finish(pid, state[1] if state[4] is None else state[4] + state[3])
+            for pid, state in list(self._live.items())
+        ]
+
+    def _finish(self, pid, completion_time):
+        index, arrival, burst, executed, first_start, switches, overhead, io, io_wait, _ = self._live.pop(pid)
+        if first_start is None:
+            first_start = completion_time
+        turnaround_time = completion_time - arrival
+        row = {
+            "index": index,
+            "id": pid,
+            "arrival_time": arrival,
+            "burst_time": executed,
+            "completion_time": completion_time,
+            "turnaround_time": turnaround_time,
+            "waiting_time": turnaround_time - executed - io,
+            "response_time": first_start - arrival,
+            "context_switches": switches,
+            "overhead_time": overhead,
+            "io_time": io,
+            "io_wait_time": io_wait,
+        }
+        self._finished += 1
+        if self._last_completion is None or completion_time > self._last_completion:
+            self._last_completion = completion_time
+        self._total_turnaround += turnaround_time
+        self._total_waiting += row["waiting_time"]
+        self._total_response += row["response_time"]
+        self._total_io += io
+        self._total_io_wait += io_wait
+        self._waiting.add(row["waiting_time"])
+        self._response.add(row["response_time"])
+        self._completions.add(completion_time)
+        share = fair_share(executed, row["waiting_time"])
+        self._shares += share
+        self._share_squares += share * share
+        return row
+
+    def _device_utilization(self, makespan):
+        devices = max(self._device_busy) + 1 if self._device_busy else 0
+        return [self._device_busy.get(device, 0) / makespan if makespan > 0 else 1.0 for device in range(devices)]
+
+    def summary(self):
+        """Aggregate metrics over the finished processes, keyed like metrics.summary_metrics"""
+        count = self._finished
+        window, windowed = self._completions.rates()
+        tails = {**percentile_summary("waiting_time", self._waiting),
+                 **percentile_summary("response_time", self._response),
+                 "throughput_window": window, "windowed_throughput": windowed,
+                 "peak_throughput": max(windowed, default=0.0),
+                 "jain_fairness_index": jain_index(self._shares, self._share_squares, count) if count else 1.0}
+        if count == 0:
+            return {"processes": 0, "segments": self.segments, "makespan": 0, "cpus": len(self._busy_time),
+                    "cpu_utilization": 0.0, "per_cpu_utilization": [0.0] * len(self._busy_time),
+                    "throughput": 0.0, "average_turnaround_time": 0.0,
+                    "average_waiting_time": 0.0, "average_response_time": 0.0,
+                    "context_switches": self._switches, "overhead_time": self._overhead_time,
+                    "overhead_fraction": overhead_fraction(self._overhead_time, sum(self._busy_time)),
+                    "average_io_time": 0.0, "average_io_wait_time": 0.0, "device_utilization": [], **tails}
+        makespan = self._last_completion - self._first_arrival
+        return {
+            "processes": count,
+            "segments": self.segments,
+            "makespan": makespan,
+            "cpus": len(self._busy_time),
+            "cpu_utilization": sum(self._busy_time) / (makespan * len(self._busy_time)) if makespan > 0 else 1.0,
+            "per_cpu_utilization": [busy / makespan if makespan > 0 else 1.0 for busy in self._busy_time],
+            "throughput": count / makespan if makespan > 0 else float(count),
+            "average_turnaround_time": self._total_turnaround / count,
+            "average_waiting_time": self._total_waiting / count,
+            "average_response_time": self._total_response / count,
+            "context_switches": self._switches,
+            "overhead_time": self._overhead_time,
+            "overhead_fraction": overhead_fraction(self._overhead_time, sum(self._busy_time)),
+            "average_io_time": self._total_io / count,
+            "average_io_wait_time": self._total_io_wait / count,
+            "device_utilization": self._device_utilization(makespan),
+            **tails,
+        }
@@ -1,16 +1,26 @@
+import math
+import queue
+import re
 import tkinter as tk
 from tkinter import ttk
+from tkinter import filedialog
 from tkinter import messagebox
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-from algorithms import start_simulation
+from algorithms import SCHEDULERS, Overhead, algorithm_label
+from columnar import ProcessTable
+from columnar_io import SCHEDULE_EXTENSION, load_schedule, load_workload, save_schedule
 from visualization import (
     update_visualization, 
     calculate_process_metrics, 
     create_gantt_chart_in_frame, 
     create_metrics_table_in_frame, 
-    show_process_states_in_frame
+    show_process_states_in_frame,
+    show_telemetry_in_frame
 )
+from table_view import VirtualTable
+from incremental import IncrementalSimulator
+from result_cache import ResultCache
+from telemetry import Telemetry
+from worker import SimulationWorker
 
 # Color Theme Configuration
 class GUITheme:
@@ -34,10 +44,18 @@ class GUITheme:
     LABEL_FONT = ("Helvetica", 10, "bold")
     NORMAL_FONT = ("Helvetica", 10)
 
+# Milliseconds between two polls of a running simulation (about 60 updates per second)
+POLL_INTERVAL_MS = 16
+
+# Headings of the process input table
+PROCESS_TABLE_HEADINGS = {"ID": "Process ID", "Arrival": "Arrival Time", "Burst": "Burst Time", "Priority": "Priority"}
+
 # Global variables
-processes = []
+processes = ProcessTable.empty()  # Replaced, never modified, on every edit
 simulation_results = None
 simulation_process_data = None
+simulation_workload = None
+simulation_settings = None  # Options of the simulation on display, None for an opened schedule
 show_states_button = None
 
 # Result frame variables
@@ -47,16 +65,43 @@ metrics_frame = None
 states_frame = None
 states_visible = False
 notebook = None
+placeholder_label = None
+
+# Background simulation state
+simulation_worker = None
+# Schedules by workload content, algorithm and quantum; misses after adding or
+# removing a process resume from the previous run's checkpoints
+result_cache = ResultCache(runner=IncrementalSimulator().simulate)
+start_button = None
+progress_frame = None
+progress_bar = None
+progress_label = None
+
+# Anything that can still be typed into a number: "-", "1.", "2.5e" and so on
+PARTIAL_NUMBER = re.compile(r"[+-]?\d*\.?\d*(?:[eE][+-]?\d*)?")
 
 def validate_numeric_input(value):
-    """Validate if the input is numeric"""
-    if value == "":
-        return True
+    """Validate if the input is numeric, allowing decimals and exponents while they are typed"""
+    return PARTIAL_NUMBER.fullmatch(value) is not None
+
+def parse_number(value):
+    """
+    Parse an entry as an int when possible, otherwise as a float
+
+    Integers stay Python ints, so nanosecond timestamps are kept exact
+    however large they are; fractional times (microseconds in seconds, say)
+    become floats.
+
+    Raises:
+        ValueError: If the value is not a finite number
+    """
     try:
-        int(value)
-        return True
+        return int(value)
     except ValueError:
-        return False
+        number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"{value!r} is not a finite number")
+    return number
 
 def add_process():
     # Get input values
@@ -68,35 +113,42 @@ def add_process():
         messagebox.showerror("Input Error", "Arrival time and burst time are required.")
         return
         
-    # Validate numeric values
-    if not validate_numeric_input(arrival_time) or not validate_numeric_input(burst_time):
+    # Validate numeric values; times may be integers or decimals
+    try:
+        arrival_time, burst_time = parse_number(arrival_time), parse_number(burst_time)
+    except ValueError:
         messagebox.showerror("Input Error", "Please enter numeric values for arrival time and burst time.")
         return
     
     # Check priority field if algorithm requires it
     selected_algorithm = algorithm_var.get()
-    if selected_algorithm in ["priority_preemptive", "priority_non_preemptive"]:
+    if SCHEDULERS[selected_algorithm].priority:
         priority = priority_entry.get()
         if not priority:
-            messagebox.showerror("Input Error", "Priority value is required for Priority scheduling algorithms.")
+            messagebox.showerror("Input Error", f"Priority value is required for {algorithm_label(selected_algorithm)}.")
             return
-        if not validate_numeric_input(priority):
-            messagebox.showerror("Input Error", "Please enter a numeric value for priority.")
+        try:
+            priority = int(priority)
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter an integer value for priority.")
             return
     else:
         priority = 0
     
     # All validations passed, add the process
-    process_id = f"P{len(processes) + 1}"
-    processes.append({
-        "id": process_id, 
-        "arrival": int(arrival_time), 
-        "burst": int(burst_time), 
-        "priority": int(priority_entry.get()) if priority_entry.winfo_ismapped() and priority_entry.get() else 0
-    })
+    global processes
+    try:
+        processes = processes.append(
+            arrival_time,
+            burst_time,
+            priority
+        )
+    except ValueError as error:
+        messagebox.showerror("Input Error", str(error))
+        return
 
     # Clear input fields
-    process_id_label.config(text=f"P{len(processes) + 1}")
+    process_id_label.config(text=processes.next_id())
     arrival_time_entry.delete(0, tk.END)
     burst_time_entry.delete(0, tk.END)
     if priority_entry.winfo_ismapped():
@@ -106,43 +158,56 @@ def add_process():
     update_process_table()
 
 def remove_process():
-    # Get selected item from the table
-    selected_item = process_table.selection()
+    # Get the selected row from the table; rows follow the order of the process list
+    selected_row = process_table.selected_row
     
-    if not selected_item:
+    if selected_row is None:
         messagebox.showinfo("Remove Process", "Please select a process to remove.")
         return
     
-    # Get the process ID of the selected item
-    process_id = process_table.item(selected_item)['values'][0]
-    
-    # Find and remove the process from the list
-    for i, process in enumerate(processes):
-        if process["id"] == process_id:
-            processes.pop(i)
-            break
-    
-    # Renumber the remaining processes sequentially
-    for i, process in enumerate(processes):
-        process["id"] = f"P{i+1}"
+    # Remove the process; default IDs are renumbered, imported or appended ones are kept
+    global processes
+    processes = processes.remove(selected_row)
     
     # Update the process table
     update_process_table()
     
     # Update the next process ID label
-    process_id_label.config(text=f"P{len(processes) + 1}")
+    process_id_label.config(text=processes.next_id())
 
 def update_process_table():
-    # Clear existing rows
-    for row in process_table.get_children():
-        process_table.delete(row)
-
-    # Insert new rows
-    for process in processes:
-        if "Priority" in process_table["columns"]:
-            process_table.insert("", "end", values=(process["id"], process["arrival"], process["burst"], process["priority"]))
-        else:
-            process_table.insert("", "end", values=(process["id"], process["arrival"], process["burst"]))
+    # The table only materializes the rows in view, so refreshing it is cheap even for large workloads
+    data = {"ID": processes.ids, "Arrival": processes.arrival, "Burst": processes.burst}
+    if "Priority" in process_table.columns:
+        data["Priority"] = processes.priority
+    process_table.set_data(data, sort_keys={"ID": range(len(processes))})
+
+def import_workload():
+    """Load a recorded trace into the process table, replacing the current processes"""
+    path = filedialog.askopenfilename(
+        title="Import Workload",
+        filetypes=[
+            ("Workload files", "*.csv *.jsonl *.ndjson *.json *.wkl *.parquet"),
+            ("All files", "*.*"),
+        ]
+    )
+    if not path:
+        return
+    
+    # Parsing goes straight into columns; the table only renders the visible rows
+    global processes
+    root.config(cursor="watch")
+    root.update_idletasks()
+    try:
+        processes = load_workload(path)
+    except (OSError, KeyError, ValueError, ImportError) as error:
+        messagebox.showerror("Import Error", f"Could not import {path}:\n{error}")
+        return
+    finally:
+        root.config(cursor="")
+    
+    process_id_label.config(text=processes.next_id())
+    update_process_table()
 
 def update_input_fields(event):
     # Get selected algorithm
@@ -150,36 +215,29 @@ def update_input_fields(event):
     
     # Clear existing processes
     global processes
-    processes = []
+    processes = ProcessTable.empty()
     
     # Reset the process ID label
     process_id_label.config(text="P1")
     
     # Handle priority field visibility
-    if selected_algorithm in ["priority_preemptive", "priority_non_preemptive"]:
+    if SCHEDULERS[selected_algorithm].priority:
         # Configure table columns to include Priority
-        process_table.config(columns=("ID", "Arrival", "Burst", "Priority"))
-        process_table.heading("ID", text="Process ID")
-        process_table.heading("Arrival", text="Arrival Time")
-        process_table.heading("Burst", text="Burst Time")
-        process_table.heading("Priority", text="Priority")
+        process_table.set_columns(("ID", "Arrival", "Burst", "Priority"), PROCESS_TABLE_HEADINGS)
         
         # Show priority label and entry
         priority_label.grid(column=3, row=0, sticky=tk.W, pady=5)
         priority_entry.grid(column=3, row=1, pady=5)
     else:
         # Configure table columns without Priority
-        process_table.config(columns=("ID", "Arrival", "Burst"))
-        process_table.heading("ID", text="Process ID")
-        process_table.heading("Arrival", text="Arrival Time")
-        process_table.heading("Burst", text="Burst Time")
+        process_table.set_columns(("ID", "Arrival", "Burst"), PROCESS_TABLE_HEADINGS)
         
         # Hide priority label and entry
         priority_label.grid_forget()
         priority_entry.grid_forget()
 
     # Handle time quantum field visibility
-    if selected_algorithm == "round_robin":
+    if SCHEDULERS[selected_algorithm].time_quantum:
         time_quantum_label.grid(column=0, row=2, sticky=tk.W, pady=5)
         time_quantum_entry.grid(column=1, row=2, pady=5)
     else:
@@ -234,6 +292,12 @@ def setup_results_frame():
                                    command=lambda: show_process_states_tab())
     show_states_button.pack(pady=10, padx=20)
     
+    # Create show telemetry button
+    ttk.Button(right_frame, text="Show Telemetry", command=show_telemetry_tab).pack(pady=10, padx=20)
+    
+    # Create save schedule button
+    ttk.Button(right_frame, text="Save Schedule...", command=save_schedule_handler).pack(pady=10, padx=20)
+    
     return gantt_frame, metrics_frame
 
 def show_process_states_tab():
@@ -253,6 +317,38 @@ def show_process_states_tab():
     # Create process states visualization
     show_process_states_in_frame(simulation_results, simulation_process_data, states_tab)
 
+def show_telemetry_tab():
+    """Show the telemetry of the displayed simulation, running it again to record it"""
+    global simulation_worker
+    
+    # Check if telemetry tab already exists
+    for tab_id in notebook.tabs():
+        if notebook.tab(tab_id, "text") == "Telemetry":
+            notebook.select(tab_id)
+            return
+    
+    if simulation_settings is None:
+        messagebox.showinfo("Telemetry", "Telemetry is recorded while simulating; run a simulation to see it.")
+        return
+    if simulation_worker is not None:
+        return
+    
+    # Results may come from the cache, so the run is repeated on a worker with a recorder
+    simulation_worker = SimulationWorker(simulation_workload, telemetry=Telemetry(), **simulation_settings)
+    simulation_worker.start()
+    start_button.state(["disabled"])
+    progress_bar["value"] = 0
+    progress_label.config(text="Recording telemetry...")
+    progress_frame.grid()
+    root.after(POLL_INTERVAL_MS, poll_simulation)
+
+def show_telemetry_results(telemetry, workload):
+    """Add the telemetry recorded by a worker to the results notebook"""
+    telemetry_tab = ttk.Frame(notebook)
+    notebook.add(telemetry_tab, text="Telemetry")
+    notebook.select(telemetry_tab)
+    show_telemetry_in_frame(telemetry.series(), workload.ids, telemetry_tab)
+
 def start_simulation_handler():
     # Check if processes exist
     if not processes:
@@ -262,27 +358,111 @@ def start_simulation_handler():
     # Get selected algorithm
     selected_algorithm = algorithm_var.get()
     
-    # Validate time quantum for Round Robin
-    if selected_algorithm == "round_robin":
+    # Validate the time quantum of the algorithms that take one
+    if SCHEDULERS[selected_algorithm].time_quantum:
         time_quantum = time_quantum_entry.get()
         if not time_quantum:
-            messagebox.showerror("Input Error", "Time Quantum is required for Round Robin algorithm.")
+            messagebox.showerror("Input Error", f"Time Quantum is required for {algorithm_label(selected_algorithm)}.")
             return
         
-        if not validate_numeric_input(time_quantum):
+        try:
+            time_quantum = parse_number(time_quantum)
+        except ValueError:
             messagebox.showerror("Input Error", "Please enter a numeric value for Time Quantum.")
             return
-        
-        time_quantum = int(time_quantum)
     else:
         time_quantum = None
+    
+    # Validate the number of CPUs
+    cpus = cpus_var.get()
+    if not cpus.isdigit() or int(cpus) < 1:
+        messagebox.showerror("Input Error", "Number of CPUs must be a positive integer.")
+        return
+    cpus = int(cpus)
+    run_queues = "per_cpu" if per_cpu_queues_var.get() else "global"
 
-    # Run simulation
-    global simulation_results, simulation_process_data
-    simulation_results = start_simulation(processes, algorithm=selected_algorithm, time_quantum=time_quantum)
+    # Validate the scheduling overhead costs; all empty means no overhead is modelled
+    try:
+        costs = [parse_number(var.get() or "0") for var in overhead_vars]
+        if min(costs) < 0:
+            raise ValueError("negative overhead cost")
+    except ValueError:
+        messagebox.showerror("Input Error", "Overhead costs must be non-negative numbers.")
+        return
+    overhead = Overhead(*costs) if any(var.get() for var in overhead_vars) else None
+
+    # Run the simulation and the metrics on a worker thread so the window stays responsive.
+    # Edits replace the process table rather than modify it, so the worker's copy stays intact.
+    global simulation_worker
+    workload = processes
+    simulation_worker = SimulationWorker(
+        workload, selected_algorithm, time_quantum,
+        after=lambda results: calculate_process_metrics(results, workload),
+        cache=result_cache,
+        cpus=cpus,
+        run_queues=run_queues,
+        overhead=overhead
+    )
+    simulation_worker.start()
+    
+    # Show the progress bar until the worker reports back
+    start_button.state(["disabled"])
+    progress_bar["value"] = 0
+    progress_label.config(text="Simulating...")
+    progress_frame.grid()
+    root.after(POLL_INTERVAL_MS, poll_simulation)
+
+def cancel_simulation():
+    """Cancel the running simulation; the worker stops at its next progress report"""
+    if simulation_worker is not None:
+        simulation_worker.cancel()
+        progress_label.config(text="Cancelling...")
+
+def poll_simulation():
+    """Drain the worker's message queue from the Tk event loop"""
+    global simulation_worker
+    worker = simulation_worker
+    if worker is None:
+        return
+    
+    while True:
+        try:
+            message = worker.messages.get_nowait()
+        except queue.Empty:
+            # Still running: check again on the next tick
+            root.after(POLL_INTERVAL_MS, poll_simulation)
+            return
+        
+        kind = message[0]
+        if kind == "progress":
+            _, events, fraction = message
+            progress_bar["value"] = fraction
+            progress_label.config(text=f"Simulating... {events:,} segments ({fraction:.0%})")
+        elif kind == "stage":
+            progress_label.config(text=message[1])
+        else:
+            break
     
-    # Calculate process metrics
-    simulation_process_data = calculate_process_metrics(simulation_results)
+    # The worker has finished one way or another
+    simulation_worker = None
+    start_button.state(["!disabled"])
+    progress_frame.grid_remove()
+    if kind == "done" and worker.telemetry is not None:
+        show_telemetry_results(worker.telemetry, worker.processes)
+    elif kind == "done":
+        settings = {"algorithm": worker.algorithm, "time_quantum": worker.time_quantum, "cpus": worker.cpus,
+                    "run_queues": worker.run_queues, "overhead": worker.overhead}
+        show_simulation_results(message[1], message[2], worker.processes, settings)
+    elif kind == "error":
+        messagebox.showerror("Simulation Error", str(message[1]))
+
+def show_simulation_results(results, process_data, workload=None, settings=None):
+    """Display a finished simulation, run with SimulationWorker options ``settings``, in the results notebook"""
+    global simulation_results, simulation_process_data, simulation_workload, simulation_settings
+    simulation_results = results
+    simulation_process_data = process_data
+    simulation_workload = workload
+    simulation_settings = settings
     
     # Set up results frame
     gantt_frame, metrics_frame = setup_results_frame()
@@ -291,14 +471,47 @@ def start_simulation_handler():
     create_gantt_chart_in_frame(simulation_results, gantt_frame)
     
     # Create metrics table
-    create_metrics_table_in_frame(simulation_process_data, metrics_frame)
+    create_metrics_table_in_frame(simulation_process_data, metrics_frame, simulation_results, workload)
     
     # Show results frame
     result_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     
-    # Hide original canvas if it exists
-    if canvas:
-        canvas.get_tk_widget().grid_forget()
+    # Hide the placeholder if it exists
+    if placeholder_label:
+        placeholder_label.grid_forget()
+
+def save_schedule_handler():
+    """Write the displayed schedule, with its workload, to a memory-mappable schedule file"""
+    if simulation_results is None:
+        messagebox.showinfo("Save Schedule", "Run a simulation before saving its schedule.")
+        return
+    path = filedialog.asksaveasfilename(
+        title="Save Schedule",
+        defaultextension=SCHEDULE_EXTENSION,
+        filetypes=[("Schedule files", f"*{SCHEDULE_EXTENSION}"), ("All files", "*.*")]
+    )
+    if not path:
+        return
+    try:
+        save_schedule(simulation_results, path, simulation_workload)
+    except OSError as error:
+        messagebox.showerror("Save Error", f"Could not save {path}:\n{error}")
+
+def open_schedule():
+    """Show a saved schedule; its segments are memory-mapped rather than read"""
+    path = filedialog.askopenfilename(
+        title="Open Schedule",
+        filetypes=[("Schedule files", f"*{SCHEDULE_EXTENSION}"), ("All files", "*.*")]
+    )
+    if not path:
+        return
+    try:
+        schedule = load_schedule(path)
+    except (OSError, KeyError, ValueError) as error:
+        messagebox.showerror("Open Error", f"Could not open {path}:\n{error}")
+        return
+    process_data = calculate_process_metrics(schedule.result, schedule.workload)
+    show_simulation_results(schedule.result, process_data, schedule.workload)
 
 def create_gui(theme=GUITheme):
     """
@@ -307,10 +520,10 @@ def create_gui(theme=GUITheme):
     Args:
         theme (class): Theme class with color and sizing configurations
     """
-    global root, figure, ax, canvas
+    global root, placeholder_label, start_button, progress_frame, progress_bar, progress_label
     global arrival_time_entry, burst_time_entry, priority_entry
     global process_id_label, priority_label, time_quantum_label, time_quantum_entry
-    global algorithm_var, process_table
+    global algorithm_var, process_table, cpus_var, per_cpu_queues_var, overhead_vars
     
     # Create main window
     root = tk.Tk()
@@ -394,10 +607,38 @@ def create_gui(theme=GUITheme):
     remove_button = ttk.Button(left_container, text="Remove Process", command=remove_process)
     remove_button.grid(column=4, row=2, pady=5)
 
+    import_button = ttk.Button(left_container, text="Import Workload...", command=import_workload)
+    import_button.grid(column=4, row=3, pady=5)
+
+    open_schedule_button = ttk.Button(left_container, text="Open Schedule...", command=open_schedule)
+    open_schedule_button.grid(column=3, row=3, pady=5)
+
     # Time Quantum Label and Entry (initially hidden)
-    time_quantum_label = ttk.Label(left_container, text="Time Quantum (for RR):", font=theme.LABEL_FONT)
+    time_quantum_label = ttk.Label(left_container, text="Time Quantum:", font=theme.LABEL_FONT)
     time_quantum_entry = ttk.Entry(left_container, validate="key", validatecommand=(validate_numeric, '%P'))
 
+    # Number of simulated CPUs and the layout of their ready queues
+    cpu_frame = ttk.Frame(left_container)
+    cpu_frame.grid(column=2, row=2, columnspan=2, sticky=tk.W, pady=5)
+    ttk.Label(cpu_frame, text="CPUs:", font=theme.LABEL_FONT).pack(side=tk.LEFT)
+    cpus_var = tk.StringVar(value="1")
+    ttk.Spinbox(cpu_frame, from_=1, to=256, width=5, textvariable=cpus_var,
+                validate="key", validatecommand=(validate_numeric, '%P')).pack(side=tk.LEFT, padx=5)
+    per_cpu_queues_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(cpu_frame, text="Per-CPU queues", variable=per_cpu_queues_var).pack(side=tk.LEFT)
+
+    # Scheduling overhead costs, in Overhead field order; leave them empty for an ideal scheduler
+    overhead_frame = ttk.Frame(left_container)
+    overhead_frame.grid(column=0, row=5, columnspan=5, sticky=tk.W, pady=5)
+    ttk.Label(overhead_frame, text="Overhead:", font=theme.LABEL_FONT).pack(side=tk.LEFT)
+    overhead_vars = []
+    for text in ("Context switch", "Cache warmup", "Dispatch"):
+        ttk.Label(overhead_frame, text=text).pack(side=tk.LEFT, padx=(10, 2))
+        var = tk.StringVar()
+        ttk.Entry(overhead_frame, width=5, textvariable=var,
+                  validate="key", validatecommand=(validate_numeric, '%P')).pack(side=tk.LEFT)
+        overhead_vars.append(var)
+
     # Algorithm Selection Dropdown
     algorithm_var = tk.StringVar(value="fcfs")
     algorithm_label = ttk.Label(left_container, text="Select Algorithm:", font=theme.LABEL_FONT)
@@ -406,47 +647,35 @@ def create_gui(theme=GUITheme):
         left_container, 
         algorithm_var, 
         "fcfs", 
-        "fcfs", "sjf_preemptive", "sjf_non_preemptive", 
-        "priority_preemptive", "priority_non_preemptive", 
-        "round_robin", 
+        *SCHEDULERS,  # Every registered algorithm
         command=update_input_fields
     )
     algorithm_dropdown.grid(column=1, row=3, columnspan=2, pady=5)
 
-    # Process Table
-    process_table = ttk.Treeview(
-        left_container, 
-        columns=("ID", "Arrival", "Burst"), 
-        show="headings", 
-        height=6
-    )
-    process_table.heading("ID", text="Process ID")
-    process_table.heading("Arrival", text="Arrival Time")
-    process_table.heading("Burst", text="Burst Time")
-    
-    # Set column widths
-    process_table.column("ID", width=100)
-    process_table.column("Arrival", width=100)
-    process_table.column("Burst", width=100)
-    
-    # Place the table in the GUI
-    process_table.grid(column=0, row=4, columnspan=5, pady=5, sticky=(tk.W, tk.E))
+    # Process Table (virtualized, so large workloads only materialize the visible rows)
+    process_table = VirtualTable(left_container, ("ID", "Arrival", "Burst"), PROCESS_TABLE_HEADINGS, height=6)
     
-    # Add scrollbar to the table
-    scrollbar = ttk.Scrollbar(left_container, orient=tk.VERTICAL, command=process_table.yview)
-    process_table.configure(yscroll=scrollbar.set)
-    scrollbar.grid(column=5, row=4, sticky=(tk.N, tk.S))
+    # Place the table and its scrollbar in the GUI
+    process_table.tree.grid(column=0, row=4, columnspan=5, pady=5, sticky=(tk.W, tk.E))
+    process_table.scrollbar.grid(column=5, row=4, sticky=(tk.N, tk.S))
 
     # Start Simulation Button
     start_button = ttk.Button(input_frame, text="Start Simulation", command=start_simulation_handler)
     start_button.grid(column=0, row=5, pady=10, sticky=(tk.W, tk.E))
 
-    # Create a canvas for initial visualization
-    figure = plt.Figure(figsize=(8, 4), dpi=100)
-    ax = figure.add_subplot(111)
-    ax.set_title("Simulation Results Will Appear Here")
-    canvas = FigureCanvasTkAgg(figure, root)
-    canvas.get_tk_widget().grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+    # Progress bar and Cancel button, shown while a simulation runs
+    progress_frame = ttk.Frame(input_frame)
+    progress_frame.grid(column=0, row=6, sticky=(tk.W, tk.E))
+    progress_bar = ttk.Progressbar(progress_frame, mode="determinate", maximum=1.0, length=300)
+    progress_bar.pack(side=tk.LEFT, padx=(0, 10))
+    ttk.Button(progress_frame, text="Cancel", command=cancel_simulation).pack(side=tk.LEFT)
+    progress_label = ttk.Label(progress_frame, text="")
+    progress_label.pack(side=tk.LEFT, padx=10)
+    progress_frame.grid_remove()
+
+    # Placeholder until the first simulation; matplotlib is only loaded once a chart is drawn
+    placeholder_label = ttk.Label(root, text="Simulation Results Will Appear Here", font=theme.HEADER_FONT, anchor=tk.CENTER)
+    placeholder_label.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
     # Configure row and column weights
     root.columnconfigure(0, weight=1)
@@ -0,0 +1,212 @@
+import numpy as np
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualTable:
+    """
+    Treeview that only materializes the rows currently in view
+
+    The data lives in column sequences (lists or NumPy arrays) and the tree
+    holds one item per visible row. Scrolling rewrites those items' values
+    instead of inserting the whole table, so filling or refreshing it costs
+    the same for ten rows or a million, and values are only formatted once
+    they scroll into view. Clicking a heading sorts by that column through
+    an argsort that is computed once per column and reused in both
+    directions.
+
+    The tree and its scrollbar are exposed as ``tree`` and ``scrollbar`` for
+    the caller to place with its own geometry manager.
+
+    Args:
+        parent: Tk container for the tree and its scrollbar
+        columns (tuple): Column names
+        headings (dict, optional): Heading text per column, defaults to the name
+        formats (dict, optional): Format string (``"{:.1f}"``) or callable per column
+        height (int): Number of rows shown until the widget is resized
+        width (int): Width of every column in pixels
+    """
+
+    def __init__(self, parent, columns, headings=None, formats=None, height=10, width=100):
+        self.tree = ttk.Treeview(parent, show="headings", height=height, selectmode="browse")
+        self.scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.yview)
+        self.formats = formats or {}
+        self.width = width
+        self.selected_row = None  # Data row of the selection, kept while it scrolls out of view
+        self._data = {}
+        self._sort_keys = {}
+        self._argsorts = {}       # Column -> ascending argsort, computed on first use
+        self._count = 0
+        self._order = None        # Row permutation of the current sort, None for data order
+        self._sorted_by = None    # (column, descending)
+        self._top = 0
+        self._visible = height
+        self._slots = []          # Tree items, one per visible row
+        self._slot_rows = []      # Data row shown by each slot
+        self.set_columns(columns, headings)
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", lambda event: self.yview("scroll", -1 if event.delta > 0 else 1, "units"))
+        # X11 reports the wheel as buttons 4 and 5
+        self.tree.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))
+        self.tree.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+        self.tree.bind("<Up>", lambda event: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda event: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda event: self._move_selection(-self._visible))
+        self.tree.bind("<Next>", lambda event: self._move_selection(self._visible))
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def __len__(self):
+        return self._count
+
+    def set_columns(self, columns, headings=None):
+        """Replace the columns; the data should be set again afterwards"""
+        self._columns = tuple(columns)
+        self._headings = {column: (headings or {}).get(column, column) for column in self._columns}
+        self.tree.configure(columns=self._columns)
+        for column in self._columns:
+            self.tree.heading(column, text=self._headings[column], command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=self.width, anchor=tk.CENTER)
+        self._sorted_by = None
+        self._order = None
+
+    def set_data(self, data, sort_keys=None):
+        """
+        Show new data, keeping the current sort column
+
+        Args:
+            data (dict): Column name -> sequence, all of the same length
+            sort_keys (dict, optional): Column name -> sequence to sort that
+                column by instead of its values (e.g. the row number for IDs
+                like "P10" that should not sort as text)
+        """
+        self._data = data
+        self._sort_keys = sort_keys or {}
+        self._argsorts = {}
+        self._count = len(next(iter(data.values()))) if data else 0
+        self._order = None
+        self.selected_row = None
+        if self._sorted_by and self._sorted_by[0] in data:
+            self.sort_by(*self._sorted_by)
+        else:
+            self._sorted_by = None
+            self._render()
+
+    def sort_by(self, column, descending=None):
+        """Sort by ``column``; without ``descending`` a repeated click flips the direction"""
+        if descending is None:
+            descending = self._sorted_by == (column, False)
+        if column not in self._argsorts:
+            keys = self._sort_keys.get(column, self._data.get(column, ()))
+            self._argsorts[column] = np.argsort(np.asarray(keys), kind="stable")
+        ascending = self._argsorts[column]
+        self._order = ascending[::-1] if descending else ascending
+        self._sorted_by = (column, descending)
+
+        for name in self._columns:
+            arrow = (" ▼" if descending else " ▲") if name == column else ""
+            self.tree.heading(name, text=self._headings[name] + arrow)
+        if self.selected_row is not None:
+            self.see(self.selected_row)
+        else:
+            self._top = 0
+            self._render()
+
+    def _position(self, row):
+        """Position of a data row in the current order"""
+        if self._order is None:
+            return row
+        return int(np.flatnonzero(self._order == row)[0])
+
+    def see(self, row):
+        """Scroll so that data row ``row`` is visible"""
+        position = self._position(row)
+        if position < self._top:
+            self._top = position
+        elif position >= self._top + self._visible:
+            self._top = position - self._visible + 1
+        self._render()
+
+    def yview(self, *args):
+        """Scrollbar command ('moveto' or 'scroll')"""
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * self._count)
+        elif args[0] == "scroll":
+            step = max(1, self._visible - 1) if args[2] == "pages" else 1
+            self._top += int(args[1]) * step
+        self._render()
+        return "break"
+
+    def _move_selection(self, step):
+        if not self._count:
+            return "break"
+        position = self._top if self.selected_row is None else self._position(self.selected_row) + step
+        position = min(max(position, 0), self._count - 1)
+        self.selected_row = position if self._order is None else int(self._order[position])
+        self.see(self.selected_row)
+        return "break"
+
+    def _render(self):
+        self._top = max(0, min(self._top, self._count - self._visible))
+        shown = min(self._visible, self._count - self._top)
+
+        # Keep exactly one tree item per visible row
+        while len(self._slots) < shown:
+            self._slots.append(self.tree.insert("", "end"))
+        if len(self._slots) > shown:
+            self.tree.delete(*self._slots[shown:])
+            del self._slots[shown:]
+
+        if self._order is None:
+            rows = np.arange(self._top, self._top + shown)
+        else:
+            rows = self._order[self._top:self._top + shown]
+        self._slot_rows = rows.tolist()
+
+        # Format only the visible cells, one column at a time
+        cells = []
+        for column in self._columns:
+            values = self._data.get(column, ())
+            if isinstance(values, np.ndarray):
+                values = values[rows].tolist()
+            else:
+                values = [values[row] for row in self._slot_rows] if len(values) else [""] * shown
+            fmt = self.formats.get(column)
+            if callable(fmt):
+                values = [fmt(value) for value in values]
+            elif fmt:
+                values = [fmt.format(value) for value in values]
+            cells.append(values)
+        for slot, values in zip(self._slots, zip(*cells)):
+            self.tree.item(slot, values=values)
+
+        # Restore the selection if its row is in view
+        self.tree.selection_remove(*self.tree.selection())
+        if self.selected_row in self._slot_rows:
+            self.tree.selection_set(self._slots[self._slot_rows.index(self.selected_row)])
+
+        if self._count:
+            self.scrollbar.set(self._top / self._count, (self._top + shown) / self._count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _on_configure(self, event):
+        # Fit the number of slots to the widget's height
+        row_height, heading_height = 20, 25
+        if self._slots:
+            bbox = self.tree.bbox(self._slots[0])
+            if bbox:
+                heading_height, row_height = bbox[1], bbox[3]
+        visible = max(1, (event.height - heading_height) // max(1, row_height))
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if selection and selection[0] in self._slots:
+            self.selected_row = self._slot_rows[self._slots.index(selection[0])]
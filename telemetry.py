@@ -0,0 +1,164 @@
+import numpy as np
+
+from algorithms import RUN
+from stream_metrics import initial_window
+
+# Most windows the automatic telemetry window width leaves over a workload's estimated span
+TELEMETRY_WINDOWS = 200
+# Upper bound on the windows allocated up front for a fixed width; longer runs grow the arrays
+MAX_PREALLOCATED_WINDOWS = 1 << 16
+
+
+class Telemetry:
+    """
+    Per-window time series of a simulation, recorded by the event engine as it runs
+
+    Pass one to start_simulation (``telemetry=``). The arrival cursor
+    reports every arrival, every return from I/O and every finished CPU
+    burst, and the CPU time comes from the segments as the core yields
+    them. Each event is accumulated in O(1) into per-window counters
+    allocated up front for the expected span (an interval updates its two
+    end windows and a difference array for the whole windows in between),
+    so recording costs the same whatever the time span, and a simulation
+    run without telemetry only pays an attribute check per event.
+
+    Windows are ``[origin + k * width, origin + (k + 1) * width)``. After
+    the run, series() returns per window the average number of ready
+    processes (arrived or back from I/O, neither running nor blocked), the
+    process with the longest run, the CPU utilization and the number of
+    arrivals and completions.
+
+    Args:
+        width (optional): Window width. By default a power of two of the
+            time unit that leaves at most ``max_windows`` windows over the
+            workload's span, estimated from its arrivals and bursts
+        max_windows (int): Window budget of the automatic width
+    """
+
+    def __init__(self, width=None, max_windows=TELEMETRY_WINDOWS):
+        self.width = width
+        self.max_windows = max_windows
+        self.origin = 0
+        self.cpus = 1
+        self._window = width
+        self._length = 0  # Windows touched so far
+        self._present = {}  # Pid index -> time it became ready, for processes holding a CPU burst
+        self._allocate(0)
+
+    def _allocate(self, capacity):
+        # Lists, which index faster than NumPy arrays one element at a time; series() converts them
+        self._arrivals = [0] * capacity
+        self._completions = [0] * capacity
+        self._present_whole = [0] * (capacity + 1)  # Difference array of whole windows
+        self._present_part = [0] * capacity
+        self._busy_whole = [0] * (capacity + 1)
+        self._busy_part = [0] * capacity
+        self._longest = [0] * capacity  # Longest run seen in each window
+        self._running = [-1] * capacity
+
+    def start(self, origin, span, cpus=1):
+        """
+        Reset the arrays for a run whose events begin at ``origin`` and are expected to last about ``span``
+
+        Called by start_simulation before the engine starts.
+        """
+        self.cpus = cpus
+        self._window = self.width if self.width is not None else initial_window(span, self.max_windows)
+        self.origin = origin // self._window * self._window
+        self._length = 0
+        self._present = {}
+        capacity = int((origin + span - self.origin) // self._window) + 2
+        self._allocate(min(capacity, MAX_PREALLOCATED_WINDOWS) if self.width is not None else capacity)
+
+    def _index(self, time):
+        """Window of ``time``, growing the arrays (doubling them) when the run outlasts them"""
+        index = int((time - self.origin) // self._window)
+        capacity = len(self._arrivals)
+        if index >= capacity:
+            grown = max(index + 1, 2 * capacity)
+            for name in ("_arrivals", "_completions", "_present_whole", "_present_part", "_busy_whole", "_busy_part",
+                         "_longest"):
+                getattr(self, name).extend([0] * (grown - capacity))
+            self._running.extend([-1] * (grown - capacity))
+        if index >= self._length:
+            self._length = index + 1
+        return index
+
+    def _interval(self, whole, part, start, end):
+        # Add [start, end) to the time covered in each window of the lists; returns the end windows
+        first, last = self._index(start), self._index(end)
+        if first == last:
+            part[first] += end - start
+        else:
+            part[first] += self.origin + (first + 1) * self._window - start
+            part[last] += end - (self.origin + last * self._window)
+            whole[first + 1] += 1
+            whole[last] -= 1
+        return first, last
+
+    def arrived(self, process, returning=False):
+        """A process tuple became ready: a new arrival, or ``returning`` from I/O"""
+        index = self._index(process[1])
+        if not returning:
+            self._arrivals[index] += 1
+        self._present[process[0]] = process[1]
+
+    def left(self, process, time, blocked=False):
+        """A process finished its CPU burst at ``time`` and completed, or ``blocked`` on I/O"""
+        since = self._present.pop(process[0])
+        self._interval(self._present_whole, self._present_part, since, time)
+        if not blocked:
+            self._completions[self._index(time)] += 1
+
+    def ran(self, pid, start, end):
+        """Process ``pid`` (its index) ran on some CPU from ``start`` to ``end``"""
+        if end <= start:
+            return
+        first, last = self._interval(self._busy_whole, self._busy_part, start, end)
+        longest, running = self._longest, self._running
+        if first == last:
+            ends = ((first, end - start),)
+        else:
+            ends = ((first, self.origin + (first + 1) * self._window - start),
+                    (last, end - (self.origin + last * self._window)))
+            # Whole windows: the run covers them, unless another CPU's run already did
+            for window in range(first + 1, last):
+                if longest[window] < self._window:
+                    longest[window] = self._window
+                    running[window] = pid
+        for window, overlap in ends:
+            if overlap > longest[window]:
+                longest[window] = overlap
+                running[window] = pid
+
+    def watch(self, segments):
+        """Pass a core's segments through, recording the CPU time of the processes' runs"""
+        for segment in segments:
+            # Overhead segments (see Overhead) are not the process running
+            if len(segment) < 5 or segment[4] == RUN:
+                self.ran(segment[0][0], segment[1], segment[2])
+            yield segment
+
+    def series(self):
+        """
+        The recorded time series, one entry per window
+
+        Returns:
+            dict: Arrays "start" (window start times), "ready" (average
+            ready-queue depth), "running" (pid index of the longest run, -1
+            when idle), "utilization" (busy fraction of the CPUs),
+            "arrivals" and "completions", plus the window "width"
+        """
+        length = self._length
+        width = self._window
+        present = np.cumsum(self._present_whole[:length]) * width + np.array(self._present_part[:length], dtype=float)
+        busy = np.cumsum(self._busy_whole[:length]) * width + np.array(self._busy_part[:length], dtype=float)
+        return {
+            "width": width,
+            "start": self.origin + np.arange(length) * width,
+            "ready": (present - busy) / width,
+            "running": np.array(self._running[:length], dtype=np.int64),
+            "utilization": busy / (width * self.cpus),
+            "arrivals": np.array(self._arrivals[:length], dtype=np.int64),
+            "completions": np.array(self._completions[:length], dtype=np.int64),
+        }
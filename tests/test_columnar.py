@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from algorithms import SCHEDULERS, start_simulation
+from columnar import ProcessTable, ScheduleResult
+
+# Nanosecond timestamps around 2026, far past 2**53
+EPOCH = 1_790_000_000_000_000_000
+
+
+def test_append_after_remove_keeps_ids_unique():
+    table = ProcessTable([0, 1, 2], [3, 4, 5], ids=["P1", "P2", "P3"])
+    table = table.remove(1).append(3, 6)
+    assert table.ids.tolist() == ["P1", "P3", "P4"]
+
+def test_append_skips_non_numeric_ids():
+    table = ProcessTable([0, 1], [3, 4], ids=["init", "P7"]).append(2, 5)
+    assert table.ids.tolist() == ["init", "P7", "P8"]
+
+def test_next_id_is_the_id_append_assigns():
+    for table in (ProcessTable([0, 1, 2], [3, 4, 5], ids=["P1", "P2", "P3"]).remove(2),
+                  ProcessTable([0, 1, 2], [3, 4, 5]).remove(1), ProcessTable.empty()):
+        assert table.append(9, 1).ids[-1] == table.next_id()
+
+def test_default_ids_are_renumbered():
+    table = ProcessTable([0, 1, 2], [3, 4, 5]).remove(0).append(3, 6)
+    assert table.ids.tolist() == ["P1", "P2", "P3"]
+
+def test_nanosecond_times_round_trip_exactly():
+    processes = [{"id": "P1", "arrival": EPOCH + 1, "burst": 3, "priority": 0},
+                 {"id": "P2", "arrival": EPOCH + 2, "burst": 5, "priority": 1}]
+    table = ProcessTable.from_dicts(processes).append(EPOCH + 3, 7)
+    assert table.arrival.dtype == np.int64
+    assert table.to_dicts()[:2] == processes
+    assert table.arrival.tolist() == [EPOCH + 1, EPOCH + 2, EPOCH + 3]
+
+def test_fractional_time_is_not_mixed_into_nanosecond_times():
+    table = ProcessTable([EPOCH + 1], [3])
+    with pytest.raises(ValueError):
+        table.append(1.5, 2)
+    with pytest.raises(ValueError):
+        ProcessTable.from_dicts([{"id": "P1", "arrival": EPOCH + 1, "burst": 3},
+                                 {"id": "P2", "arrival": 0.5, "burst": 3}])
+    # A whole-number float is stored as an integer instead
+    assert table.append(2.0, 2).arrival.tolist() == [EPOCH + 1, 2]
+
+def test_small_integer_and_float_times_still_mix():
+    table = ProcessTable([0, 1], [3, 4]).append(1.5, 2.5)
+    assert table.arrival.tolist() == [0.0, 1.0, 1.5]
+
+
+PROCESSES = [{"id": "P1", "arrival": 0, "burst": 5, "priority": 2},
+             {"id": "P2", "arrival": 1, "burst": 3, "priority": 0},
+             {"id": "P3", "arrival": 2, "burst": 8, "priority": 1},
+             {"id": "P4", "arrival": 9, "burst": 2, "priority": 0}]
+
+def test_process_table_round_trips_dictionaries():
+    table = ProcessTable.from_dicts(PROCESSES)
+    assert len(table) == 4
+    assert table.arrival.tolist() == [0, 1, 2, 9]
+    assert table.to_dicts() == PROCESSES
+
+def test_columns_must_have_the_same_length():
+    with pytest.raises(ValueError):
+        ProcessTable([0, 1], [3])
+
+@pytest.mark.parametrize("algorithm", sorted(SCHEDULERS))
+def test_a_table_schedules_like_its_dictionaries(algorithm):
+    time_quantum = 2 if SCHEDULERS[algorithm].time_quantum else None
+    result = start_simulation(ProcessTable.from_dicts(PROCESSES), algorithm, time_quantum)
+    assert isinstance(result, ScheduleResult)
+    assert result.to_dicts() == start_simulation(PROCESSES, algorithm, time_quantum)
+
+def test_schedule_result_round_trips_dictionaries():
+    results = [{"id": "P2", "start": 0, "end": 2, "algorithm": "fcfs", "cpu": 1, "kind": "run"},
+               {"id": "P1", "start": 0, "end": 3, "algorithm": "fcfs", "cpu": 0, "kind": "run"},
+               {"id": "P2", "start": 2, "end": 4, "algorithm": "fcfs", "kind": "io"}]
+    result = ScheduleResult.from_dicts(results)
+    assert result.ids.tolist() == ["P2", "P1"]
+    assert result.pid.tolist() == [0, 1, 0]
+    assert result.cpu.tolist() == [1, 0, -1]
+    assert result.to_dicts() == results
+    assert len(result.runs()) == 2
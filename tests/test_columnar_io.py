@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from algorithms import start_simulation
+from columnar import ProcessTable
+from columnar_io import (SCHEDULE_MAGIC, WORKLOAD_MAGIC, load_schedule, load_workload, map_columns,
+                         save_schedule, save_workload, write_columns)
+from metrics import summary_metrics
+
+EPOCH = 1_700_000_000_000_000_000
+
+PROCESSES = [{"id": "A", "arrival": 0, "burst": 5, "priority": 1},
+             {"id": "B", "arrival": 1, "burst": 3, "priority": 0},
+             {"id": "C", "arrival": 4, "burst": 6, "priority": 2}]
+
+
+def test_columns_round_trip_through_a_mapped_file(tmp_path):
+    path = str(tmp_path / "columns.bin")
+    records = np.array([(0, EPOCH, EPOCH + 7), (1, EPOCH + 7, EPOCH + 9)],
+                       dtype=[("pid", "<i4"), ("start", "<i8"), ("end", "<i8")])
+    columns = {"epoch": np.array([EPOCH, EPOCH + 1], dtype=np.int64),
+               "records": records,
+               "names": np.array(["P1", "Process 2"]),
+               "empty": np.zeros(0, dtype=np.float64)}
+    write_columns(path, WORKLOAD_MAGIC, columns, {"count": 2})
+
+    meta, mapped = map_columns(path, WORKLOAD_MAGIC)
+    assert meta == {"count": 2}
+    assert set(mapped) == set(columns)
+    for name, values in columns.items():
+        assert mapped[name].dtype == values.dtype
+        np.testing.assert_array_equal(mapped[name], values)
+    assert isinstance(mapped["epoch"], np.memmap)
+    assert mapped["epoch"][1] == EPOCH + 1
+
+def test_map_columns_rejects_another_file_type(tmp_path):
+    path = str(tmp_path / "columns.bin")
+    write_columns(path, WORKLOAD_MAGIC, {"arrival": np.arange(3)})
+    with pytest.raises(ValueError):
+        map_columns(path, SCHEDULE_MAGIC)
+
+@pytest.mark.parametrize("table", [ProcessTable.from_dicts(PROCESSES),
+                                   ProcessTable(np.array([EPOCH, EPOCH + 3]), np.array([5, 2]))],
+                         ids=["named", "default_ids"])
+def test_workload_round_trip(tmp_path, table):
+    path = str(tmp_path / "workload.wkl")
+    save_workload(table, path)
+    loaded = load_workload(path)
+
+    assert len(loaded) == len(table)
+    assert list(loaded.ids) == list(table.ids)
+    for name in ("arrival", "burst", "priority"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(table, name))
+
+def test_schedule_round_trip_keeps_segments_cpus_and_metrics(tmp_path):
+    table = ProcessTable.from_dicts(PROCESSES)
+    result = start_simulation(table, "fcfs", cpus=2)
+    path = str(tmp_path / "schedule.sched")
+    save_schedule(result, path, table)
+    loaded = load_schedule(path)
+
+    assert len(loaded) == len(result)
+    assert loaded.algorithm == result.algorithm
+    assert loaded.result.cpus == 2
+    for name in ("pid", "start", "end", "cpu"):
+        np.testing.assert_array_equal(getattr(loaded.result, name), getattr(result, name))
+    assert summary_metrics(loaded.result, loaded.workload) == summary_metrics(result, table)
+
+def test_schedule_file_reads_one_process_through_its_index(tmp_path):
+    result = start_simulation(ProcessTable.from_dicts(PROCESSES), "round_robin", 2)
+    path = str(tmp_path / "schedule.sched")
+    save_schedule(result, path)
+    loaded = load_schedule(path)
+
+    for pid, process_id in enumerate(result.ids):
+        mine = result.pid == pid
+        for selector in (pid, process_id):
+            start, end = loaded.segments(selector)
+            np.testing.assert_array_equal(start, result.start[mine])
+            np.testing.assert_array_equal(end, result.end[mine])
+    assert loaded.workload is None
@@ -0,0 +1,35 @@
+import numpy as np
+
+from columnar import ScheduleResult
+from gantt import SegmentIndex, split_lanes, time_label, time_origin
+from state_view import READY, RUNNING, state_intervals
+
+# Nanosecond timestamps around 2026, where float64 values are 256 ns apart
+EPOCH = 1_790_000_000_000_000_000
+
+
+def test_lanes_are_exact_offsets_from_the_origin():
+    start = np.array([EPOCH + 1, EPOCH + 3, EPOCH + 4], dtype=np.int64)
+    result = ScheduleResult([0, 1, 0], start, start + 1, "fcfs")
+    origin = time_origin(result.start)
+
+    (pid, lane_start, lane_end), = split_lanes(result, origin=origin)
+    assert origin == EPOCH + 1
+    assert lane_start.tolist() == [0, 2, 3] and lane_end.tolist() == [1, 3, 4]
+    assert time_label(origin) == f"Time (+{EPOCH + 1})"
+    # One nanosecond windows still tell the segments apart
+    assert SegmentIndex(pid, lane_start, lane_end).query(1.5, 2.5)[0].tolist() == [1]
+
+def test_float_times_keep_a_zero_origin():
+    assert time_origin(np.array([0.5, 2.0])) == 0
+    assert time_label(0) == "Time"
+
+def test_state_intervals_keep_nanosecond_ready_gaps():
+    pid = np.array([0, 0])
+    start = np.array([EPOCH + 10, EPOCH + 11], dtype=np.int64)
+    arrival = np.array([EPOCH], dtype=np.int64)
+    origin = time_origin(arrival, start)
+
+    offsets, state, begin, end = state_intervals(pid, start - origin, start + 1 - origin, arrival - origin)
+    assert state[:3].tolist() == [READY, RUNNING, RUNNING]
+    assert begin[:3].tolist() == [0, 10, 11] and end[:3].tolist() == [10, 11, 12]
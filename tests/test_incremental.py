@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+import algorithms
+from algorithms import checkpointed_segments, start_simulation
+from columnar import ProcessTable
+from incremental import IncrementalSimulator
+
+CHECKPOINTED = [("fcfs", None), ("sjf_preemptive", None), ("sjf_non_preemptive", None),
+                ("priority_preemptive", None), ("priority_non_preemptive", None), ("round_robin", 2)]
+
+
+def random_table(rng, count):
+    return ProcessTable([rng.randint(0, 60) for _ in range(count)], [rng.randint(0, 9) for _ in range(count)],
+                        [rng.randint(0, 4) for _ in range(count)])
+
+
+@pytest.mark.parametrize("merge_slices", [False, True])
+@pytest.mark.parametrize("algorithm, time_quantum", CHECKPOINTED)
+def test_resuming_from_any_checkpoint_equals_the_full_run(monkeypatch, algorithm, time_quantum, merge_slices):
+    # A checkpoint at every event
+    monkeypatch.setattr(algorithms, "CHECKPOINT_INTERVAL", 1)
+    rng = random.Random(11)
+    for _ in range(30):
+        table = random_table(rng, rng.randint(1, 15))
+        checkpoints = []
+        full = list(checkpointed_segments(table, algorithm, time_quantum, merge_slices, checkpoints=checkpoints))
+        assert checkpoints
+        for checkpoint in checkpoints:
+            resumed = checkpointed_segments(table, algorithm, time_quantum, merge_slices, state=checkpoint)
+            assert full[:checkpoint.emitted] + list(resumed) == full
+
+@pytest.mark.parametrize("algorithm, time_quantum", CHECKPOINTED)
+def test_edits_resume_to_the_full_schedule(monkeypatch, algorithm, time_quantum):
+    monkeypatch.setattr(algorithms, "CHECKPOINT_INTERVAL", 4)
+    rng = random.Random(12)
+    simulator = IncrementalSimulator()
+    table = random_table(rng, 40)
+    simulator.simulate(table, algorithm, time_quantum)
+    resumed = 0
+    for _ in range(40):
+        if len(table) > 1 and rng.random() < 0.4:
+            table = table.remove(rng.randrange(len(table)))
+        else:
+            table = table.append(rng.randint(0, 80), rng.randint(0, 9), rng.randint(0, 4))
+        result = simulator.simulate(table, algorithm, time_quantum)
+        resumed += simulator.resumed_from is not None
+        expected = start_simulation(table, algorithm, time_quantum)
+        assert result.to_dicts() == expected.to_dicts()
+    assert resumed
+
+def test_an_unchanged_workload_reuses_the_schedule():
+    simulator = IncrementalSimulator()
+    table = random_table(random.Random(13), 20)
+    first = simulator.simulate(table, "round_robin", 3)
+    second = simulator.simulate(ProcessTable(table.arrival, table.burst, table.priority), "round_robin", 3)
+    assert second.to_dicts() == first.to_dicts()
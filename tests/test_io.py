@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from algorithms import SCHEDULERS, start_simulation
+from columnar import ProcessTable
+from metrics import process_metrics
+
+# The algorithms that also run on several CPUs
+SMP_POLICIES = ["fcfs", "sjf_preemptive", "sjf_non_preemptive", "priority_preemptive", "priority_non_preemptive",
+                "round_robin"]
+
+
+def segments(results):
+    return [(r["id"], r.get("kind", "run"), r["start"], r["end"]) for r in results]
+
+def random_io_workload(rng, count, devices=2):
+    processes = []
+    for i in range(count):
+        bursts = [rng.randint(1, 6)]
+        for _ in range(rng.randint(0, 2)):
+            bursts += [rng.randint(0, 8), rng.randint(1, 6)]
+        processes.append({"id": f"P{i + 1}", "arrival": rng.randint(0, 20), "burst": sum(bursts[::2]),
+                          "priority": rng.randint(0, 3), "bursts": bursts, "device": rng.randrange(devices)})
+    return processes
+
+
+def test_a_process_leaves_the_cpu_for_its_io():
+    processes = [{"id": "P1", "arrival": 0, "burst": 6, "bursts": [4, 3, 2]},
+                 {"id": "P2", "arrival": 1, "burst": 6}]
+    assert sorted(segments(start_simulation(processes, "fcfs")), key=lambda s: (s[2], s[0])) == [
+        ("P1", "run", 0, 4), ("P1", "io", 4, 7), ("P2", "run", 4, 10), ("P1", "run", 10, 12)]
+
+def test_a_device_serves_one_request_at_a_time_in_fcfs_order():
+    processes = [{"id": "P1", "arrival": 0, "burst": 2, "bursts": [1, 5, 1]},
+                 {"id": "P2", "arrival": 0, "burst": 2, "bursts": [1, 5, 1]}]
+    results = start_simulation(processes, "fcfs")
+    assert [s for s in segments(results) if s[0] == "P2"] == [
+        ("P2", "run", 1, 2), ("P2", "io_wait", 2, 6), ("P2", "io", 6, 11), ("P2", "run", 11, 12)]
+    # I/O time is not waiting time
+    metrics = process_metrics(results, processes)
+    assert metrics["io_time"].tolist() == [5, 9]
+    assert metrics["io_wait_time"].tolist() == [0, 4]
+    assert metrics["waiting_time"].tolist() == [0, 1]
+
+@pytest.mark.parametrize("algorithm, cpus", [(algorithm, 1) for algorithm in sorted(SCHEDULERS)] +
+                         [(algorithm, 2) for algorithm in SMP_POLICIES])
+def test_io_schedules_keep_their_invariants(algorithm, cpus):
+    rng = random.Random(5)
+    time_quantum = 2 if SCHEDULERS[algorithm].time_quantum else None
+    for _ in range(50):
+        processes = random_io_workload(rng, rng.randint(1, 8))
+        results = start_simulation(processes, algorithm, time_quantum, cpus=cpus)
+        by_id = {p["id"]: p for p in processes}
+        for pid, process in by_id.items():
+            own = sorted((s for s in segments(results) if s[0] == pid), key=lambda s: s[2])
+            # Every CPU burst runs and every I/O burst is served, one after the other
+            assert sum(end - start for _, kind, start, end in own if kind == "run") == process["burst"]
+            assert sum(end - start for _, kind, start, end in own if kind == "io") == sum(process["bursts"][1::2])
+            assert all(a[3] <= b[2] for a, b in zip(own, own[1:]))
+            assert own[0][2] >= process["arrival"]
+        for device in range(2):
+            served = sorted((r["start"], r["end"]) for r in results
+                            if r.get("kind") == "io" and by_id[r["id"]]["device"] == device)
+            assert all(a[1] <= b[0] for a, b in zip(served, served[1:]))
+
+def test_a_table_schedules_io_like_its_dictionaries():
+    processes = random_io_workload(random.Random(6), 20)
+    result = start_simulation(ProcessTable.from_dicts(processes), "round_robin", 3)
+    assert result.to_dicts() == start_simulation(processes, "round_robin", 3)
+
+def test_burst_sequences_must_add_up():
+    with pytest.raises(ValueError):
+        start_simulation([{"id": "P1", "arrival": 0, "burst": 9, "bursts": [4, 3, 2]}], "fcfs")
+    with pytest.raises(ValueError):
+        start_simulation([{"id": "P1", "arrival": 0, "burst": 4, "bursts": [4, 3]}], "fcfs")
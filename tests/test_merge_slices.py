@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from algorithms import start_simulation
+
+
+def coalesce(results):
+    """Join each segment to the previous one when the same process runs on without a gap"""
+    merged = []
+    for result in results:
+        previous = merged[-1] if merged else None
+        if previous is not None and previous["id"] == result["id"] and previous["end"] == result["start"]:
+            previous["end"] = result["end"]
+        else:
+            merged.append(dict(result))
+    return merged
+
+def random_workload(rng, size):
+    return [{"id": f"P{i + 1}", "arrival": rng.randint(0, 40), "burst": rng.randint(0, 15),
+             "priority": rng.randint(-3, 3)} for i in range(size)]
+
+def test_mlfq_bottom_level_renews_after_a_partial_allotment():
+    processes = [{"id": "P1", "arrival": 1, "burst": 12}, {"id": "P2", "arrival": 12, "burst": 5},
+                 {"id": "P3", "arrival": 6, "burst": 2}]
+    assert start_simulation(processes, "mlfq", 1, True) == coalesce(start_simulation(processes, "mlfq", 1))
+
+@pytest.mark.parametrize("algorithm", ["round_robin", "mlfq", "cfs"])
+def test_merged_schedule_is_the_coalesced_one(algorithm):
+    rng = random.Random(17)
+    for _ in range(2000):
+        processes = random_workload(rng, rng.randint(1, 12))
+        quantum = rng.randint(1, 6)
+        assert start_simulation(processes, algorithm, quantum, True) == \
+            coalesce(start_simulation(processes, algorithm, quantum))
@@ -0,0 +1,45 @@
+import numpy as np
+
+from algorithms import CONTEXT_SWITCH, IO, RUN
+from columnar import ScheduleResult
+from metrics import cpu_busy_time, device_busy_time, overhead_time, process_metrics
+
+# Nanosecond timestamps around 2026, far past 2**53
+EPOCH = 1_790_000_000_000_000_000
+
+
+def test_integer_totals_stay_exact_past_2_53():
+    step = 2**53 + 1  # Not representable as a float64
+    start = np.array([EPOCH, EPOCH + 3 * step, EPOCH + 4 * step, EPOCH + 6 * step], dtype=np.int64)
+    end = start + np.array([step, step, 2 * step, step], dtype=np.int64)
+    result = ScheduleResult(np.array([0, 0, 1, 1], dtype=np.int32), start, end, "fcfs", np.array(["P1", "P2"]),
+                            cpu=np.array([0, 1, 0, 1], dtype=np.int16), cpus=2,
+                            kind=np.array([RUN, CONTEXT_SWITCH, RUN, IO], dtype=np.int8))
+
+    assert cpu_busy_time(result).tolist() == [3 * step, 0]
+    assert overhead_time(result).tolist() == [step, 0]
+    assert device_busy_time(result).tolist() == [step]
+    assert process_metrics(result)["io_time"].tolist() == [0, step]
+    assert cpu_busy_time(result).dtype == np.int64
+
+
+def test_idle_cpus_count_in_batch_and_streaming_summaries():
+    from algorithms import start_simulation
+    from metrics import summary_metrics
+    from stream_metrics import MetricsTracker
+
+    # Two processes on four CPUs: CPUs 2 and 3 never run anything
+    processes = [{"id": "P1", "arrival": 0, "burst": 4, "priority": 0},
+                 {"id": "P2", "arrival": 1, "burst": 6, "priority": 0}]
+    results = start_simulation(processes, "fcfs", cpus=4)
+    tracker = MetricsTracker(cpus=4)
+    list(tracker.track(processes))
+    for result in results:
+        tracker.add_segment(result)
+    tracker.finish()
+
+    summary = summary_metrics(results, processes, cpus=4)
+    expected = tracker.summary()
+    assert summary["cpus"] == expected["cpus"] == 4
+    assert summary["cpu_utilization"] == expected["cpu_utilization"] == 10 / (7 * 4)
+    assert summary["per_cpu_utilization"] == expected["per_cpu_utilization"]
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from algorithms import ReadyQueue, schedule_by_key, start_simulation
+from columnar import ProcessTable
+
+
+def baseline_non_preemptive(processes, key, algorithm):
+    """
+    The non-preemptive SJF / Priority loop ReadyQueue replaced, frozen as a reference
+
+    Rescans every process for the smallest ``key`` ("burst" or
+    "priority") each time the CPU frees up.
+    """
+    processes_copy = [p.copy() for p in processes]
+    time = 0
+    results = []
+    remaining_processes = len(processes_copy)
+
+    while remaining_processes > 0:
+        available_processes = [p for p in processes_copy if p["arrival"] <= time and p["burst"] > 0]
+        if not available_processes:
+            next_process = min([p for p in processes_copy if p["burst"] > 0], key=lambda p: p["arrival"])
+            time = next_process["arrival"]
+            continue
+
+        selected_process = min(available_processes, key=lambda p: p[key])
+        start_time = time
+        time += selected_process["burst"]
+        results.append({"id": selected_process["id"], "start": start_time, "end": time, "algorithm": algorithm})
+        for p in processes_copy:
+            if p["id"] == selected_process["id"]:
+                p["burst"] = 0
+                remaining_processes -= 1
+                break
+
+    return results
+
+def arrival_ordered_workload(rng, count):
+    """Processes listed by arrival time, as the GUI keeps them, with plenty of ties"""
+    arrivals = sorted(rng.randint(0, 30) for _ in range(count))
+    return [{"id": f"P{i + 1}", "arrival": arrival, "burst": rng.randint(1, 8), "priority": rng.randint(0, 4)}
+            for i, arrival in enumerate(arrivals)]
+
+
+@pytest.mark.parametrize("algorithm, key", [("sjf_non_preemptive", "burst"), ("priority_non_preemptive", "priority")])
+def test_matches_the_baseline_on_arrival_ordered_workloads(algorithm, key):
+    rng = random.Random(2)
+    for _ in range(300):
+        processes = arrival_ordered_workload(rng, rng.randint(1, 12))
+        assert start_simulation(processes, algorithm) == baseline_non_preemptive(processes, key, algorithm)
+
+def test_ties_go_to_the_earliest_arrival():
+    # P1 is listed first but arrives after P2; both are ready when P3 finishes
+    processes = [{"id": "P1", "arrival": 2, "burst": 3, "priority": 0},
+                 {"id": "P2", "arrival": 1, "burst": 3, "priority": 0},
+                 {"id": "P3", "arrival": 0, "burst": 5, "priority": 0}]
+    order = [result["id"] for result in start_simulation(processes, "sjf_non_preemptive")]
+    assert order == ["P3", "P2", "P1"]
+
+def test_table_and_dictionaries_give_the_same_schedule():
+    processes = arrival_ordered_workload(random.Random(3), 50)
+    result = start_simulation(ProcessTable.from_dicts(processes), "priority_non_preemptive")
+    assert result.to_dicts() == start_simulation(processes, "priority_non_preemptive")
+
+def test_schedule_by_key_takes_a_key_function():
+    processes = [{"id": "P1", "arrival": 0, "burst": 2, "priority": 0},
+                 {"id": "P2", "arrival": 1, "burst": 1, "priority": 0},
+                 {"id": "P3", "arrival": 1, "burst": 4, "priority": 0}]
+    # Longest job first
+    results = schedule_by_key(processes, lambda p: -p["burst"], "ljf")
+    assert [result["id"] for result in results] == ["P1", "P3", "P2"]
+
+def test_ready_queue_orders_by_key_then_arrival_then_input_order():
+    queue = ReadyQueue(lambda process: process[2])
+    for process in [(0, 5, 3, 0), (1, 2, 3, 0), (2, 2, 3, 0), (3, 9, 1, 0)]:
+        queue.push(process)
+    assert len(queue) == 4
+    assert [queue.pop()[0] for _ in range(4)] == [3, 1, 2, 0]
@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from algorithms import start_simulation
+
+
+def baseline_preemptive(processes, key, algorithm):
+    """
+    The preemptive SJF / Priority loop the heap-based core replaced, frozen as a reference
+
+    Rescans every process at each event; ``key`` picks the field the
+    original sjf_preemptive ("burst", the remaining time) or
+    priority_preemptive ("priority") minimized.
+    """
+    processes_copy = [p.copy() for p in processes]
+    if algorithm == "sjf_preemptive":
+        processes_copy.sort(key=lambda p: p["arrival"])
+
+    time = 0
+    results = []
+    remaining_processes = len(processes_copy)
+    current_process = None
+    current_start = 0
+
+    while remaining_processes > 0:
+        available_processes = [p for p in processes_copy if p["arrival"] <= time and p["burst"] > 0]
+
+        if not available_processes:
+            next_process = min([p for p in processes_copy if p["burst"] > 0], key=lambda p: p["arrival"])
+            time = next_process["arrival"]
+            continue
+
+        selected_process = min(available_processes, key=lambda p: p[key])
+
+        if current_process != selected_process["id"]:
+            if current_process is not None:
+                results.append({"id": current_process, "start": current_start, "end": time, "algorithm": algorithm})
+            current_process = selected_process["id"]
+            current_start = time
+
+        next_arrival = float('inf')
+        for p in processes_copy:
+            if p["arrival"] > time and p["burst"] > 0:
+                next_arrival = min(next_arrival, p["arrival"])
+
+        completion_time = time + selected_process["burst"]
+        next_event_time = min(next_arrival, completion_time)
+
+        time_slice = next_event_time - time
+        for p in processes_copy:
+            if p["id"] == selected_process["id"]:
+                p["burst"] -= time_slice
+                if p["burst"] <= 0:
+                    remaining_processes -= 1
+                break
+
+        time = next_event_time
+
+    if current_process is not None:
+        results.append({"id": current_process, "start": current_start, "end": time, "algorithm": algorithm})
+
+    return results
+
+def clip_idle_gaps(results, processes):
+    """
+    Apply the one intended change to baseline results: a process's last
+    segment ends when it completes instead of stretching over the idle gap
+    up to the next arrival
+
+    Returns:
+        tuple: (clipped results, number of segments that were clipped)
+    """
+    left = {p["id"]: p["burst"] for p in processes}
+    clipped, changed = [], 0
+    for result in results:
+        end = min(result["end"], result["start"] + left[result["id"]])
+        left[result["id"]] -= end - result["start"]
+        changed += end != result["end"]
+        clipped.append({**result, "end": end})
+    return clipped, changed
+
+def random_workload(rng, size):
+    # Positive bursts only: the baseline loop never terminates on a zero-length burst
+    return [{"id": f"P{i + 1}", "arrival": rng.randint(0, 3 * size), "burst": rng.randint(1, 10),
+             "priority": rng.randint(0, 4)} for i in range(size)]
+
+@pytest.mark.parametrize("algorithm,key", [("sjf_preemptive", "burst"), ("priority_preemptive", "priority")])
+def test_matches_baseline_except_idle_gaps(algorithm, key):
+    rng = random.Random(2024)
+    clipped_total = 0
+    for _ in range(300):
+        processes = random_workload(rng, rng.randint(1, 25))
+        expected, clipped = clip_idle_gaps(baseline_preemptive(processes, key, algorithm), processes)
+        clipped_total += clipped
+        assert start_simulation(processes, algorithm) == expected
+    # The workloads do exercise the idle-gap difference
+    assert clipped_total > 0
+
+def test_segment_ends_at_completion_before_idle_gap():
+    processes = [{"id": "P1", "arrival": 0, "burst": 2, "priority": 0},
+                 {"id": "P2", "arrival": 5, "burst": 1, "priority": 0}]
+    assert baseline_preemptive(processes, "burst", "sjf_preemptive")[0]["end"] == 5
+    assert start_simulation(processes, "sjf_preemptive") == [
+        {"id": "P1", "start": 0, "end": 2, "algorithm": "sjf_preemptive"},
+        {"id": "P2", "start": 5, "end": 6, "algorithm": "sjf_preemptive"},
+    ]
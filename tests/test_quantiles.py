@@ -0,0 +1,88 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from algorithms import start_simulation
+from metrics import fairness_index, summary_metrics, windowed_throughput
+from quantiles import PERCENTILES, QuantileSketch
+from stream_metrics import MetricsTracker, WindowedCounter
+
+
+def exact_quantile(values, q):
+    """The value the sketch estimates: the one at rank floor(q * (n - 1)) in sorted order"""
+    return sorted(values)[math.floor(q * (len(values) - 1))]
+
+
+@pytest.mark.parametrize("accuracy", [0.01, 0.05])
+def test_quantiles_stay_within_the_relative_accuracy(accuracy):
+    rng = random.Random(1)
+    values = [rng.lognormvariate(0, 4) for _ in range(5000)] + [-rng.expovariate(0.1) for _ in range(500)] + [0] * 50
+    sketch = QuantileSketch(accuracy)
+    for value in values:
+        sketch.add(value)
+    for q in [0, 0.001, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 0.999, 1]:
+        exact = exact_quantile(values, q)
+        assert abs(sketch.quantile(q) - exact) <= accuracy * abs(exact) * (1 + 1e-9)
+
+def test_update_and_merge_count_like_add():
+    rng = random.Random(2)
+    values = [rng.paretovariate(1.5) for _ in range(2000)]
+    added, updated, merged = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for value in values:
+        added.add(value)
+    updated.update(np.array(values))
+    half = QuantileSketch()
+    half.update(values[1000:])
+    merged.update(values[:1000])
+    merged.merge(half)
+    for sketch in (updated, merged):
+        assert sketch.count == added.count
+        assert sketch.percentiles() == added.percentiles()
+
+def test_bucket_budget_keeps_the_tail_accurate():
+    values = [10.0 ** exponent for exponent in np.linspace(-30, 30, 10000)]
+    sketch = QuantileSketch(max_buckets=100)
+    sketch.update(values)
+    assert len(sketch._positive) <= 100
+    for q in (0.99, 0.999):
+        exact = exact_quantile(values, q)
+        assert abs(sketch.quantile(q) - exact) <= 0.01 * exact * (1 + 1e-9)
+
+def test_fairness_index_bounds():
+    assert fairness_index([3, 6, 9], [0, 0, 0]) == 1.0
+    # Equal shares of their time running: still perfectly fair
+    assert fairness_index([2, 4], [2, 4]) == pytest.approx(1.0)
+    # One process got everything, three others starved almost completely
+    assert fairness_index([1, 1e-9, 1e-9, 1e-9], [0, 100, 100, 100]) == pytest.approx(0.25)
+
+def test_windowed_throughput_matches_the_streaming_counter():
+    rng = random.Random(3)
+    times = sorted(rng.randint(0, 100_000) for _ in range(3000))
+    counter = WindowedCounter()
+    for time in times:
+        counter.add(time)
+    width, rates = counter.rates()
+    batch_width, batch_rates = windowed_throughput(np.array(times))
+    assert width == batch_width
+    assert rates == batch_rates.tolist()
+
+def test_batch_and_streaming_summaries_agree():
+    rng = random.Random(4)
+    processes = sorted(({"id": f"P{i + 1}", "arrival": rng.randint(0, 500), "burst": rng.randint(1, 20),
+                         "priority": 0} for i in range(300)), key=lambda p: p["arrival"])
+    results = start_simulation(processes, "round_robin", 4)
+    tracker = MetricsTracker()
+    list(tracker.track(processes))
+    for result in results:
+        tracker.add_segment(result)
+    tracker.finish()
+    streamed, batch = tracker.summary(), summary_metrics(results, processes)
+    for name in ("waiting_time", "response_time"):
+        for percentile in PERCENTILES:
+            key = f"{name}_p{percentile:g}"
+            assert streamed[key] == batch[key]
+    for key in ("throughput_window", "windowed_throughput", "peak_throughput"):
+        assert streamed[key] == batch[key]
+    assert streamed["jain_fairness_index"] == pytest.approx(batch["jain_fairness_index"])
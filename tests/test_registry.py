@@ -0,0 +1,57 @@
+import pytest
+
+from algorithms import SCHEDULERS, algorithm_label, mlfq_engine, register_algorithm, start_simulation
+from columnar import ProcessTable
+
+PROCESSES = [{"id": "P1", "arrival": 0, "burst": 2, "priority": 0},
+             {"id": "P2", "arrival": 1, "burst": 1, "priority": 0},
+             {"id": "P3", "arrival": 1, "burst": 4, "priority": 0}]
+
+
+def longest_job_first(arrivals, time_quantum, merge_slices):
+    """A minimal engine over process tuples: run the ready process with the longest burst to completion"""
+    pending, ready, time = list(arrivals), [], 0
+    while pending or ready:
+        while pending and pending[0][1] <= time:
+            ready.append(pending.pop(0))
+        if not ready:
+            time = pending[0][1]
+            continue
+        process = max(ready, key=lambda process: (process[2], -process[0]))
+        ready.remove(process)
+        yield process, time, time + process[2]
+        time += process[2]
+
+@pytest.fixture
+def registered():
+    names = []
+
+    def register(name, *args, **options):
+        register_algorithm(name, *args, **options)
+        names.append(name)
+
+    yield register
+    for name in names:
+        del SCHEDULERS[name]
+
+
+def test_a_registered_engine_runs_through_start_simulation(registered):
+    registered("ljf", longest_job_first, "Longest Job First")
+    results = start_simulation(PROCESSES, "ljf")
+    assert [(r["id"], r["start"], r["end"], r["algorithm"]) for r in results] == [
+        ("P1", 0, 2, "ljf"), ("P3", 2, 6, "ljf"), ("P2", 6, 7, "ljf")]
+    assert start_simulation(ProcessTable.from_dicts(PROCESSES), "ljf").to_dicts() == results
+    assert [r["id"] for r in start_simulation(iter(PROCESSES), "ljf", stream=True)] == ["P1", "P3", "P2"]
+    assert algorithm_label("ljf") == "Longest Job First"
+
+def test_a_configured_mlfq_needs_its_quantum(registered):
+    registered("mlfq5", mlfq_engine(quanta=[2, 4, 8, 16, 32], boost_interval=200), "MLFQ (5 levels)",
+               time_quantum=True)
+    results = start_simulation(PROCESSES, "mlfq5", 2)
+    assert sum(r["end"] - r["start"] for r in results) == 7
+    with pytest.raises(ValueError):
+        start_simulation(PROCESSES, "mlfq5")
+
+def test_unknown_algorithms_are_rejected():
+    with pytest.raises(ValueError):
+        start_simulation(PROCESSES, "no_such_algorithm")
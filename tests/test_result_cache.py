@@ -0,0 +1,68 @@
+import numpy as np
+
+from algorithms import Overhead, start_simulation
+from columnar import ProcessTable
+from result_cache import ResultCache, workload_hash
+
+PROCESSES = [{"id": "P1", "arrival": 0, "burst": 5, "priority": 1},
+             {"id": "P2", "arrival": 1, "burst": 3, "priority": 0},
+             {"id": "P3", "arrival": 4, "burst": 6, "priority": 2}]
+
+
+def is_mapped(array):
+    """True when ``array`` is a view into a memory-mapped file rather than data read into memory"""
+    while array is not None and not isinstance(array, np.memmap):
+        array = array.base
+    return array is not None
+
+def test_key_follows_the_settings_that_change_the_schedule():
+    table = ProcessTable.from_dicts(PROCESSES)
+    key = ResultCache.key(table, "round_robin", 2)
+    assert ResultCache.key(table, "round_robin", 2) == key
+    assert ResultCache.key(table, "round_robin", 3) != key
+    assert ResultCache.key(table, "round_robin", 2, merge_slices=True) != key
+    assert ResultCache.key(table, "mlfq", 2) != key
+    assert ResultCache.key(table, "round_robin", 2, cpus=2) != key
+    assert ResultCache.key(table, "round_robin", 2, overhead=Overhead(1, 0, 0)) != key
+    # FCFS takes no quantum, so the quantum does not split its entries
+    assert ResultCache.key(table, "fcfs", 2) == ResultCache.key(table, "fcfs", None)
+
+def test_key_follows_the_workload():
+    table = ProcessTable.from_dicts(PROCESSES)
+    key = ResultCache.key(table, "fcfs")
+    assert ResultCache.key(ProcessTable.from_dicts(PROCESSES), "fcfs") == key
+    assert ResultCache.key(table.append(7, 1), "fcfs") != key
+    assert ResultCache.key(table.remove(1), "fcfs") != key
+    edited = [dict(p) for p in PROCESSES]
+    edited[2]["burst"] = 7
+    assert workload_hash(edited) != workload_hash(PROCESSES)
+
+def test_a_repeated_run_is_a_hit():
+    cache = ResultCache()
+    first = cache.simulate(PROCESSES, "round_robin", 2)
+    second = cache.simulate(PROCESSES, "round_robin", 2)
+    assert first == second == start_simulation(PROCESSES, "round_robin", 2)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_the_disk_tier_maps_entries_back(tmp_path):
+    table = ProcessTable.from_dicts(PROCESSES)
+    expected = start_simulation(table, "priority_preemptive", cpus=2)
+    ResultCache(directory=str(tmp_path)).simulate(table, "priority_preemptive", cpus=2)
+
+    # A fresh cache, as after a restart, finds the entry on disk
+    cache = ResultCache(directory=str(tmp_path))
+    result = cache.simulate(table, "priority_preemptive", cpus=2)
+    assert cache.hits == 1 and cache.misses == 0
+    assert is_mapped(result.start)
+    assert result.to_dicts() == expected.to_dicts()
+    assert result.cpus == expected.cpus == 2
+
+def test_least_recently_used_entries_are_evicted():
+    table = ProcessTable.from_dicts(PROCESSES)
+    size = start_simulation(table, "fcfs").nbytes
+    cache = ResultCache(max_bytes=2 * size)
+    for algorithm in ("fcfs", "sjf_non_preemptive", "fcfs", "priority_non_preemptive"):
+        cache.simulate(table, algorithm)
+    assert len(cache) == 2 and cache.nbytes <= 2 * size
+    assert cache.get(ResultCache.key(table, "fcfs")) is not None
+    assert cache.get(ResultCache.key(table, "sjf_non_preemptive")) is None
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from algorithms import start_simulation
+
+
+def baseline_round_robin(processes, time_quantum):
+    """The list-scanning Round Robin the deque version replaced, frozen as a reference"""
+    processes_copy = sorted((p.copy() for p in processes), key=lambda p: p["arrival"])
+    time = 0
+    results = []
+    ready_queue = []
+    remaining_processes = len(processes_copy)
+
+    while remaining_processes > 0:
+        for p in processes_copy:
+            if p["arrival"] <= time and p["burst"] > 0 and p["id"] not in [proc["id"] for proc in ready_queue]:
+                ready_queue.append(p)
+        if not ready_queue:
+            upcoming = [p for p in processes_copy if p["burst"] > 0]
+            time = min(upcoming, key=lambda p: p["arrival"])["arrival"]
+            continue
+
+        current_process = ready_queue.pop(0)
+        execution_time = min(time_quantum, current_process["burst"])
+        results.append({"id": current_process["id"], "start": time, "end": time + execution_time,
+                        "algorithm": "round_robin"})
+        current_process["burst"] -= execution_time
+        if current_process["burst"] <= 0:
+            remaining_processes -= 1
+        time += execution_time
+
+        # Arrivals during the slice queue ahead of the preempted process
+        for p in processes_copy:
+            if (p["arrival"] <= time and p["burst"] > 0 and p["id"] not in [proc["id"] for proc in ready_queue]
+                    and p["id"] != current_process["id"]):
+                ready_queue.append(p)
+        if current_process["burst"] > 0:
+            ready_queue.append(current_process)
+
+    return results
+
+
+@pytest.mark.parametrize("time_quantum", [1, 2, 3, 5])
+def test_matches_the_baseline(time_quantum):
+    rng = random.Random(time_quantum)
+    for _ in range(300):
+        processes = [{"id": f"P{i + 1}", "arrival": rng.randint(0, 25), "burst": rng.randint(1, 12), "priority": 0}
+                     for i in range(rng.randint(1, 10))]
+        assert start_simulation(processes, "round_robin", time_quantum) == baseline_round_robin(processes, time_quantum)
+
+def test_merged_slices_of_a_lone_process_make_one_segment():
+    processes = [{"id": "P1", "arrival": 0, "burst": 1_000_000, "priority": 0},
+                 {"id": "P2", "arrival": 2_000_000, "burst": 3, "priority": 0}]
+    results = start_simulation(processes, "round_robin", 1, merge_slices=True)
+    assert [(r["id"], r["start"], r["end"]) for r in results] == [("P1", 0, 1_000_000), ("P2", 2_000_000, 2_000_003)]
+
+def test_rejects_a_missing_quantum():
+    with pytest.raises(ValueError):
+        start_simulation([{"id": "P1", "arrival": 0, "burst": 1, "priority": 0}], "round_robin", 0)
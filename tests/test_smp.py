@@ -0,0 +1,30 @@
+import random
+
+import pytest
+
+from algorithms import start_simulation
+from smp import simulate_smp
+
+POLICIES = ["fcfs", "sjf_preemptive", "sjf_non_preemptive", "priority_preemptive", "priority_non_preemptive",
+            "round_robin"]
+
+
+def random_workload(rng, size, floats):
+    if floats:
+        # Decimal fractions, so that sums and differences of times round
+        return [{"id": f"P{i + 1}", "arrival": round(rng.random() * 30, rng.choice([1, 3, 9])),
+                 "burst": round(rng.random() * 8 + 0.1, rng.choice([1, 2, 9])), "priority": rng.randint(0, 3)}
+                for i in range(size)]
+    return [{"id": f"P{i + 1}", "arrival": rng.randint(0, 30), "burst": rng.randint(0, 8),
+             "priority": rng.randint(0, 3)} for i in range(size)]
+
+@pytest.mark.parametrize("floats", [False, True])
+@pytest.mark.parametrize("merge_slices", [False, True])
+@pytest.mark.parametrize("algorithm", POLICIES)
+def test_one_cpu_equals_single_cpu_engines(algorithm, merge_slices, floats):
+    rng = random.Random(11)
+    for _ in range(200):
+        processes = random_workload(rng, rng.randint(1, 20), floats)
+        quantum = rng.choice([0.3, 0.5, 1.7] if floats else [1, 2, 3])
+        expected = start_simulation(processes, algorithm, quantum, merge_slices)
+        assert simulate_smp(processes, algorithm, 1, quantum, merge_slices) == expected
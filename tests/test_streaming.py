@@ -0,0 +1,40 @@
+import itertools
+import random
+
+import pytest
+
+from algorithms import SCHEDULERS, start_simulation
+
+
+def arrival_ordered_workload(rng, count):
+    arrivals = sorted(rng.randint(0, 40) for _ in range(count))
+    return [{"id": f"P{i + 1}", "arrival": arrival, "burst": rng.randint(0, 9), "priority": rng.randint(-2, 3)}
+            for i, arrival in enumerate(arrivals)]
+
+
+@pytest.mark.parametrize("merge_slices", [False, True])
+@pytest.mark.parametrize("algorithm", sorted(SCHEDULERS))
+def test_streaming_results_equal_batch_results(algorithm, merge_slices):
+    rng = random.Random(7)
+    time_quantum = 3 if SCHEDULERS[algorithm].time_quantum else None
+    for _ in range(100):
+        processes = arrival_ordered_workload(rng, rng.randint(1, 15))
+        # A one-shot iterator, so nothing can be read twice
+        streamed = start_simulation(iter(processes), algorithm, time_quantum, merge_slices, stream=True)
+        assert list(streamed) == start_simulation(processes, algorithm, time_quantum, merge_slices)
+
+def test_an_endless_stream_yields_results_as_they_are_final():
+    endless = ({"id": f"P{i + 1}", "arrival": 2 * i, "burst": 3, "priority": 0} for i in itertools.count())
+    results = list(itertools.islice(start_simulation(endless, "sjf_preemptive", stream=True), 5))
+    assert [(r["id"], r["start"], r["end"]) for r in results] == [
+        ("P1", 0, 3), ("P2", 3, 6), ("P3", 6, 9), ("P4", 9, 12), ("P5", 12, 15)]
+
+def test_arrivals_out_of_order_are_rejected():
+    processes = [{"id": "P1", "arrival": 5, "burst": 1}, {"id": "P2", "arrival": 1, "burst": 1}]
+    with pytest.raises(ValueError):
+        list(start_simulation(processes, "fcfs", stream=True))
+
+def test_io_bursts_are_rejected():
+    processes = [{"id": "P1", "arrival": 0, "burst": 2, "bursts": [1, 4, 1]}]
+    with pytest.raises(ValueError):
+        list(start_simulation(processes, "fcfs", stream=True))
@@ -0,0 +1,71 @@
+import random
+
+import numpy as np
+import pytest
+
+from algorithms import SCHEDULERS, start_simulation
+from columnar import ProcessTable
+from metrics import cpu_busy_time, process_metrics, to_columnar
+from telemetry import Telemetry
+
+
+def random_workload(rng, count, io=False):
+    processes = []
+    for i in range(count):
+        bursts = [rng.randint(1, 9)]
+        if io and rng.random() < 0.5:
+            bursts += [rng.randint(0, 9), rng.randint(1, 9)]
+        process = {"id": f"P{i + 1}", "arrival": rng.randint(0, 200), "burst": sum(bursts[::2]),
+                   "priority": rng.randint(0, 3)}
+        if len(bursts) > 1:
+            process["bursts"] = bursts
+        processes.append(process)
+    return processes
+
+
+@pytest.mark.parametrize("width", [None, 7])
+@pytest.mark.parametrize("algorithm", sorted(SCHEDULERS))
+def test_window_totals_match_the_schedule(algorithm, width):
+    rng = random.Random(8)
+    time_quantum = 3 if SCHEDULERS[algorithm].time_quantum else None
+    for io in (False, True):
+        processes = random_workload(rng, 60, io)
+        telemetry = Telemetry(width)
+        results = start_simulation(processes, algorithm, time_quantum, telemetry=telemetry)
+        # Recording leaves the schedule alone
+        assert results == start_simulation(processes, algorithm, time_quantum)
+
+        series = telemetry.series()
+        metrics = process_metrics(results, processes)
+        assert series["arrivals"].sum() == series["completions"].sum() == len(processes)
+        assert series["utilization"].sum() * series["width"] == pytest.approx(cpu_busy_time(to_columnar(results)[0]).sum())
+        assert series["ready"].sum() * series["width"] == pytest.approx(metrics["waiting_time"].sum())
+        if width is not None:
+            assert series["width"] == width
+
+def test_multi_cpu_totals_and_longest_runs():
+    processes = ProcessTable.from_dicts(random_workload(random.Random(9), 80))
+    telemetry = Telemetry(width=4)
+    results = start_simulation(processes, "sjf_preemptive", cpus=3, telemetry=telemetry)
+    series = telemetry.series()
+    assert series["utilization"].sum() * 4 * 3 == pytest.approx(cpu_busy_time(results).sum())
+    assert ((series["utilization"] >= 0) & (series["utilization"] <= 1 + 1e-9)).all()
+    # A window's longest run belongs to a process that ran in it
+    for window, pid in enumerate(series["running"].tolist()):
+        start = series["start"][window]
+        ran = (results.pid == pid) & (results.start < start + 4) & (results.end > start)
+        assert (pid == -1) or ran.any()
+
+def test_windows_cover_the_run_from_the_first_arrival():
+    processes = [{"id": "P1", "arrival": 10, "burst": 5, "priority": 0},
+                 {"id": "P2", "arrival": 12, "burst": 5, "priority": 0}]
+    telemetry = Telemetry(width=5)
+    start_simulation(processes, "fcfs", telemetry=telemetry)
+    series = telemetry.series()
+    assert series["start"].tolist() == [10, 15, 20]
+    assert series["utilization"].tolist() == [1.0, 1.0, 0.0]
+    # The last window only holds P2's completion at 20
+    assert series["running"].tolist() == [0, 1, -1]
+    assert series["completions"].tolist() == [0, 1, 1]
+    # P2 waits from 12 to 15
+    assert np.allclose(series["ready"], [3 / 5, 0, 0])
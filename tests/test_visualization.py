@@ -0,0 +1,34 @@
+from unittest import mock
+
+import visualization
+from algorithms import start_simulation
+from visualization import calculate_process_metrics
+
+# P2 arrives at 1 and queues behind P1 until 4
+PROCESSES = [{"id": "P1", "arrival": 0, "burst": 4, "priority": 0},
+             {"id": "P2", "arrival": 1, "burst": 2, "priority": 0}]
+
+
+def test_waiting_before_the_first_run_counts_with_the_workload():
+    results = start_simulation(PROCESSES, "fcfs")
+    process_data = calculate_process_metrics(results, PROCESSES)
+    assert process_data["P2"]["arrival_time"] == 1
+    assert process_data["P2"]["waiting_time"] == 3
+    assert process_data["P2"]["response_time"] == 3
+
+def test_results_window_uses_the_workload(monkeypatch):
+    # No display here: replace the widgets and keep what the window would show
+    monkeypatch.setattr(visualization, "tk", mock.MagicMock())
+    monkeypatch.setattr(visualization, "ttk", mock.MagicMock())
+    monkeypatch.setattr(visualization, "create_gantt_chart_in_frame", mock.MagicMock())
+    table = mock.MagicMock()
+    monkeypatch.setattr(visualization, "create_metrics_table_in_frame", table)
+    monkeypatch.setattr(visualization, "results_window", None)
+    results = start_simulation(PROCESSES, "fcfs")
+
+    visualization.create_results_window(results, PROCESSES)
+    assert visualization.results_window.process_data["P2"]["waiting_time"] == 3
+    assert table.call_args.args[3] is PROCESSES
+
+    visualization.update_results_window(results, PROCESSES)
+    assert visualization.results_window.process_data["P2"]["response_time"] == 3
@@ -1,30 +1,41 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import numpy as np
 from tkinter import ttk
 import tkinter as tk
+from algorithms import algorithm_label
+from gantt import (GANTT_MAX_LABELS, GANTT_OVERHEAD_COLOR, GanttViewer, draw_segments, lane_position, split_lanes,
+                   style_gantt_axes, time_label, time_origin)
+from metrics import device_utilization, overhead_fraction, process_metrics, summary_metrics, to_columnar
+from quantiles import PERCENTILES
+from state_view import ProcessStateView
+from table_view import VirtualTable
 
 # Global variable to track the results window
 results_window = None
 
-def update_visualization(results, figure, ax, canvas):
-    """Update the visualization with the simulation results"""
+def update_visualization(results, figure, ax, canvas, processes=None):
+    """Update the visualization with the simulation results of the workload ``processes``"""
     global results_window
     
     # Create or focus the results window
     if results_window is None or not results_window.winfo_exists():
-        create_results_window(results)
+        create_results_window(results, processes)
     else:
         results_window.lift()  # Bring window to front
-        update_results_window(results)
+        update_results_window(results, processes)
     
     # Clear the original figure (we won't use it since we're displaying in the new tab)
     ax.clear()
     ax.set_title("Simulation running in results window")
     canvas.draw()
 
-def create_results_window(results):
-    """Create a new window to display all the simulation results"""
+def create_results_window(results, processes=None):
+    """
+    Create a new window to display all the simulation results
+
+    ``processes``, the simulated workload, supplies the real arrival times;
+    without it each process is taken to arrive when it first runs, which
+    hides the time it waited before that.
+    """
     global results_window
     
     results_window = tk.Toplevel()
@@ -50,8 +61,8 @@ def create_results_window(results):
     create_gantt_chart_in_frame(results, gantt_frame)
     
     # Calculate metrics and create the table
-    process_data = calculate_process_metrics(results)
-    create_metrics_table_in_frame(process_data, metrics_frame)
+    process_data = calculate_process_metrics(results, processes)
+    create_metrics_table_in_frame(process_data, metrics_frame, results, processes)
     
     # Create button to show process states
     state_button = ttk.Button(results_tab, text="Show Process States", 
@@ -60,13 +71,14 @@ def create_results_window(results):
     
     # Store references in the window for future updates
     results_window.results = results
+    results_window.processes = processes
     results_window.process_data = process_data
     results_window.gantt_frame = gantt_frame
     results_window.metrics_frame = metrics_frame
     results_window.state_button = state_button
 
-def update_results_window(results):
-    """Update the existing results window with new simulation results"""
+def update_results_window(results, processes=None):
+    """Update the existing results window with new simulation results of the workload ``processes``"""
     if results_window and results_window.winfo_exists():
         # Clear existing frames
         for widget in results_window.gantt_frame.winfo_children():
@@ -75,16 +87,17 @@ def update_results_window(results):
             widget.destroy()
         
         # Calculate new metrics
-        process_data = calculate_process_metrics(results)
+        process_data = calculate_process_metrics(results, processes)
         
         # Update Gantt chart
         create_gantt_chart_in_frame(results, results_window.gantt_frame)
         
         # Update metrics table
-        create_metrics_table_in_frame(process_data, results_window.metrics_frame)
+        create_metrics_table_in_frame(process_data, results_window.metrics_frame, results, processes)
         
         # Update stored references
         results_window.results = results
+        results_window.processes = processes
         results_window.process_data = process_data
         
         # Reset the state button functionality
@@ -92,211 +105,207 @@ def update_results_window(results):
             command=lambda: show_process_states_in_frame(results, process_data, results_window.state_button.master)
         )
 
-def calculate_process_metrics(results):
-    """Calculate process metrics including completion time, turnaround time, and waiting time"""
-    # Get unique process IDs and sort them
-    process_ids = sorted(set(result["id"] for result in results), key=lambda x: int(x[1:]))
-    
+def format_time(value):
+    """Format a time for display: integers exactly (nanosecond timestamps included), floats to six significant digits"""
+    if isinstance(value, int):
+        return str(value)
+    # Large float times keep their whole units rather than switching to exponent notation
+    return f"{value:.1f}" if abs(value) >= 1e5 else f"{value:.6g}"
+
+def _process_sort_key(pid):
+    """Sort P1, P2, ..., P10 numerically; IDs from imported traces that do not follow that pattern go last, by name"""
+    return (0, int(pid[1:]), "") if pid[1:].isdigit() else (1, 0, pid)
+
+def calculate_process_metrics(results, processes=None):
+    """
+    Calculate process metrics including completion time, turnaround time, waiting time and
+    response time, plus the number of context switches into each process, the scheduling
+    overhead spent on its behalf and the time it was blocked on I/O
+
+    Args:
+        results: Simulation results, as result dictionaries or a ScheduleResult
+        processes: Optional workload (process dictionaries or a ProcessTable) used for the real
+            arrival times; without it each process is assumed to arrive at its first start
+    """
+    # The numbers come from the vectorized metrics path
+    results, processes = to_columnar(results, processes)
+    metrics = process_metrics(results, processes)
+
     # Create a dictionary to track the metrics of each process
     process_data = {}
-    
-    # First, initialize process data
-    for pid in process_ids:
-        process_data[pid] = {
-            "arrival_time": float('inf'),
-            "burst_time": 0,
-            "completion_time": 0,
-            "segments": []
-        }
-    
-    # Now populate the data from results
-    for result in results:
-        pid = result["id"]
-        start = result["start"]
-        end = result["end"]
-        
-        # Track the earliest arrival time
-        process_data[pid]["arrival_time"] = min(process_data[pid]["arrival_time"], start)
-        
-        # Add burst time
-        segment_burst = end - start
-        process_data[pid]["burst_time"] += segment_burst
-        
-        # Update completion time if this is the latest segment
-        process_data[pid]["completion_time"] = max(process_data[pid]["completion_time"], end)
-        
-        # Add segment information for the Gantt chart
-        process_data[pid]["segments"].append({"start": start, "end": end})
-    
-    # Calculate turnaround time and waiting time
-    for pid, data in process_data.items():
-        data["turnaround_time"] = data["completion_time"] - data["arrival_time"]
-        data["waiting_time"] = data["turnaround_time"] - data["burst_time"]
-    
+    columns = ("arrival_time", "burst_time", "completion_time", "turnaround_time", "waiting_time", "response_time",
+               "context_switches", "overhead_time", "io_time", "io_wait_time")
+    values = [metrics[column].tolist() for column in columns]
+    for pid, row in sorted(zip(metrics["id"].tolist(), zip(*values)), key=lambda x: _process_sort_key(x[0])):
+        process_data[pid] = dict(zip(columns, row))
+
+    # Segments stay in the result arrays, which the Gantt chart and the state view read directly
     return process_data
 
 def create_gantt_chart_in_frame(results, frame):
     """Create a Gantt chart in the specified frame"""
-    # Get the algorithm name for display
-    algorithm_names = {
-        "fcfs": "First Come First Serve",
-        "sjf_preemptive": "Shortest Job First (Preemptive)",
-        "sjf_non_preemptive": "Shortest Job First (Non-Preemptive)",
-        "priority_preemptive": "Priority Scheduling (Preemptive)",
-        "priority_non_preemptive": "Priority Scheduling (Non-Preemptive)",
-        "round_robin": "Round Robin"
-    }
-    
+    # Colormap per algorithm; display names come from the algorithm registry
     algorithm_colors = {
         "fcfs": 'Blues',
         "sjf_preemptive": 'Greens',
         "sjf_non_preemptive": 'Oranges',
         "priority_preemptive": 'Purples',
         "priority_non_preemptive": 'Reds',
-        "round_robin": 'YlGnBu'
+        "round_robin": 'YlGnBu',
+        "mlfq": 'YlOrBr',
+        "cfs": 'PuBuGn'
     }
     
+    # matplotlib is only loaded once a chart is actually drawn
+    from matplotlib import colormaps
+
     # Determine the algorithm used
-    algorithm = results[0]['algorithm'] if 'algorithm' in results[0] else "fcfs"
-    colormap = plt.cm.get_cmap(algorithm_colors.get(algorithm, 'viridis'))
-    
-    # Calculate metrics
-    process_data = calculate_process_metrics(results)
+    results, _ = to_columnar(results)
+    algorithm = results.algorithm
+    colormap = colormaps[algorithm_colors.get(algorithm, 'viridis')]
     
-    # Create a new figure with appropriate size
-    figure = plt.Figure(figsize=(10, 4), dpi=100)
-    ax = figure.add_subplot(111)
-    
-    # Create the Gantt chart
-    create_gantt_chart(results, process_data, ax, colormap)
-    
-    # Set plot title
-    ax.set_title(f'{algorithm_names.get(algorithm, algorithm)} Scheduling', pad=20)
-    
-    # Create canvas for the figure and add it to the frame
-    canvas = FigureCanvasTkAgg(figure, frame)
-    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-    canvas.draw()
+    # Create the zoomable Gantt chart (one lane per CPU for multi-CPU schedules)
+    GanttViewer(frame, results, colormap, title=f'{algorithm_label(algorithm)} Scheduling')
     
     # Add a label for the algorithm
-    ttk.Label(frame, text=f"Algorithm: {algorithm_names.get(algorithm, algorithm)}", 
+    cpus = f" on {results.cpus} CPUs" if results.cpu is not None else ""
+    ttk.Label(frame, text=f"Algorithm: {algorithm_label(algorithm)}{cpus}", 
               font=("Arial", 12, "bold")).pack(pady=(5, 0))
 
-def create_metrics_table_in_frame(process_data, frame):
-    """Create a table showing process metrics in the specified frame"""
-    # Create the table
-    columns = ("Process ID", "Arrival Time", "Burst Time", "Completion Time", "Turnaround Time", "Waiting Time")
-    metrics_table = ttk.Treeview(frame, columns=columns, show="headings")
-    
-    # Set column headings
-    for col in columns:
-        metrics_table.heading(col, text=col)
-        metrics_table.column(col, width=100, anchor=tk.CENTER)
-    
-    # Add data to the table
-    for pid, data in sorted(process_data.items(), key=lambda x: int(x[0][1:])):
-        metrics_table.insert("", "end", values=(
-            pid,
-            f"{data['arrival_time']:.1f}",
-            f"{data['burst_time']:.1f}",
-            f"{data['completion_time']:.1f}",
-            f"{data['turnaround_time']:.1f}",
-            f"{data['waiting_time']:.1f}"
-        ))
-    
-    # Add a scrollbar
-    scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=metrics_table.yview)
-    metrics_table.configure(yscroll=scrollbar.set)
-    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    metrics_table.pack(fill=tk.BOTH, expand=True)
+def create_metrics_table_in_frame(process_data, frame, results=None, processes=None):
+    """
+    Create a table showing process metrics in the specified frame
+
+    With the ``results`` (and optionally the workload ``processes``), the
+    summary is titled with the algorithm and adds the waiting and response
+    time percentiles, throughput, CPU utilization (per CPU for a multi-CPU
+    schedule) and the fairness index, as summary_metrics reports them.
+    """
+    # Column arrays for the virtualized table; only the visible rows are ever formatted
+    columns = ("Process ID", "Arrival Time", "Burst Time", "Completion Time", "Turnaround Time", "Waiting Time",
+               "Response Time", "Switches")
+    keys = ("arrival_time", "burst_time", "completion_time", "turnaround_time", "waiting_time", "response_time",
+            "context_switches")
+    rows = process_data.values()
+    io_time = sum(row.get("io_time", 0) for row in rows)
+    if io_time:
+        # Workloads with I/O bursts also show the time each process was blocked
+        columns += ("I/O Time",)
+        keys += ("io_time",)
+    data = {"Process ID": list(process_data)}
+    for column, key in zip(columns[1:], keys):
+        # Integer times stay int64 so nanosecond timestamps are shown exactly
+        data[column] = np.array([row.get(key, 0) for row in rows])
+
+    # Create the table; process_data is already in process ID order, so IDs sort by row number
+    formats = dict.fromkeys(columns[1:], format_time)
+    formats["Switches"] = "{:.0f}"
+    metrics_table = VirtualTable(frame, columns, formats=formats)
+    metrics_table.set_data(data, sort_keys={"Process ID": np.arange(len(process_data))})
+    metrics_table.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    metrics_table.tree.pack(fill=tk.BOTH, expand=True)
     
     # Calculate summary statistics
-    avg_turnaround = sum(data["turnaround_time"] for data in process_data.values()) / len(process_data)
-    avg_waiting = sum(data["waiting_time"] for data in process_data.values()) / len(process_data)
+    avg_turnaround = data["Turnaround Time"].mean() if len(process_data) else 0.0
+    avg_waiting = data["Waiting Time"].mean() if len(process_data) else 0.0
+    switches = sum(row.get("context_switches", 0) for row in rows)
+    overhead = sum(row.get("overhead_time", 0) for row in rows)
+    busy = data["Burst Time"].sum()
     
     # Create a separate frame for summary statistics to ensure visibility
     summary_frame = ttk.Frame(frame)
     summary_frame.pack(fill=tk.X, pady=10, padx=5, side=tk.BOTTOM)
     
     # Make the summary statistics more visible with a border and padding
-    summary_label_frame = ttk.LabelFrame(summary_frame, text="Summary Statistics")
+    title = "Summary Statistics"
+    if results is not None:
+        results, processes = to_columnar(results, processes)
+        title += f" - {algorithm_label(results.algorithm)}"
+    summary_label_frame = ttk.LabelFrame(summary_frame, text=title)
     summary_label_frame.pack(fill=tk.X, padx=5, pady=5)
     
     # Add the statistics with improved visibility
-    ttk.Label(summary_label_frame, text=f"Average Turnaround Time: {avg_turnaround:.2f}", 
+    ttk.Label(summary_label_frame, text=f"Average Turnaround Time: {format_time(float(avg_turnaround))}", 
               font=("Arial", 12, "bold")).pack(side=tk.TOP, padx=10, pady=5, anchor=tk.W)
-    ttk.Label(summary_label_frame, text=f"Average Waiting Time: {avg_waiting:.2f}", 
+    ttk.Label(summary_label_frame, text=f"Average Waiting Time: {format_time(float(avg_waiting))}", 
               font=("Arial", 12, "bold")).pack(side=tk.TOP, padx=10, pady=5, anchor=tk.W)
-
-def create_gantt_chart(results, process_data, ax, colormap):
-    """Create a single-row Gantt chart with process blocks"""
-    # Collect all execution segments from all processes
-    all_segments = []
-    for pid, data in process_data.items():
-        for segment in data["segments"]:
-            all_segments.append({
-                "pid": pid,
-                "start": segment["start"],
-                "end": segment["end"]
-            })
-    
-    # Sort segments by start time
-    all_segments.sort(key=lambda x: x["start"])
     
-    # Calculate the time range for the chart
-    min_time = min(seg["start"] for seg in all_segments)
-    max_time = max(seg["end"] for seg in all_segments)
+    ttk.Label(summary_label_frame, text=f"Context Switches: {switches}", 
+              font=("Arial", 12, "bold")).pack(side=tk.TOP, padx=10, pady=5, anchor=tk.W)
+    if overhead:
+        ttk.Label(summary_label_frame, text=f"Scheduling Overhead: {format_time(overhead)} ({overhead_fraction(overhead, busy):.1%} of CPU time)", 
+                  font=("Arial", 12, "bold")).pack(side=tk.TOP, padx=10, pady=5, anchor=tk.W)
+    if io_time:
+        io_wait = sum(row.get("io_wait_time", 0) for row in rows)
+        ttk.Label(summary_label_frame, text=f"Average I/O Time: {format_time(io_time / len(process_data))} (queued {format_time(io_wait / len(process_data))})", 
+                  font=("Arial", 12, "bold")).pack(side=tk.TOP, padx=10, pady=5, anchor=tk.W)
+        if results is not None:
+            utilization = device_utilization(results, processes)
+            text = "  ".join(f"Device {device}: {value:.0%}" for device, value in enumerate(utilization.tolist()))
+            ttk.Label(summary_label_frame, text=f"Device Utilization: {text}", wraplength=800, 
+                      justify=tk.LEFT).pack(side=tk.TOP, padx=10, pady=(0, 5), anchor=tk.W)
+    
+    if results is None:
+        return
+
+    # Tail latencies, throughput and fairness, the same figures the command line exports
+    summary = summary_metrics(results, processes)
+    names = " / ".join(f"p{percentile:g}" for percentile in PERCENTILES)
+    for key, label in (("waiting_time", "Waiting Time"), ("response_time", "Response Time")):
+        values = " / ".join(format_time(summary[f"{key}_p{percentile:g}"]) for percentile in PERCENTILES)
+        ttk.Label(summary_label_frame, text=f"{label} {names}: {values}", 
+                  font=("Arial", 12, "bold")).pack(side=tk.TOP, padx=10, pady=5, anchor=tk.W)
+    ttk.Label(summary_label_frame, text=f"Throughput: {summary['throughput']:.4g} per time unit "
+                                        f"(peak {summary['peak_throughput']:.4g} over windows of {format_time(summary['throughput_window'])})", 
+              font=("Arial", 12, "bold")).pack(side=tk.TOP, padx=10, pady=5, anchor=tk.W)
+    ttk.Label(summary_label_frame, text=f"Jain Fairness Index: {summary['jain_fairness_index']:.3f}", 
+              font=("Arial", 12, "bold")).pack(side=tk.TOP, padx=10, pady=5, anchor=tk.W)
+    ttk.Label(summary_label_frame, text=f"CPU Utilization: {summary['cpu_utilization']:.1%}", 
+              font=("Arial", 12, "bold")).pack(side=tk.TOP, padx=10, pady=5, anchor=tk.W)
+
+    # Per-CPU utilization for multi-CPU schedules
+    if results.cpu is not None:
+        text = "  ".join(f"CPU {cpu}: {value:.0%}" for cpu, value in enumerate(summary["per_cpu_utilization"]))
+        ttk.Label(summary_label_frame, text=text, wraplength=800, 
+                  justify=tk.LEFT).pack(side=tk.TOP, padx=10, pady=(0, 5), anchor=tk.W)
+
+def create_gantt_chart(results, ax, colormap):
+    """
+    Create a Gantt chart with process blocks on a static figure, one row per CPU
+
+    Drawing is batched and level-of-detail aggregated (see gantt.draw_segments),
+    so its cost stays bounded no matter how many segments the schedule has.
+    The interactive chart in the results window is a gantt.GanttViewer.
+    """
+    results, _ = to_columnar(results)
+    if not len(results):
+        return
+
+    # Calculate the time range for the chart, as offsets from the origin so nanosecond timestamps stay exact
+    origin = time_origin(results.start)
+    min_time = (results.start.min() - origin).item()
+    max_time = (results.end.max() - origin).item()
     time_range = max_time - min_time
-    
-    # Get unique process IDs and sort them
-    process_ids = sorted(process_data.keys(), key=lambda x: int(x[1:]))
-    num_processes = len(process_ids)
-    
-    # Draw each segment as a box on a single row
-    y_pos = 0  # Single row at y=0
-    height = 0.8  # Height of each block
-    
-    for segment in all_segments:
-        pid = segment["pid"]
-        start = segment["start"]
-        end = segment["end"]
-        duration = end - start
-        
-        # Calculate process index for color mapping
-        proc_idx = process_ids.index(pid)
-        color = colormap(0.3 + 0.7 * (proc_idx / max(1, num_processes - 1)))
-        
-        # Create a rectangle for this process segment
-        rect = patches.Rectangle((start, y_pos - height/2), duration, height,
-                                linewidth=1, edgecolor='black', facecolor=color, alpha=0.7)
-        ax.add_patch(rect)
-        
-        # Add process ID label with consistent font size
-        ax.text(start + duration/2, y_pos, pid, 
-                ha='center', va='center', fontsize=9, 
-                fontweight='bold', color='black')
-    
-    # Set plot limits and labels
-    ax.set_xlim(min_time - 0.5, max_time + 0.5)
-    ax.set_ylim(-1, 1)
-    
-    # Remove y-axis ticks and labels
-    ax.set_yticks([])
-    ax.set_ylabel('')
-    
-    # Add grid lines and time labels
-    ax.set_xticks(range(int(min_time), int(max_time) + 1))
-    ax.grid(axis='x', linestyle='--', alpha=0.7)
-    ax.set_xlabel('Time')
-    
-    # Draw time markers at the bottom
-    for t in range(int(min_time), int(max_time) + 1):
-        ax.axvline(x=t, color='black', linestyle='--', alpha=0.3)
-    
-    # Enable scrolling by adjusting figure size based on time range
-    figure_width = max(6, min(time_range * 0.8, 20))  # Constrain between 6 and 20 inches
+
+    # Size the figure by the number of segments rather than the time range, whose units are arbitrary
+    figure_width = max(6, min(len(results) * 0.8, 20))  # Constrain between 6 and 20 inches
     figure = ax.figure
     figure.set_size_inches(figure_width, 4)
+    columns = max(1, int(ax.get_position().width * figure_width * figure.dpi))
+
+    lanes = split_lanes(results, origin=origin)
+    for lane, (pid, start, end) in enumerate(lanes):
+        draw_segments(ax, results.ids, pid, start, end, min_time, max_time, columns, colormap,
+                      y_pos=lane_position(lane, len(lanes)), max_labels=max(1, GANTT_MAX_LABELS // len(lanes)))
+    # Scheduling overhead in gray, on top of the lanes it delayed
+    for lane, (pid, start, end) in enumerate(split_lanes(results, overhead=True, origin=origin)):
+        draw_segments(ax, results.ids, pid, start, end, min_time, max_time, columns, colormap,
+                      y_pos=lane_position(lane, len(lanes)), height=0.4, facecolor=GANTT_OVERHEAD_COLOR)
+
+    # Set plot limits and labels
+    margin = time_range * 0.01 or 0.5
+    ax.set_xlim(min_time - margin, max_time + margin)
+    style_gantt_axes(ax, len(lanes), integer=np.issubdtype(results.start.dtype, np.integer), origin=origin)
 
 def show_process_states_in_frame(results, process_data, parent_frame):
     """Show the process state transitions within the results window"""
@@ -344,174 +353,75 @@ def show_process_states_in_frame(results, process_data, parent_frame):
             button_found = True
             break
     
-    # Create a canvas with scrollbars for the state transitions
-    canvas_frame = ttk.Frame(states_frame)
-    canvas_frame.pack(fill=tk.BOTH, expand=True)
-    
-    # Add horizontal and vertical scrollbars
-    h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL)
-    v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL)
-    h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-    v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    
-    # Create canvas
-    canvas = tk.Canvas(canvas_frame, xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set, bg="white")
-    canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    
-    # Configure scrollbars
-    h_scrollbar.config(command=canvas.xview)
-    v_scrollbar.config(command=canvas.yview)
-    
-    # Create a frame to contain all content
-    content_frame = ttk.Frame(canvas)
-    canvas_window = canvas.create_window((0, 0), window=content_frame, anchor="nw")
-    
-    # Sort processes by ID
-    process_ids = sorted(process_data.keys(), key=lambda x: int(x[1:]))
-    
-    # Define state colors
-    state_colors = {
-        "New": "#add8e6",      # Light blue
-        "Ready": "#90ee90",    # Light green
-        "Running": "#ffcc66",  # Light orange
-        "Waiting": "#ffb6c1",  # Light pink
-        "Terminated": "#d3d3d3"  # Light gray
-    }
-    
-    # Define state transition widths
-    state_width = 100
-    transition_width = 50
-    row_height = 60
-    padding = 20
-    
-    # Process the timeline data
-    timeline = {}
-    max_time = 0
-    
-    # Extract arrival times
-    for pid in process_ids:
-        arrival_time = process_data[pid]["arrival_time"]
-        max_time = max(max_time, process_data[pid]["completion_time"])
-        
-        # Initialize timeline for this process
-        if pid not in timeline:
-            timeline[pid] = []
-    
-    # Extract running segments from results
-    for result in results:
-        pid = result["id"]
-        start_time = result["start"]
-        end_time = result["end"]
-        
-        # Add state transitions for running segments
-        timeline[pid].append((start_time, "Ready", "Running"))
-        timeline[pid].append((end_time, "Running", "Ready"))
-    
-    # Sort all timeline events by time
-    for pid in timeline:
-        timeline[pid].sort(key=lambda x: x[0])
-    
-    # Calculate canvas size based on content
-    canvas_width = max(800, int(max_time * 100) + 400)  # Add extra space for state boxes
-    canvas_height = len(process_ids) * (row_height + padding) + 100
-    
-    # Make sure the canvas is big enough
-    canvas.config(scrollregion=(0, 0, canvas_width, canvas_height))
-    
-    # Draw time scale at the top
-    for t in range(int(max_time) + 2):
-        x_pos = 200 + t * 100
-        canvas.create_line(x_pos, 20, x_pos, canvas_height - 20, dash=(4, 4), fill="gray")
-        canvas.create_text(x_pos, 10, text=f"t={t}", anchor="n")
-    
-    # Draw process state transitions for each process
-    for i, pid in enumerate(process_ids):
-        y_pos = 50 + i * (row_height + padding)
-        
-        # Draw process ID
-        canvas.create_text(20, y_pos + row_height/2, text=pid, font=("Arial", 12, "bold"), anchor="w")
-        
-        # Get process arrival and completion times
-        arrival_time = process_data[pid]["arrival_time"]
-        completion_time = process_data[pid]["completion_time"]
-        
-        # Draw initial "New" state
-        x_pos = 100
-        canvas.create_rectangle(x_pos, y_pos, x_pos + state_width, y_pos + row_height, 
-                            fill=state_colors["New"], outline="black")
-        canvas.create_text(x_pos + state_width/2, y_pos + row_height/2, text="New", font=("Arial", 10))
-        
-        # Draw arrow to "Ready" state
-        x_pos += state_width
-        canvas.create_line(x_pos, y_pos + row_height/2, x_pos + transition_width, y_pos + row_height/2, 
-                       arrow=tk.LAST, width=2)
-        canvas.create_text(x_pos + transition_width/2, y_pos + row_height/2 - 15, text=f"t={arrival_time}", font=("Arial", 8))
-        
-        # X position now represents the timeline
-        x_pos = 200 + arrival_time * 100
-        
-        # Draw initial "Ready" state
-        ready_box_x = x_pos
-        canvas.create_rectangle(x_pos, y_pos, x_pos + state_width, y_pos + row_height, 
-                            fill=state_colors["Ready"], outline="black")
-        canvas.create_text(x_pos + state_width/2, y_pos + row_height/2, text="Ready", font=("Arial", 10))
-        
-        # Draw the timeline events for this process
-        current_x = x_pos + state_width
-        current_state = "Ready"
-        
-        # Skip any transitions happening before arrival time
-        proc_timeline = [t for t in timeline[pid] if t[0] >= arrival_time]
-        
-        for event_time, from_state, to_state in proc_timeline:
-            # Position on the timeline
-            time_x = 200 + event_time * 100
-            
-            # Draw arrow from current position to next event
-            canvas.create_line(current_x, y_pos + row_height/2, time_x, y_pos + row_height/2, 
-                           arrow=tk.LAST, width=2)
-            canvas.create_text((current_x + time_x)/2, y_pos + row_height/2 - 15, 
-                            text=f"t={event_time}", font=("Arial", 8))
-            
-            # Draw state box
-            canvas.create_rectangle(time_x, y_pos, time_x + state_width, y_pos + row_height, 
-                                fill=state_colors[to_state], outline="black")
-            canvas.create_text(time_x + state_width/2, y_pos + row_height/2, text=to_state, font=("Arial", 10))
-            
-            # Update position for next segment
-            current_x = time_x + state_width
-            current_state = to_state
-        
-        # Draw final transition to "Terminated" state
-        termination_x = 200 + completion_time * 100
-        canvas.create_line(current_x, y_pos + row_height/2, termination_x, y_pos + row_height/2, 
-                       arrow=tk.LAST, width=2)
-        canvas.create_text((current_x + termination_x)/2, y_pos + row_height/2 - 15, 
-                        text=f"t={completion_time}", font=("Arial", 8))
-        
-        # Draw "Terminated" state
-        canvas.create_rectangle(termination_x, y_pos, termination_x + state_width, y_pos + row_height, 
-                            fill=state_colors["Terminated"], outline="black")
-        canvas.create_text(termination_x + state_width/2, y_pos + row_height/2, text="Terminated", font=("Arial", 10))
-    
-    # Update the canvas to adjust to the content frame's size
-    def _configure_canvas(event):
-        # Update the scroll region to encompass the inner frame
-        canvas.configure(scrollregion=canvas.bbox("all"))
-    
-    content_frame.bind("<Configure>", _configure_canvas)
-    
-    # Ensure the canvas takes up the full frame space
-    canvas_frame.update_idletasks()
+    # Virtualized state timeline: only the rows and time range in view are drawn
+    ProcessStateView(states_frame, results, process_data)
 
-def show_process_states(results, process_data):
+def show_telemetry_in_frame(series, ids, parent_frame):
+    """
+    Plot a simulation's telemetry (see telemetry.Telemetry.series) in a frame
+
+    Four panels share the time axis: the average ready-queue depth, the
+    CPU utilization, the arrivals and completions and the process that ran
+    longest, one bar per telemetry window.
+
+    Args:
+        series (dict): Telemetry.series() of the run
+        ids: Process IDs by pid index, to name the running processes
+        parent_frame: Tk container to pack the chart into
+    """
+    # matplotlib is only loaded once a chart is actually drawn
+    from matplotlib import colormaps
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Patch
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    start, width = series["start"], series["width"]
+    # Windows are drawn as offsets from the first one, which float64 keeps exact for nanosecond timestamps
+    origin = time_origin(start)
+    start = start - origin
+    figure = Figure(figsize=(10, 7), dpi=100)
+    axes = figure.subplots(4, 1, sharex=True, gridspec_kw={"height_ratios": [3, 2, 3, 1]})
+    figure.suptitle(f"Telemetry ({len(start):,} windows of {format_time(width)} time units)")
+
+    axes[0].bar(start, series["ready"], width=width, align="edge", color="#3498DB")
+    axes[0].set_ylabel("Ready queue")
+
+    axes[1].bar(start, series["utilization"] * 100, width=width, align="edge", color="#2ECC71")
+    axes[1].set_ylim(0, 100)
+    axes[1].set_ylabel("CPU %")
+
+    # Arrivals above the axis, completions below it
+    axes[2].bar(start, series["arrivals"], width=width, align="edge", color="#F39C12", label="Arrivals")
+    axes[2].bar(start, -series["completions"], width=width, align="edge", color="#8E44AD", label="Completions")
+    axes[2].axhline(0, color="black", linewidth=0.5)
+    axes[2].set_ylabel("Processes")
+    axes[2].legend(loc="upper right", fontsize=8)
+
+    # Running process strip: one color per process, the windows where the CPUs idled left blank
+    running = series["running"]
+    busy = running >= 0
+    colormap = colormaps["tab20"]
+    axes[3].bar(start[busy], 1, width=width, align="edge", color=colormap(running[busy] % colormap.N))
+    shown = np.unique(running[busy])
+    if 0 < len(shown) <= 10:  # A legend only while it stays readable
+        handles = [Patch(color=colormap(pid % colormap.N), label=str(ids[pid])) for pid in shown]
+        axes[3].legend(handles=handles, loc="upper center", bbox_to_anchor=(0.5, -0.6), ncol=len(shown), fontsize=8)
+    axes[3].set_yticks([])
+    axes[3].set_ylabel("Running")
+    axes[3].set_xlabel(time_label(origin))
+    if len(start):
+        axes[3].set_xlim(start[0], start[-1] + width)
+    figure.tight_layout()
+
+    canvas = FigureCanvasTkAgg(figure, parent_frame)
+    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    canvas.draw()
+
+def show_process_states(results, process_data, processes=None):
     """Handler for the Show Process States button (for backward compatibility)"""
     if results_window and results_window.winfo_exists():
         # Use the new implementation that shows states in the same window
         show_process_states_in_frame(results, process_data, results_window.state_button.master)
     else:
         # Fallback to the original implementation if the results window doesn't exist
-        create_results_window(results)
-
-# Import for FigureCanvasTkAgg - needed here to avoid circular imports
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        create_results_window(results, processes)
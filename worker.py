@@ -0,0 +1,96 @@
+import queue
+import threading
+
+from algorithms import start_simulation
+
+
+class SimulationCancelled(Exception):
+    """Raised inside the worker thread when a running simulation is cancelled"""
+
+
+class SimulationWorker:
+    """
+    Run a simulation on a background thread and report back through a queue
+
+    The GUI polls ``messages`` from its event loop (``after``), so neither
+    the scheduler nor the metrics calculation ever blocks Tk. Messages are
+    tuples:
+
+    - ``("progress", events, fraction)`` while the scheduler runs
+    - ``("stage", text)`` when the work moves on to a new step
+    - ``("done", results, extra)`` with the results and the return value
+      of ``after`` (None without it)
+    - ``("cancelled",)`` or ``("error", exception)`` when it ends otherwise
+
+    Args:
+        processes: Process dictionaries or a ProcessTable
+        algorithm (str): Any algorithm accepted by start_simulation
+        time_quantum (int, optional): Time quantum for Round Robin
+        merge_slices (bool): Merge back-to-back Round Robin slices
+        after (callable, optional): Called with the results on the worker
+            thread, e.g. to compute metrics
+        cache (ResultCache, optional): Reuse and store schedules through this cache
+        cpus (int): Number of simulated CPUs
+        run_queues (str): "global" or "per_cpu" ready queues when ``cpus`` > 1
+        overhead (Overhead, optional): Context-switch, cache-warmup and dispatch costs
+        telemetry (Telemetry, optional): Record the run's time series; cached
+            schedules carry none, so such a run always simulates
+    """
+
+    def __init__(self, processes, algorithm="fcfs", time_quantum=None, merge_slices=False, after=None,
+                 cache=None, cpus=1, run_queues="global", overhead=None, telemetry=None):
+        self.processes = processes
+        self.algorithm = algorithm
+        self.time_quantum = time_quantum
+        self.merge_slices = merge_slices
+        self.cpus = cpus
+        self.run_queues = run_queues
+        self.overhead = overhead
+        self.telemetry = telemetry
+        self.after = after
+        self.cache = cache
+        self.messages = queue.Queue()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start the simulation thread"""
+        self._thread.start()
+
+    def cancel(self):
+        """Ask the simulation to stop at its next progress report"""
+        self._cancelled.set()
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def _check_cancelled(self):
+        if self._cancelled.is_set():
+            raise SimulationCancelled()
+
+    def _progress(self, events, fraction):
+        self._check_cancelled()
+        self.messages.put(("progress", events, fraction))
+
+    def _run(self):
+        try:
+            options = {}
+            if self.cache is None or self.telemetry is not None:
+                simulate = start_simulation
+                options["telemetry"] = self.telemetry
+            else:
+                simulate = self.cache.simulate
+            results = simulate(self.processes, self.algorithm, self.time_quantum, self.merge_slices,
+                               progress=self._progress, cpus=self.cpus, run_queues=self.run_queues,
+                               overhead=self.overhead, **options)
+            extra = None
+            if self.after is not None:
+                self._check_cancelled()
+                self.messages.put(("stage", "Calculating metrics..."))
+                extra = self.after(results)
+            self._check_cancelled()
+            self.messages.put(("done", results, extra))
+        except SimulationCancelled:
+            self.messages.put(("cancelled",))
+        except Exception as error:
+            self.messages.put(("error", error))